@@ -0,0 +1,153 @@
+"""
+Time each phase of xenoform's build pipeline for synthetic modules containing a given number of functions: registering
+the functions (i.e. importing the python module), generating the source, a cold build, checking an up-to-date module,
+loading an up-to-date module in a new process, and rebuilding after editing one function. Cold builds start from an
+empty module directory, but use any cached precompiled headers.
+
+python benchmarks/build_pipeline.py --sizes 1 10 100 --json before.json
+python benchmarks/build_pipeline.py --sizes 1 10 100 --compare before.json
+"""
+
+import argparse
+import importlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from collections.abc import Callable, Sequence
+from dataclasses import replace
+from pathlib import Path
+from time import perf_counter
+
+from results import Results, compare, load, save
+
+from xenoform.compile import _check_build_fetch_module_impl, _installed_checksum, _module_registry, module_root_dir
+from xenoform.cppmodule import ModuleSpec
+
+# loads the module in a new process, so that nothing is cached
+_WARM_START = """
+import json, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {path!r})
+import {module_name}
+import xenoform
+registered = time.perf_counter()
+xenoform.warmup()
+print(json.dumps({{"import_s": registered - start, "warm_start_s": time.perf_counter() - registered}}))
+"""
+
+
+def generate(path: Path, module_name: str, functions: int) -> None:
+    """Write a python module containing the given number of compiled functions"""
+    code = "from xenoform import compile\n"
+    for i in range(functions):
+        code += (
+            f"\n\n@compile()\ndef f{i}(x: int, y: float) -> float:  # type: ignore[empty-body]\n"
+            f'    "return x * y + {i};"\n'
+        )
+    (path / f"{module_name}.py").write_text(code)
+
+
+def edit_one(module_spec: ModuleSpec) -> ModuleSpec:
+    """A copy of the module spec with the body of one function changed"""
+    functions = sorted(module_spec.functions, key=lambda f: f.name)
+    edited = replace(functions[0], body=functions[0].body.replace("return x * y", "return x * y + 1"))
+    return replace(module_spec, functions={edited, *functions[1:]})
+
+
+def best_of(f: Callable[[], object], repeats: int) -> float:
+    """The fastest time, in seconds, to call the function"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = perf_counter()
+        f()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def timed(f: Callable[[], object]) -> float:
+    """The time, in seconds, to call the function once"""
+    return best_of(f, 1)
+
+
+def run_size(path: Path, functions: int, repeats: int) -> dict[str, float]:
+    """Time each phase for a module with the given number of functions"""
+    module_name = f"pipeline_{functions}"
+    module_dir = module_root_dir / f"{module_name}_ext"
+    shutil.rmtree(module_dir, ignore_errors=True)
+    generate(path, module_name, functions)
+
+    results = {"register_s": timed(lambda: importlib.import_module(module_name))}
+    module_spec = _module_registry[module_name]
+    results["make_source_s"] = best_of(lambda: module_spec.make_source(module_name), repeats)
+    results["cold_build_s"] = timed(lambda: _check_build_fetch_module_impl(module_name, module_spec))
+    results["check_s"] = best_of(lambda: _installed_checksum(module_name, module_dir), repeats)
+
+    warm_start = subprocess.run(
+        [sys.executable, "-c", _WARM_START.format(path=str(path), module_name=module_name)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    results.update(json.loads(warm_start.stdout))
+
+    edited = edit_one(module_spec)
+    results["rebuild_one_s"] = timed(lambda: _check_build_fetch_module_impl(module_name, edited))
+    return results
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmarks, optionally saving the results and/or comparing them with a previous run"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-s", "--sizes", type=int, nargs="+", default=[1, 10, 50], help="numbers of functions")
+    parser.add_argument("-r", "--repeats", type=int, default=5, help="number of times to repeat the faster timings")
+    parser.add_argument("--backend", choices=["setuptools", "direct"], help="build backend (default from settings)")
+    parser.add_argument("--incremental", action="store_true", help="use incremental builds (direct backend only)")
+    parser.add_argument("--json", type=Path, help="file to write the results to")
+    parser.add_argument("--compare", type=Path, help="results of a previous run to compare with")
+    parser.add_argument("--threshold", type=float, default=10.0, help="slowdown (%%) regarded as a regression")
+    args = parser.parse_args(argv)
+
+    # also applies to the warm start subprocesses. Cold builds would otherwise fetch from the artefact store, if set
+    os.environ["XENOFORM_ARTEFACT_STORE"] = ""
+    if args.backend:
+        os.environ["XENOFORM_BUILD_BACKEND"] = args.backend
+    if args.incremental:
+        os.environ["XENOFORM_INCREMENTAL_BUILD"] = "true"
+
+    # {phase: {size: time}}
+    timings: dict[str, dict[int, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        sys.path.insert(0, tmp)
+        for functions in args.sizes:
+            for phase, t in run_size(Path(tmp), functions, args.repeats).items():
+                timings.setdefault(phase.removesuffix("_s"), {})[functions] = t
+    results: Results = {
+        f"{phase} ({n} functions)": {"ms": t * 1000} for phase, times in timings.items() for n, t in times.items()
+    }
+
+    if args.json:
+        save(
+            args.json,
+            "build_pipeline",
+            results,
+            sizes=args.sizes,
+            repeats=args.repeats,
+            backend=os.environ.get("XENOFORM_BUILD_BACKEND", "setuptools"),
+            incremental=args.incremental,
+        )
+
+    if args.compare:
+        return 1 if compare(load(args.compare), results, "ms", args.threshold) else 0
+
+    print("phase | " + " | ".join(f"{n} functions (ms)" for n in args.sizes))
+    print("------|" + "|".join("-:" for _ in args.sizes))
+    for phase, times in timings.items():
+        print(f"{phase} | " + " | ".join(f"{times[n] * 1000:.1f}" for n in args.sizes))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,344 @@
+"""
+Per-call cost of compiled functions for each of the default type mappings and C++ qualifiers, compared to an equivalent
+pure python function. Each function returns its argument (or its size), so the difference between the cost of calling
+it and a compiled function with no arguments is the cost of converting the argument and return value.
+
+python benchmarks/call_overhead.py --json before.json
+# upgrade xenoform, pybind11, the compiler...
+python benchmarks/call_overhead.py --json after.json --compare before.json
+"""
+
+import argparse
+import sys
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter_ns
+from types import EllipsisType
+from typing import Annotated, Any
+
+import numpy as np
+import numpy.typing as npt
+from results import Results, compare, load, save
+
+from xenoform import CppQualifier, compile, warmup
+
+
+@compile()
+def noop() -> None:
+    ""
+
+
+@compile()
+def int_(x: int) -> int:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile()
+def int32(x: np.int32) -> np.int32:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile()
+def int64(x: np.int64) -> np.int64:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile()
+def bool_(x: bool) -> bool:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile()
+def float_(x: float) -> float:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile()
+def float32(x: np.float32) -> np.float32:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile()
+def float64(x: np.float64) -> np.float64:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile()
+def str_(x: str) -> str:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile()
+def ndarray(x: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile()
+def bytes_(x: bytes) -> bytes:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile()
+def bytearray_(x: bytearray) -> bytearray:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile()
+def list_(x: list[int]) -> list[int]:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile()
+def set_(x: set[int]) -> set[int]:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile()
+def frozenset_(x: frozenset[int]) -> frozenset[int]:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile()
+def dict_(x: dict[str, int]) -> dict[str, int]:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile()
+def tuple_(x: tuple[int, float, str]) -> tuple[int, float, str]:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile()
+def slice_(x: slice) -> slice:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile()
+def any_(x: Any) -> Any:
+    "return x;"
+
+
+@compile()
+def type_(x: type) -> type:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile()
+def optional(x: int | None) -> int | None:
+    "return x;"
+
+
+@compile()
+def variant(x: int | str) -> int | str:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile()
+def callable_(x: Callable[[int], int]) -> Callable[[int], int]:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile()
+def call_callable(f: Callable[[int], int]) -> int:  # type: ignore[empty-body]
+    "return f(1);"
+
+
+@compile()
+def ellipsis(x: EllipsisType) -> EllipsisType:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile()
+def args_kwargs(*args: int, **kwargs: int) -> int:  # type: ignore[empty-body]
+    "return args.size() + kwargs.size();"
+
+
+@compile()
+def scalar(x: float) -> float:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile(vectorise=True)
+def vectorised(x: float) -> float:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile(vectorise="parallel")
+def vectorised_parallel(x: float) -> float:  # type: ignore[empty-body]
+    "return x;"
+
+
+@compile()
+def list_auto(x: Annotated[list[int], CppQualifier.Auto]) -> int:  # type: ignore[empty-body]
+    "return x.size();"
+
+
+@compile()
+def list_ref(x: Annotated[list[int], CppQualifier.Ref]) -> int:  # type: ignore[empty-body]
+    "return x.size();"
+
+
+@compile()
+def list_cref(x: Annotated[list[int], CppQualifier.CRef]) -> int:  # type: ignore[empty-body]
+    "return x.size();"
+
+
+@compile()
+def list_rref(x: Annotated[list[int], CppQualifier.RRef]) -> int:  # type: ignore[empty-body]
+    "return x.size();"
+
+
+@compile()
+def list_ptr(x: Annotated[list[int], CppQualifier.Ptr]) -> int:  # type: ignore[empty-body]
+    "return x->size();"
+
+
+@compile()
+def list_cptr(x: Annotated[list[int], CppQualifier.CPtr]) -> int:  # type: ignore[empty-body]
+    "return x->size();"
+
+
+@compile()
+def list_ptrc(x: Annotated[list[int], CppQualifier.PtrC]) -> int:  # type: ignore[empty-body]
+    "return x->size();"
+
+
+@compile()
+def list_cptrc(x: Annotated[list[int], CppQualifier.CPtrC]) -> int:  # type: ignore[empty-body]
+    "return x->size();"
+
+
+def identity(x: Any) -> Any:
+    "Python baseline for functions that return their argument"
+    return x
+
+
+def size(x: Any) -> int:
+    "Python baseline for functions that return the size of their argument"
+    return len(x)
+
+
+def call(f: Callable[[int], int]) -> int:
+    "Python baseline for calling a function"
+    return f(1)
+
+
+def count(*args: int, **kwargs: int) -> int:
+    "Python baseline for *args and **kwargs"
+    return len(args) + len(kwargs)
+
+
+def nothing() -> None:
+    "Python baseline for a function with no arguments"
+
+
+@dataclass(frozen=True)
+class Case:
+    """A compiled function (by name), its python equivalent, and the arguments to call them with"""
+
+    function: str
+    baseline: Callable[..., Any]
+    args: tuple[Any, ...] = ()
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+
+def cases(size_: int) -> dict[str, Case]:
+    """The benchmarks, with containers and arrays of the given size"""
+    ints = list(range(size_))
+    return {
+        "noop": Case("noop", nothing),
+        "int": Case("int_", identity, (1,)),
+        "np.int32": Case("int32", identity, (np.int32(1),)),
+        "np.int64": Case("int64", identity, (np.int64(1),)),
+        "bool": Case("bool_", identity, (True,)),
+        "float": Case("float_", identity, (1.0,)),
+        "np.float32": Case("float32", identity, (np.float32(1.0),)),
+        "np.float64": Case("float64", identity, (np.float64(1.0),)),
+        "str": Case("str_", identity, ("x" * size_,)),
+        "np.ndarray": Case("ndarray", identity, (np.zeros(size_),)),
+        "bytes": Case("bytes_", identity, (b"x" * size_,)),
+        "bytearray": Case("bytearray_", identity, (bytearray(size_),)),
+        "list": Case("list_", identity, (ints,)),
+        "set": Case("set_", identity, (set(ints),)),
+        "frozenset": Case("frozenset_", identity, (frozenset(ints),)),
+        "dict": Case("dict_", identity, ({str(i): i for i in ints},)),
+        "tuple": Case("tuple_", identity, ((1, 1.0, "x"),)),
+        "slice": Case("slice_", identity, (slice(1, size_, 2),)),
+        "Any": Case("any_", identity, (object(),)),
+        "type": Case("type_", identity, (int,)),
+        "optional": Case("optional", identity, (1,)),
+        "variant": Case("variant", identity, ("x",)),
+        "Callable": Case("callable_", identity, (identity,)),
+        "Callable (call)": Case("call_callable", call, (identity,)),
+        "...": Case("ellipsis", identity, (...,)),
+        "*args, **kwargs": Case("args_kwargs", count, (1, 2, 3), {"a": 1, "b": 2}),
+        "scalar": Case("scalar", identity, (1.0,)),
+        "vectorise=True (scalar)": Case("vectorised", identity, (1.0,)),
+        "vectorise=True (array)": Case("vectorised", identity, (np.zeros(size_),)),
+        'vectorise="parallel" (scalar)': Case("vectorised_parallel", identity, (1.0,)),
+        'vectorise="parallel" (array)': Case("vectorised_parallel", identity, (np.zeros(size_),)),
+        **{
+            f"list {qualifier.name}": Case(f"list_{qualifier.name.lower()}", size, (ints,))
+            for qualifier in CppQualifier
+        },
+    }
+
+
+def time_calls(f: Callable[..., Any], case: Case, calls: int, repeats: int) -> float:
+    "Return the mean time per call in ns, from the fastest of the repeats"
+    args, kwargs = case.args, case.kwargs
+    best = float("inf")
+    for _ in range(repeats):
+        start = perf_counter_ns()
+        for _ in range(calls):
+            f(*args, **kwargs)
+        best = min(best, (perf_counter_ns() - start) / calls)
+    return best
+
+
+def run(size_: int, calls: int, repeats: int) -> Results:
+    """Time each case, and the python baseline"""
+    warmup()
+    results: Results = {}
+    for name, case in cases(size_).items():
+        # the first call replaces the python stub with the compiled function
+        globals()[case.function](*case.args, **case.kwargs)
+        compiled = globals()[case.function]
+        results[name] = {
+            "cpp_ns": time_calls(compiled, case, calls, repeats),
+            "py_ns": time_calls(case.baseline, case, calls, repeats),
+        }
+    noop_ns = results["noop"]["cpp_ns"]
+    for values in results.values():
+        values["conversion_ns"] = values["cpp_ns"] - noop_ns
+    return results
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmarks, optionally saving the results and/or comparing them with a previous run"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--calls", type=int, default=100_000, help="number of calls to time")
+    parser.add_argument("-r", "--repeats", type=int, default=5, help="number of times to repeat each timing")
+    parser.add_argument("-s", "--size", type=int, default=100, help="size of containers and arrays")
+    parser.add_argument("--json", type=Path, help="file to write the results to")
+    parser.add_argument("--compare", type=Path, help="results of a previous run to compare with")
+    parser.add_argument("--threshold", type=float, default=10.0, help="slowdown (%%) regarded as a regression")
+    args = parser.parse_args(argv)
+
+    results = run(args.size, args.calls, args.repeats)
+    if args.json:
+        save(args.json, "call_overhead", results, size=args.size, calls=args.calls, repeats=args.repeats)
+
+    if args.compare:
+        return 1 if compare(load(args.compare), results, "cpp_ns", args.threshold) else 0
+
+    print("type | cpp (ns/call) | conversion (ns/call) | py (ns/call)")
+    print("-----|--------------:|---------------------:|-------------:")
+    for name, values in results.items():
+        print(f"{name} | {values['cpp_ns']:.0f} | {values['conversion_ns']:.0f} | {values['py_ns']:.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""Saving, loading and comparing benchmark results, as JSON"""
+
+import json
+import platform
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pybind11
+
+import xenoform
+from xenoform.build import compiler, compiler_version
+
+# {benchmark: {metric: value}}
+Results = dict[str, dict[str, float]]
+
+
+def metadata() -> dict[str, str]:
+    """The versions and platform the benchmarks were run with"""
+    return {
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "xenoform": xenoform.__version__,
+        "pybind11": pybind11.__version__,
+        "numpy": np.__version__,
+        "python": sys.version.split()[0],
+        "compiler": compiler_version(tuple(compiler())),
+        "platform": platform.platform(),
+    }
+
+
+def save(path: Path, suite: str, results: Results, **params: Any) -> None:
+    """Write the results, with the parameters and metadata of the run"""
+    with path.open("w") as fd:
+        json.dump({"suite": suite, "metadata": metadata(), "params": params, "results": results}, fd, indent=2)
+
+
+def load(path: Path) -> Results:
+    """Read the results from a previous run"""
+    with path.open() as fd:
+        return dict(json.load(fd)["results"])
+
+
+def compare(baseline: Results, results: Results, metric: str, threshold: float) -> int:
+    """
+    Print a table comparing the metric for each benchmark with the baseline. Returns the number of benchmarks that are
+    slower by more than threshold percent
+    """
+    regressions = 0
+    print("benchmark | baseline | current | change (%)")
+    print("----------|---------:|--------:|----------:")
+    for name, values in results.items():
+        if name not in baseline or metric not in baseline[name]:
+            print(f"{name} | | {values[metric]:.1f} |")
+            continue
+        before, after = baseline[name][metric], values[metric]
+        change = 100 * (after / before - 1) if before else 0.0
+        flag = ""
+        if change > threshold:
+            regressions += 1
+            flag = " (regression)"
+        print(f"{name} | {before:.1f} | {after:.1f} | {change:+.0f}{flag}")
+    return regressions
@@ -0,0 +1,49 @@
+"""Example of per-call overhead - calling via the python stub vs directly calling the compiled function"""
+
+from collections.abc import Callable
+from time import perf_counter_ns
+
+from xenoform import compile
+from xenoform.compile import _get_function
+
+
+def add_py(i: int, j: int) -> int:
+    "Pure python baseline"
+    return i + j
+
+
+@compile()
+def add(i: int, j: int) -> int:  # type: ignore[empty-body]
+    """
+    return i + j;
+    """
+
+
+def time_calls(f: Callable[[int, int], int], n: int) -> float:
+    "Return the mean time per call in ns"
+    start = perf_counter_ns()
+    for i in range(n):
+        f(i, 1)
+    return (perf_counter_ns() - start) / n
+
+
+def main() -> None:
+    """Compare the per-call cost of each route to the compiled function"""
+    n = 1_000_000
+
+    stub = add  # keep a reference to the python stub before the first call...
+    add(0, 0)  # ...which builds/loads the module and rebinds `add` to the compiled function
+
+    def lookup(i: int, j: int) -> int:
+        # what the stub did on every call before it was rebound
+        return _get_function("dispatch", "_add")(i, j)  # type: ignore[arg-type]
+
+    print("call | ns/call")
+    print("-----|-------:")
+    routes = [("python", add_py), ("stub+lookup", lookup), ("stub", stub), ("rebound", add), ("compiled", add.func)]  # type: ignore[attr-defined]
+    for name, f in routes:
+        print(f"{name} | {time_calls(f, n):.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,12 @@
 """Example of custom vectorised function performance - python vs inline C++"""
 
 import time
+from typing import Annotated
 
 import numpy as np
 import numpy.typing as npt
 
-from xenoform import compile
+from xenoform import ArrayView, compile
 
 
 def calc_dist_matrix_py(p: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
@@ -14,18 +15,16 @@ def calc_dist_matrix_py(p: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
 
 
 @compile(extra_compile_args=["-fopenmp"], extra_link_args=["-fopenmp"])
-def calc_dist_matrix_cpp(points: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:  # type: ignore[empty-body]
+def calc_dist_matrix_cpp(  # type: ignore[empty-body]
+    p: Annotated[npt.NDArray[np.float64], ArrayView(2)],
+) -> npt.NDArray[np.float64]:
     """
-    py::buffer_info buf = points.request();
-    if (buf.ndim != 2)
-        throw std::runtime_error("Input array must be 2D");
-
-    size_t n = buf.shape[0];
-    size_t d = buf.shape[1];
+    // the binding ensures p is a 2D C-contiguous array
+    size_t n = p.extent(0);
+    size_t d = p.extent(1);
 
     py::array_t<double> result({n, n});
     auto r = result.mutable_unchecked<2>();
-    auto p = points.unchecked<2>();
 
     // Avoid redundant computation for symmetric matrix
     #pragma omp parallel for schedule(static)
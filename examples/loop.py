@@ -6,7 +6,7 @@ from typing import Annotated
 import numpy as np
 import pandas as pd
 
-from xenoform import compile
+from xenoform import PandasView, compile
 
 
 def calc_balances_py(data: pd.Series, rate: float) -> pd.Series:
@@ -20,27 +20,17 @@ def calc_balances_py(data: pd.Series, rate: float) -> pd.Series:
     return result
 
 
-@compile(extra_includes=["<pybind11/numpy.h>"])
-def calc_balances_cpp(data: Annotated[pd.Series, "py::object"], rate: float) -> Annotated[pd.Series, "py::object"]:  # type: ignore[empty-body]
+@compile()
+def calc_balances_cpp(data: Annotated[pd.Series, PandasView(np.int64)], rate: float) -> pd.Series:  # type: ignore[empty-body]
     """
-    // Import pandas
-    auto pd = py::module::import("pandas");
-    // Construct an empty pd.Series with the same index as the input
-    auto result = pd.attr("Series")(py::arg("index") = data.attr("index"));
+    // A new series (of doubles) with the same index and name as the input
+    auto result = xenoform::series<double>::like(data);
 
-    // Access the values via numpy/py::array_t
-    auto data_a = data.attr("to_numpy")().cast<py::array_t<int64_t>>();
-    auto result_a = result.attr("to_numpy")().cast<py::array_t<double>>();
-
-    auto n = data_a.request().shape[0];
-    auto d = data_a.unchecked<1>();
-    auto r = result_a.mutable_unchecked<1>();
-
-    // Do the calculation
+    // Do the calculation, directly on the (uncopied) values of the input
     double current_value = 0.0;
-    for (py::ssize_t i = 0; i < n; ++i) {
-        current_value = (current_value + d(i)) * (1.0 - rate);
-        r(i) = current_value;
+    for (size_t i = 0; i < data.size(); ++i) {
+        current_value = (current_value + data[i]) * (1.0 - rate);
+        result[i] = current_value;
     }
     return result;
     """
@@ -61,8 +51,7 @@ def main() -> None:
         py_time = process_time() - start
 
         start = process_time()
-        # Although pybind11/C++ doesn't understand the type pd.Series, it can use the py::object API to manipulate
-        # and create instances of this type
+        # The series is passed as a view of its values and the result is returned as a pd.Series with the same index
         cpp_result = calc_balances_cpp(data, rate)
         cpp_time = process_time() - start
 
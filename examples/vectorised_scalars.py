@@ -0,0 +1,58 @@
+"""Example of the per-call cost of vectorised functions called with scalar arguments"""
+
+from collections.abc import Callable
+from time import perf_counter_ns
+from typing import Any
+
+from xenoform import compile
+
+
+@compile(extra_includes=["<cmath>"])
+def hypot(x: float, y: float) -> float:  # type: ignore[empty-body]
+    """
+    return std::sqrt(x * x + y * y);
+    """
+
+
+@compile(vectorise=True, extra_includes=["<cmath>"])
+def hypot_v(x: float, y: float) -> float:  # type: ignore[empty-body]
+    """
+    return std::sqrt(x * x + y * y);
+    """
+
+
+@compile(vectorise="parallel", extra_includes=["<cmath>"])
+def hypot_p(x: float, y: float) -> float:  # type: ignore[empty-body]
+    """
+    return std::sqrt(x * x + y * y);
+    """
+
+
+def time_calls(f: Callable[[Any, Any], Any], x: Any, y: Any, n: int) -> float:
+    "Return the mean time per call in ns"
+    start = perf_counter_ns()
+    for _ in range(n):
+        f(x, y)
+    return (perf_counter_ns() - start) / n
+
+
+def main() -> None:
+    """
+    Compare scalar calls to a plain function with calls to vectorised functions. Scalars of the exact type call the
+    scalar overload. Those that need converting (here ints passed as floats) go via the vectorised overload, as all
+    scalar calls did previously
+    """
+    n = 1_000_000
+    # build/load the module (and rebind the functions) before timing
+    assert hypot(3.0, 4.0) == hypot_v(3.0, 4.0) == hypot_p(3.0, 4.0) == 5.0
+
+    print("function | args | ns/call")
+    print("---------|------|-------:")
+    print(f"plain | float | {time_calls(hypot, 3.0, 4.0, n):.0f}")
+    for name, f in [("vectorise=True", hypot_v), ('vectorise="parallel"', hypot_p)]:
+        print(f"{name} | float (scalar overload) | {time_calls(f, 3.0, 4.0, n):.0f}")
+        print(f"{name} | int (vectorised overload) | {time_calls(f, 3, 4, n):.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 17
+// profile: default
+// pgo: None
+// defines: OFFSET=1
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(broken_direct_module, m) {
+  m.doc() = "broken_direct_module module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "5d208c2d3a84c54a8f560e8c300439ea792e8f1a7cd9c9ff868666c4deb36f80";
+  
+  m.def("_f", [](int i) -> int {
+#error
+}, py::return_value_policy::automatic  , py::arg("i"));
+
+
+}
@@ -0,0 +1,26 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(broken_module, m) {
+  m.doc() = "broken_module module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "29f9035c4fb66f34762c376f829eed6369c03115c5f355d6f118c9da60ea41b7";
+  
+  m.def("_error", {
+#error
+}, py::return_value_policy::automatic  );
+
+
+}
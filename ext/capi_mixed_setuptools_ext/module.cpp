@@ -0,0 +1,49 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <xenoform/capi.h>
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(capi_mixed_setuptools, m) {
+  m.doc() = "capi_mixed_setuptools module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "133cf01d8e4a9864d7e1e2e36feebd5f83fb56bb2fdf5999205b25dfa2f891a7";
+  
+  m.def("_g", [](int i) -> int { return i * 2; }, py::return_value_policy::automatic  , py::arg("i"));
+
+
+
+  {
+    static PyMethodDef functions[] = {
+        {"_f",
+         reinterpret_cast<PyCFunction>(reinterpret_cast<void (*)()>(
+             +[](PyObject*, PyObject* const* args_, Py_ssize_t nargs_, PyObject* kwnames_) -> PyObject* {
+               static const char* const names_[] = {"i", nullptr};
+               PyObject* values_[1 + 1];
+               if (!xenoform::capi::parse_args("capi_f", names_, 1, 0, 1, args_, nargs_,
+                                               kwnames_, values_))
+                 return nullptr;
+               xenoform::capi::arg<int> arg_i;
+               if (!(arg_i.load(values_[0], "capi_f", "i")))
+                 return nullptr;
+               return xenoform::capi::call<false>([](int i) -> int { return i * 3; }, arg_i.get());
+             })),
+         METH_FASTCALL | METH_KEYWORDS, R"""(_f(i)
+--
+
+)"""},
+        {nullptr, nullptr, 0, nullptr}};
+    xenoform::capi::add_functions(m, functions);
+  }
+
+}
@@ -0,0 +1,54 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <xenoform/capi.h>
+
+
+static PyModuleDef module_def = {
+    PyModuleDef_HEAD_INIT, "capi_only_direct", "capi_only_direct module generated by xenoform 0.1.3", -1, nullptr};
+
+PyMODINIT_FUNC PyInit_capi_only_direct() {
+  PyObject* m = PyModule_Create(&module_def);
+  if (!m)
+    return nullptr;
+  try {
+    if (PyModule_AddStringConstant(m, "__checksum__", "dda5baa2f59b783a49a309a6245a4f2b729a81515b8cea133fde9e1cc4db7799") < 0)
+      throw std::runtime_error("failed to add checksum to module");
+    
+  {
+    static PyMethodDef functions[] = {
+        {"_f",
+         reinterpret_cast<PyCFunction>(reinterpret_cast<void (*)()>(
+             +[](PyObject*, PyObject* const* args_, Py_ssize_t nargs_, PyObject* kwnames_) -> PyObject* {
+               static const char* const names_[] = {"i", nullptr};
+               PyObject* values_[1 + 1];
+               if (!xenoform::capi::parse_args("capi_f", names_, 1, 0, 1, args_, nargs_,
+                                               kwnames_, values_))
+                 return nullptr;
+               xenoform::capi::arg<int> arg_i;
+               if (!(arg_i.load(values_[0], "capi_f", "i")))
+                 return nullptr;
+               return xenoform::capi::call<false>([](int i) -> int { return i * 3; }, arg_i.get());
+             })),
+         METH_FASTCALL | METH_KEYWORDS, R"""(_f(i)
+--
+
+)"""},
+        {nullptr, nullptr, 0, nullptr}};
+    xenoform::capi::add_functions(m, functions);
+  }
+
+  } catch (const std::exception& e) {
+    Py_DECREF(m);
+    PyErr_SetString(PyExc_ImportError, e.what());
+    return nullptr;
+  }
+  return m;
+}
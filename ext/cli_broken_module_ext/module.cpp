@@ -0,0 +1,26 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(cli_broken_module, m) {
+  m.doc() = "cli_broken_module module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "fb0f0aaf1b916fc49383c1b60b238c7b5fe4a23ca37697cb204ca5dc5435b42b";
+  
+  m.def("_broken", []() -> int {
+    return undefined_variable;
+    }, py::return_value_policy::automatic  );
+
+
+}
@@ -0,0 +1,24 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(cli_dir_module, m) {
+  m.doc() = "cli_dir_module module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "ae5077977598c14d5e1c650d19527fdff8d70bd4fe5f8c7e4ce140c803590665";
+  
+  m.def("_triple", [](int i) -> int {return i * 3;}, py::return_value_policy::automatic  , py::arg("i"));
+
+
+}
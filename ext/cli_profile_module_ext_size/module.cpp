@@ -0,0 +1,24 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: size
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(cli_profile_module, m) {
+  m.doc() = "cli_profile_module module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "4ad41b334287a95447ba785fe6e4e501b1fcb6197a61765d4e4a55ccc22acae6";
+  
+  m.def("_quadruple", [](int i) -> int {return i * 4;}, py::return_value_policy::automatic  , py::arg("i"));
+
+
+}
@@ -0,0 +1,24 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 17
+// profile: default
+// pgo: None
+// defines: OFFSET=1
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(direct_module, m) {
+  m.doc() = "direct_module module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "a0e8ee58ee1fd93f568a569196d5ad5b28cdb1a4a9efff2d2357a3178256a56f";
+  
+  m.def("_f", [](int i) -> int { return i + OFFSET; }, py::return_value_policy::automatic  , py::arg("i"));
+
+
+}
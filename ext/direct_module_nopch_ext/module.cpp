@@ -0,0 +1,24 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 17
+// profile: default
+// pgo: None
+// defines: OFFSET=1
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(direct_module_nopch, m) {
+  m.doc() = "direct_module_nopch module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "21369f9c0646b6f1c6c2eaa35d8a125f0586dadb5a0fd01c135eec58a31a39cd";
+  
+  m.def("_f", [](int i) -> int { return i + 3; }, py::return_value_policy::automatic  , py::arg("i"));
+
+
+}
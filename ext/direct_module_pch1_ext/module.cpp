@@ -0,0 +1,24 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 17
+// profile: default
+// pgo: None
+// defines: OFFSET=1
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(direct_module_pch1, m) {
+  m.doc() = "direct_module_pch1 module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "4c7dde50de5d6d9ef7105a9c0f4f7dd5aa3565e18fcff899442361530d911126";
+  
+  m.def("_f", [](int i) -> int { return i + 1; }, py::return_value_policy::automatic  , py::arg("i"));
+
+
+}
@@ -0,0 +1,24 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 17
+// profile: default
+// pgo: None
+// defines: OFFSET=1
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(direct_module_pch2, m) {
+  m.doc() = "direct_module_pch2 module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "d5646d8ead52b93151fccdda83e9f8f2eab8437d380e0ff194cd1381ff1dce50";
+  
+  m.def("_f", [](int i) -> int { return i + 2; }, py::return_value_policy::automatic  , py::arg("i"));
+
+
+}
@@ -0,0 +1,24 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 17
+// profile: default
+// pgo: None
+// defines: OFFSET=1
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(direct_module_pch_fail, m) {
+  m.doc() = "direct_module_pch_fail module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "25185fe7e1449024fd23833fafadbcfab2440e9b96ecf2cb231ca162267d3e23";
+  
+  m.def("_f", [](int i) -> int { return i + 4; }, py::return_value_policy::automatic  , py::arg("i"));
+
+
+}
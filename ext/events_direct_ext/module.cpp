@@ -0,0 +1,24 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(events_direct, m) {
+  m.doc() = "events_direct module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "72bcb092b2975717f854019631477999b1fd1d5928a7ed6bfdab6b9f6d19a899";
+  
+  m.def("_f", [](int i) -> int { return i * 3; }, py::return_value_policy::automatic  , py::arg("i"));
+
+
+}
@@ -0,0 +1,24 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(events_setuptools, m) {
+  m.doc() = "events_setuptools module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "2bd5b1480236bf9f972e78bdce48e7fe3503d1a5f5c9f75f32efc93270029210";
+  
+  m.def("_f", [](int i) -> int { return i * 3; }, py::return_value_policy::automatic  , py::arg("i"));
+
+
+}
@@ -0,0 +1,28 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(incremental_module, m) {
+  m.doc() = "incremental_module module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "d24044194782946f99bec9ad700ce7889f2e98ea3e268ad113b8f4f518271df5";
+  
+  m.def("_f", [](int i) -> int { return i + 1; }, py::return_value_policy::automatic  , py::arg("i"));
+
+
+
+  m.def("_g", [](int i) { return i * 3; }, py::return_value_policy::automatic  , py::arg("i"));
+
+
+}
@@ -0,0 +1,15 @@
+
+// generated by xenoform 0.1.3
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+void register_f(py::module_& m) {
+  
+  m.def("_f", [](int i) -> int { return i + 1; }, py::return_value_policy::automatic  , py::arg("i"));
+
+
+}
@@ -0,0 +1,15 @@
+
+// generated by xenoform 0.1.3
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+void register_g(py::module_& m) {
+  
+  m.def("_g", [](int i) { return i * 3; }, py::return_value_policy::automatic  , py::arg("i"));
+
+
+}
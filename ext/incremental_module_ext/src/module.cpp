@@ -0,0 +1,16 @@
+
+// generated by xenoform 0.1.3
+
+#include <pybind11/pybind11.h>
+
+namespace py = pybind11;
+
+void register_f(py::module_& m);
+void register_g(py::module_& m);
+
+PYBIND11_MODULE(incremental_module, m) {
+  m.doc() = "incremental_module module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "d24044194782946f99bec9ad700ce7889f2e98ea3e268ad113b8f4f518271df5";
+  register_f(m);
+  register_g(m);
+}
@@ -0,0 +1,25 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: ['../../src/test']
+// extra cxxflags: 
+// extra ldflags: 
+
+#include "test_lib.h"
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(local_header_module, m) {
+  m.doc() = "local_header_module module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "78dad521aa5f27ecb9616808a36f3f0f4fe4ad9aabba2263130e9f80fae35553";
+  
+  m.def("_f", []() -> int { return fibonacci_template<10>(); }, py::return_value_policy::automatic  );
+
+
+}
@@ -0,0 +1,24 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(locked_module, m) {
+  m.doc() = "locked_module module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "2c9e57a9ddddffa6167ec517056f415a709635319bb4273b38765000afc53c40";
+  
+  m.def("_f", []() -> int { return 9; }, py::return_value_policy::automatic  );
+
+
+}
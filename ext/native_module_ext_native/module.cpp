@@ -0,0 +1,24 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: native
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: -O1
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(native_module, m) {
+  m.doc() = "native_module module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "a9b3669afaee61c1260d61c9409cac3e8c07db0087eb2b4865a656e1b8dae72d";
+  
+  m.def("_f", [](int i) -> int { return i * 2; }, py::return_value_policy::automatic  , py::arg("i"));
+
+
+}
@@ -0,0 +1,24 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: release
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: -O1
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(native_module, m) {
+  m.doc() = "native_module module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "b60ed23eaa06a8e2b1f9c7f856c7aff6665f0041e0ab7725df753c7b0d49bb4b";
+  
+  m.def("_f", [](int i) -> int { return i * 2; }, py::return_value_policy::automatic  , py::arg("i"));
+
+
+}
@@ -0,0 +1,31 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: use
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(pgo_workload_direct, m) {
+  m.doc() = "pgo_workload_direct module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "a21e43725bbdc1ff9a2a60b16b8c7ae925e49dfef2e7f12346c9d6b0ad0fecbd";
+  
+  m.def("_collatz", [](int n) -> int {
+    int steps = 0;
+    while (n != 1) {
+        n = n % 2 ? 3 * n + 1 : n / 2;
+        ++steps;
+    }
+    return steps;
+    }, py::return_value_policy::automatic  , py::arg("n"));
+
+
+}
@@ -0,0 +1,31 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: use
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(pgo_workload_setuptools, m) {
+  m.doc() = "pgo_workload_setuptools module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "b09a23b90d588f5427f23b3945bf08a97ebf4f7df6fb39f25d48a0c81f00ac46";
+  
+  m.def("_collatz", [](int n) -> int {
+    int steps = 0;
+    while (n != 1) {
+        n = n % 2 ? 3 * n + 1 : n / 2;
+        ++steps;
+    }
+    return steps;
+    }, py::return_value_policy::automatic  , py::arg("n"));
+
+
+}
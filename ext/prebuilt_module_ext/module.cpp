@@ -0,0 +1,26 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(prebuilt_module, m) {
+  m.doc() = "prebuilt_module module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "8b0e4e2c05850c7070af942e9f21ad35f3854c4146f03e93d652ed28b9dac61c";
+  
+  m.def("_prebuilt", [](int i) -> int {
+    return i * 2;
+    }, py::return_value_policy::automatic  , py::arg("i"));
+
+
+}
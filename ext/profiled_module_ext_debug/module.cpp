@@ -0,0 +1,24 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: debug
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: -O1
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(profiled_module, m) {
+  m.doc() = "profiled_module module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "be4fa68fbef5a68321979a81a48aa4706b0fda0c0478908cf6a5bef74e9a6d27";
+  
+  m.def("_f", [](int i) -> int { return i * 2; }, py::return_value_policy::automatic  , py::arg("i"));
+
+
+}
@@ -0,0 +1,24 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: size
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: -O1
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(profiled_module, m) {
+  m.doc() = "profiled_module module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "54f71127aef248dc6c9fe027d2786a89daf3d69838de1ebdaf6177a5cf339c28";
+  
+  m.def("_f", [](int i) -> int { return i * 2; }, py::return_value_policy::automatic  , py::arg("i"));
+
+
+}
@@ -0,0 +1,24 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(stored_module, m) {
+  m.doc() = "stored_module module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "181e8e207446d95596a816e087fa576d4e4810c8d5e793925cf179ec4d932c24";
+  
+  m.def("_f", []() -> int { return 7; }, py::return_value_policy::automatic  );
+
+
+}
@@ -0,0 +1,50 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <xenoform/span.h>
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_array_view, m) {
+  m.doc() = "test_array_view module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "9e6ede1ef8a2bc0c637c53e7624b051f04929331928d8168e7d3054d92ac7d21";
+  
+  m.def("_fill", [](xenoform::mdspan<int32_t, 3> t) -> void {
+    for (size_t i = 0; i < t.extent(0); ++i)
+      for (size_t j = 0; j < t.extent(1); ++j)
+        for (size_t k = 0; k < t.extent(2); ++k)
+          t(i, j, k) = 100 * i + 10 * j + k;
+    }, py::return_value_policy::automatic  , py::arg("t"));
+
+
+
+  m.def("_scale", [](std::span<double> a, double k) -> void {for (double& x : a) x *= k;}, py::return_value_policy::automatic  , py::arg("a"), py::arg("k"));
+
+
+
+  m.def("_total", [](std::span<const double> a) -> double {
+    double sum = 0.0;
+    for (double x : a) sum += x;
+    return sum;
+    }, py::return_value_policy::automatic  , py::arg("a"));
+
+
+
+  m.def("_trace", [](xenoform::mdspan<const int64_t, 2> m) -> int {
+    int64_t sum = 0;
+    for (size_t i = 0; i < std::min(m.extent(0), m.extent(1)); ++i) sum += m(i, i);
+    return sum;
+    }, py::return_value_policy::automatic, py::call_guard<py::gil_scoped_release>()  , py::arg("m"));
+
+
+}
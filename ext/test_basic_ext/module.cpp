@@ -0,0 +1,50 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: PYBIND11_DETAILED_ERROR_MESSAGES
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/stl.h>
+#include <pybind11/pybind11.h>
+#include <string>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_basic, m) {
+  m.doc() = "test_basic module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "18cf0162dd199320c9d0987aff98a812e3f5a41dacfda7bef74bc1e33d7a395c";
+  
+  m.def("_incref", [](int& i) -> void {
+    ++i;
+    }, py::return_value_policy::automatic  , py::arg("i"));
+
+
+
+  m.def("_max", [](int i, int j) -> int {return i > j ? i : j;}, py::return_value_policy::automatic  , py::arg("i"), py::arg("j"));
+
+
+
+  m.def("_string", [](std::string s) -> int {
+    return static_cast<int>(s.size());
+    }, py::return_value_policy::automatic  , py::arg("s"));
+
+
+
+  m.def("_throws", []() -> bool {
+    throw std::runtime_error("oops");
+    }, py::return_value_policy::automatic  );
+
+
+
+  m.def("_vec", [](int size) -> std::vector<int> {
+    return std::vector<int>(size);
+    }, py::return_value_policy::automatic  , py::arg("size"));
+
+
+}
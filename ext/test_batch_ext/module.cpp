@@ -0,0 +1,71 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/stl.h>
+#include <xenoform/batch.h>
+#include <pybind11/numpy.h>
+#include <xenoform/arrays.h>
+#include <xenoform/stats.h>
+#include <pybind11/pybind11.h>
+#include <string>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_batch, m) {
+  m.doc() = "test_batch module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "3eafb8cee46be31a95ca84388c3ad48d622fba00b4f9eee41dcfe776ecacee4d";
+  
+  m.def("_Counter_scaled", [](py::object self, int k) -> int {return k * self.attr("n").cast<int>();}, py::return_value_policy::automatic  , py::arg("self"), py::arg("k"));
+
+
+  m.def("_Counter_scaled_batch", xenoform::batch([](py::object self, int k) -> int {return k * self.attr("n").cast<int>();}, py::return_value_policy::automatic), py::return_value_policy::automatic  , py::arg("items"));
+
+
+
+  m.def("_add", [](double i, double j) -> double {return i + j;}, py::return_value_policy::automatic  , py::arg("i").noconvert(), py::arg("j").noconvert());
+
+
+  m.def("_add", py::vectorize([](double i, double j) -> double {return i + j;}), py::return_value_policy::automatic  , py::arg("i"), py::arg("j"));
+
+
+  m.def("_add_batch", xenoform::batch([](double i, double j) -> double {return i + j;}, py::return_value_policy::automatic), py::return_value_policy::automatic  , py::arg("items"));
+
+
+
+  m.def("_append", [](std::vector<int>& values, int value) -> void {values.push_back(value);}, py::return_value_policy::automatic  , py::arg("values"), py::arg("value"));
+
+
+  m.def("_append_batch", xenoform::batch([](std::vector<int>& values, int value) -> void {values.push_back(value);}, py::return_value_policy::automatic), py::return_value_policy::automatic  , py::arg("items"));
+
+
+
+  m.def("_describe", [](std::string name, std::optional<int> count, double scale=1.0) -> std::string {return name + ':' + (count ? std::to_string(static_cast<int>(*count * scale)) : std::string("none"));}, py::return_value_policy::automatic  , py::arg("name"), py::arg("count"), py::arg("scale")=1.0);
+
+
+  m.def("_describe_batch", xenoform::batch([](std::string name, std::optional<int> count, double scale=1.0) -> std::string {return name + ':' + (count ? std::to_string(static_cast<int>(*count * scale)) : std::string("none"));}, py::return_value_policy::automatic), py::return_value_policy::automatic  , py::arg("items"));
+
+
+
+  m.def("_unbatched", [](int i) -> int {return i;}, py::return_value_policy::automatic  , py::arg("i"));
+
+
+{
+  static constexpr char xenoform_a_name[] = "total.a";
+  xenoform::register_array_copies(m);
+
+  m.def("_total", xenoform::instrument(m, "total", [](xenoform::array_arg<py::array_t<double>, false, xenoform_a_name> a) -> double {auto acc = a.unchecked<1>(); double sum = 0.0; for (py::ssize_t i = 0; i < acc.shape(0); ++i) sum += acc(i); return sum;}), py::return_value_policy::automatic  , py::arg("a"));
+
+
+  m.def("_total_batch", xenoform::batch(xenoform::instrument(m, "total", [](xenoform::array_arg<py::array_t<double>, false, xenoform_a_name> a) -> double {auto acc = a.unchecked<1>(); double sum = 0.0; for (py::ssize_t i = 0; i < acc.shape(0); ++i) sum += acc(i); return sum;}), py::return_value_policy::automatic), py::return_value_policy::automatic  , py::arg("items"));
+
+}
+}
@@ -0,0 +1,33 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+#include <string>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_caching, m) {
+  m.doc() = "test_caching module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "b7a4ab1d68475472d6266b0b6187e1e4d385e505d6c880c8506e6e5996d314e3";
+  
+  m.def("_f", []() -> int {
+    return 42;
+    }, py::return_value_policy::automatic  );
+
+
+
+  m.def("_g", []() -> std::string {
+    return "hello";
+    }, py::return_value_policy::automatic  );
+
+
+}
@@ -0,0 +1,59 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/functional.h>
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_callable, m) {
+  m.doc() = "test_callable module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "1368bd40e8991b7add0142c48ce6e2481e758fdf95cb05552ebf2c3dc8e89d6d";
+  
+  m.def("_modulo", [](int n) -> std::function<int(int)> {
+    return [n](int i) { return i % n; };
+    }, py::return_value_policy::automatic  , py::arg("n"));
+
+
+
+  m.def("_modulo_override", [](int n) -> py::cpp_function {
+    // explicit construction of py::cpp_function is not necessary
+    return py::cpp_function([n](int i) { return i % n; });
+    }, py::return_value_policy::automatic  , py::arg("n"));
+
+
+
+  m.def("_round_sign", []() -> std::function<int(double, bool)> {
+    return [](double x, bool s) -> int { return int(s ? -x : x); };
+    }, py::return_value_policy::automatic  );
+
+
+
+  m.def("_use_modulo", [](std::function<int(int)> f, int i) -> int {
+    return f(i);
+    }, py::return_value_policy::automatic  , py::arg("f"), py::arg("i"));
+
+
+
+  m.def("_use_modulo_override", [](py::function f, int i) -> int {
+    // py::function returns a py::object so cast is required
+    return f(i).cast<int>();
+    }, py::return_value_policy::automatic  , py::arg("f"), py::arg("i"));
+
+
+
+  m.def("_use_round_sign", [](std::function<int(double, bool)> f, double x) -> int {
+    return f(x, true);
+    }, py::return_value_policy::automatic  , py::arg("f"), py::arg("x"));
+
+
+}
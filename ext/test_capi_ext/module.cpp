@@ -0,0 +1,180 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <xenoform/capi.h>
+#include <algorithm>
+
+
+static PyModuleDef module_def = {
+    PyModuleDef_HEAD_INIT, "test_capi", "test_capi module generated by xenoform 0.1.3", -1, nullptr};
+
+PyMODINIT_FUNC PyInit_test_capi() {
+  PyObject* m = PyModule_Create(&module_def);
+  if (!m)
+    return nullptr;
+  try {
+    if (PyModule_AddStringConstant(m, "__checksum__", "ce38a458ab357dd73acae4065c870db4b55c474353b08a97f4dcfe111e55b8db") < 0)
+      throw std::runtime_error("failed to add checksum to module");
+    
+  {
+    static PyMethodDef functions[] = {
+        {"_answer",
+         reinterpret_cast<PyCFunction>(reinterpret_cast<void (*)()>(
+             +[](PyObject*, PyObject* const* args_, Py_ssize_t nargs_, PyObject* kwnames_) -> PyObject* {
+               static const char* const names_[] = {nullptr};
+               PyObject* values_[0 + 1];
+               if (!xenoform::capi::parse_args("answer", names_, 0, 0, 0, args_, nargs_,
+                                               kwnames_, values_))
+                 return nullptr;
+               
+               if (!(true))
+                 return nullptr;
+               return xenoform::capi::call<false>([]() -> float {return 42.0f;});
+             })),
+         METH_FASTCALL | METH_KEYWORDS, R"""(_answer()
+--
+
+)"""},
+        {nullptr, nullptr, 0, nullptr}};
+    xenoform::capi::add_functions(m, functions);
+  }
+
+
+  {
+    static PyMethodDef functions[] = {
+        {"_check",
+         reinterpret_cast<PyCFunction>(reinterpret_cast<void (*)()>(
+             +[](PyObject*, PyObject* const* args_, Py_ssize_t nargs_, PyObject* kwnames_) -> PyObject* {
+               static const char* const names_[] = {"ok", nullptr};
+               PyObject* values_[1 + 1];
+               if (!xenoform::capi::parse_args("check", names_, 1, 0, 1, args_, nargs_,
+                                               kwnames_, values_))
+                 return nullptr;
+               xenoform::capi::arg<bool> arg_ok;
+               if (!(arg_ok.load(values_[0], "check", "ok")))
+                 return nullptr;
+               return xenoform::capi::call<false>([](bool ok) -> bool {if (!ok) throw std::invalid_argument("not ok"); return ok;}, arg_ok.get());
+             })),
+         METH_FASTCALL | METH_KEYWORDS, R"""(_check(ok)
+--
+
+)"""},
+        {nullptr, nullptr, 0, nullptr}};
+    xenoform::capi::add_functions(m, functions);
+  }
+
+
+  {
+    static PyMethodDef functions[] = {
+        {"_clamp",
+         reinterpret_cast<PyCFunction>(reinterpret_cast<void (*)()>(
+             +[](PyObject*, PyObject* const* args_, Py_ssize_t nargs_, PyObject* kwnames_) -> PyObject* {
+               static const char* const names_[] = {"i", "lo", "hi", nullptr};
+               PyObject* values_[3 + 1];
+               if (!xenoform::capi::parse_args("clamp", names_, 3, 3, 3, args_, nargs_,
+                                               kwnames_, values_))
+                 return nullptr;
+               xenoform::capi::arg<int> arg_i;
+               xenoform::capi::arg<int> arg_lo;
+               xenoform::capi::arg<int> arg_hi;
+               if (!(arg_i.load(values_[0], "clamp", "i") && arg_lo.load(values_[1], "clamp", "lo") && arg_hi.load(values_[2], "clamp", "hi")))
+                 return nullptr;
+               return xenoform::capi::call<false>([](int i, int lo, int hi) -> int64_t {return std::clamp<int64_t>(i, lo, hi);}, arg_i.get(), arg_lo.get(), arg_hi.get());
+             })),
+         METH_FASTCALL | METH_KEYWORDS, R"""(_clamp(i, lo, hi, /)
+--
+
+clamp i to [lo, hi])"""},
+        {nullptr, nullptr, 0, nullptr}};
+    xenoform::capi::add_functions(m, functions);
+  }
+
+
+  {
+    static PyMethodDef functions[] = {
+        {"_fill",
+         reinterpret_cast<PyCFunction>(reinterpret_cast<void (*)()>(
+             +[](PyObject*, PyObject* const* args_, Py_ssize_t nargs_, PyObject* kwnames_) -> PyObject* {
+               static const char* const names_[] = {"a", "value", nullptr};
+               PyObject* values_[2 + 1];
+               if (!xenoform::capi::parse_args("fill", names_, 2, 0, 2, args_, nargs_,
+                                               kwnames_, values_))
+                 return nullptr;
+               xenoform::capi::arg<std::span<int32_t>> arg_a;
+               xenoform::capi::arg<int> arg_value;
+               if (!(arg_a.load(values_[0], "fill", "a") && arg_value.load(values_[1], "fill", "value")))
+                 return nullptr;
+               return xenoform::capi::call<false>([](std::span<int32_t> a, int value) -> void {for (auto& x : a) x = value;}, arg_a.get(), arg_value.get());
+             })),
+         METH_FASTCALL | METH_KEYWORDS, R"""(_fill(a, value)
+--
+
+)"""},
+        {nullptr, nullptr, 0, nullptr}};
+    xenoform::capi::add_functions(m, functions);
+  }
+
+
+  {
+    static PyMethodDef functions[] = {
+        {"_score",
+         reinterpret_cast<PyCFunction>(reinterpret_cast<void (*)()>(
+             +[](PyObject*, PyObject* const* args_, Py_ssize_t nargs_, PyObject* kwnames_) -> PyObject* {
+               static const char* const names_[] = {"x", "n", "flag", nullptr};
+               PyObject* values_[3 + 1];
+               if (!xenoform::capi::parse_args("score", names_, 3, 0, 2, args_, nargs_,
+                                               kwnames_, values_))
+                 return nullptr;
+               xenoform::capi::arg<double> arg_x;
+               xenoform::capi::arg<int> arg_n(3);
+               xenoform::capi::arg<bool> arg_flag(false);
+               if (!(arg_x.load(values_[0], "score", "x") && arg_n.load(values_[1], "score", "n") && arg_flag.load(values_[2], "score", "flag")))
+                 return nullptr;
+               return xenoform::capi::call<false>([](double x, int n, bool flag) -> double {return flag ? -x * n : x * n;}, arg_x.get(), arg_n.get(), arg_flag.get());
+             })),
+         METH_FASTCALL | METH_KEYWORDS, R"""(_score(x, n=3, *, flag=False)
+--
+
+)"""},
+        {nullptr, nullptr, 0, nullptr}};
+    xenoform::capi::add_functions(m, functions);
+  }
+
+
+  {
+    static PyMethodDef functions[] = {
+        {"_total",
+         reinterpret_cast<PyCFunction>(reinterpret_cast<void (*)()>(
+             +[](PyObject*, PyObject* const* args_, Py_ssize_t nargs_, PyObject* kwnames_) -> PyObject* {
+               static const char* const names_[] = {"a", nullptr};
+               PyObject* values_[1 + 1];
+               if (!xenoform::capi::parse_args("total", names_, 1, 0, 1, args_, nargs_,
+                                               kwnames_, values_))
+                 return nullptr;
+               xenoform::capi::arg<std::span<const double>> arg_a;
+               if (!(arg_a.load(values_[0], "total", "a")))
+                 return nullptr;
+               return xenoform::capi::call<true>([](std::span<const double> a) -> double {double sum = 0.0; for (double x : a) sum += x; return sum;}, arg_a.get());
+             })),
+         METH_FASTCALL | METH_KEYWORDS, R"""(_total(a)
+--
+
+)"""},
+        {nullptr, nullptr, 0, nullptr}};
+    xenoform::capi::add_functions(m, functions);
+  }
+
+  } catch (const std::exception& e) {
+    Py_DECREF(m);
+    PyErr_SetString(PyExc_ImportError, e.what());
+    return nullptr;
+  }
+  return m;
+}
@@ -0,0 +1,47 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/stl.h>
+#include <pybind11/pybind11.h>
+#include <string>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_compound_types, m) {
+  m.doc() = "test_compound_types module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "82e9cb37e350002bb52b5cfbe481e51e64dc31241f792abfb8c94e2f00766291";
+  
+  m.def("_compound_type", [](std::optional<std::variant<int, double>> x) -> std::string {
+    if (x) {
+        if (std::holds_alternative<int>(x.value())) {
+            return "int";
+        }
+        return "float";
+    }
+    return "empty";
+    }, py::return_value_policy::automatic  , py::arg("x"));
+
+
+
+  m.def("_optional_type", [](std::optional<int> x) -> int {
+    return x ? x.value() : 42;
+    }, py::return_value_policy::automatic  , py::arg("x"));
+
+
+
+  m.def("_union_type", [](const std::variant<int, std::string>& x) -> std::string {
+    return std::holds_alternative<int>(x) ? std::to_string(std::get<int>(x)) : std::get<std::string>(x);
+
+    }, py::return_value_policy::automatic  , py::arg("x"));
+
+
+}
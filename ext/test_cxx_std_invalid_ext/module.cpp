@@ -0,0 +1,24 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 24
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_cxx_std_invalid, m) {
+  m.doc() = "test_cxx_std_invalid module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "6840b8ebc87d3d2b87f7c59c894420584ced3280749556f4fc940c4d9f96e81a";
+  
+  m.def("_test_cxx_std_invalid_f", [](int i) -> bool {return i % 2;}, py::return_value_policy::automatic  , py::arg("i"));
+
+
+}
@@ -0,0 +1,32 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_dispatch, m) {
+  m.doc() = "test_dispatch module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "2a389ccfa6fca9d6b580b002716a239eae9eac2809823103938a29dab84fc673";
+  
+  m.def("_Adder_add", [](py::object self, int i) -> int {
+        return i + 1;
+        }, py::return_value_policy::automatic  , py::arg("self"), py::arg("i"));
+
+
+
+  m.def("_add", [](int i, int j) -> int {
+    return i + j;
+    }, py::return_value_policy::automatic  , py::arg("i"), py::arg("j"));
+
+
+}
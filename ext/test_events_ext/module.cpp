@@ -0,0 +1,24 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_events, m) {
+  m.doc() = "test_events module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "39e51baa8875fdfa7c2b0ec731812c134c67befbaf4427a3682e8e0d8400e788";
+  
+  m.def("_test_register_and_redirect_events_triple", [](int i) -> int {return i * 3;}, py::return_value_policy::automatic  , py::arg("i"));
+
+
+}
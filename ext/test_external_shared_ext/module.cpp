@@ -0,0 +1,27 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: ['../../src/test']
+// extra cxxflags: 
+// extra ldflags: -L../../src/test -lshared -Wl,-rpath=src/test
+
+#include "test_lib.h"
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_external_shared, m) {
+  m.doc() = "test_external_shared module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "c2b71c01ef4bf1a4f9b56e3354b2a35a3af8840fad341743ee4728f49bd94dfd";
+  
+  m.def("_lucas", [](uint64_t n) -> uint64_t {
+    return lucas(n);
+    }, py::return_value_policy::automatic  , py::arg("n"));
+
+
+}
@@ -0,0 +1,27 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: ['../../src/test']
+// extra cxxflags: 
+// extra ldflags: 
+
+#include "test_external_source.cpp"
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_external_source, m) {
+  m.doc() = "test_external_source module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "499db3b8091bfe0a2597a6f27ac7b1bc22b0fced62e215797439599ce487fece";
+  
+  m.def("_external_source", [](int n) -> int {
+    return external_impl(n);
+    }, py::return_value_policy::automatic  , py::arg("n"));
+
+
+}
@@ -0,0 +1,33 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: ['../../src/test']
+// extra cxxflags: 
+// extra ldflags: -L../../src/test -lstatic
+
+#include "test_lib.h"
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_external_static, m) {
+  m.doc() = "test_external_static module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "def92dccc8b9ecf1acd663e0615dbb0b2d9e77407d21db314863e03a854405eb";
+  
+  m.def("_fibonacci", [](uint64_t n) -> uint64_t {
+    return fibonacci(n);
+    }, py::return_value_policy::automatic  , py::arg("n"));
+
+
+
+  m.def("_fibonacci10", []() -> int {
+    return fibonacci_template<10>();
+    }, py::return_value_policy::automatic  );
+
+
+}
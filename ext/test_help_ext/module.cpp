@@ -0,0 +1,29 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_help, m) {
+  m.doc() = "test_help module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "99335f35301601835e53b1080cc77208f81884cc6d57d6a111ec56ce6f86b2ab";
+  
+  m.def("_documented_function", [](int n, double x=3.1) -> double {
+    return n + x;
+    }, py::return_value_policy::automatic , R"""(This is a test function
+used to test the help system
+It is otherwise useless
+)""" , py::arg("n"), py::kw_only(), py::arg("x")=3.1);
+
+
+}
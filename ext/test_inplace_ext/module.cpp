@@ -0,0 +1,61 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_inplace, m) {
+  m.doc() = "test_inplace module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "30ad99edbdd031e50e2fceb87fcc1cf368875b233785b60e9413193c440d10f3";
+  
+  m.def("_modify_bytearray", [](py::bytearray b) -> void {
+    b[py::int_(0)] = 5;
+    }, py::return_value_policy::automatic  , py::arg("b"));
+
+
+
+  m.def("_modify_dict", [](py::dict d) -> void {
+    d[py::int_(0)] = 4;
+    d[py::int_(1)] = 2;
+    }, py::return_value_policy::automatic  , py::arg("d"));
+
+
+
+  m.def("_modify_list", [](py::list lst) -> void {
+    lst.append(0);
+    lst[py::int_(0)] = 5;
+    }, py::return_value_policy::automatic  , py::arg("lst"));
+
+
+
+  m.def("_modify_nparray", [](py::array_t<double> vec) -> void {
+    // Important: ensure the dtype matches the C++ type, otherwise an implicit copy will be made
+    // and in-place modifications will not persist
+    size_t n = vec.size();
+    auto acc = vec.mutable_unchecked<1>();
+
+    for (size_t i = 0; i < n; ++i) {
+        acc(i) *= 2;
+    }
+    }, py::return_value_policy::automatic  , py::arg("vec"));
+
+
+
+  m.def("_modify_set", [](py::set s) -> void {
+    s.add(0);
+    s.add(1);
+    }, py::return_value_policy::automatic  , py::arg("s"));
+
+
+}
@@ -0,0 +1,45 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+#include <string>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_kwargs, m) {
+  m.doc() = "test_kwargs module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "4c85c6d5374fda6d36a4c9fd1c9fce04d293f61abec35f61eb9f1cb7cd3e2ea8";
+  
+  m.def("_f_cpp", [](int n, double x, double y=2.7, bool b=false) -> std::string {
+    return "n=" + std::to_string(n) + " x=" + std::to_string(x) + " y=" + std::to_string(y) + " b=" + std::to_string(b);
+    }, py::return_value_policy::automatic  , py::arg("n"), py::pos_only(), py::arg("x"), py::arg("y")=2.7, py::kw_only(), py::arg("b")=false);
+
+
+
+  m.def("_varargs", [](py::args args) -> int {
+    return args.size();
+    }, py::return_value_policy::automatic  );
+
+
+
+  m.def("_varkwargs", [](const py::kwargs& args) -> int {
+    return args.size();
+    }, py::return_value_policy::automatic  );
+
+
+
+  m.def("_varposkwargs", [](int n, py::args args, int m, const py::kwargs& kwargs) -> int {
+    return args.size() + 10 * kwargs.size() + 100 * n + 1000 * m;
+    }, py::return_value_policy::automatic  , py::arg("n"), py::arg("m"));
+
+
+}
@@ -0,0 +1,26 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_manifest, m) {
+  m.doc() = "test_manifest module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "2677d731658ff3f0cb12a8419e2d6b89266e2b6172321b6998d6981ea25cb2e3";
+  
+  m.def("_answer", []() -> int {
+    return 42;
+    }, py::return_value_policy::automatic  );
+
+
+}
@@ -0,0 +1,56 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+#include <string>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_method, m) {
+  m.doc() = "test_method module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "2da626f9f59f9f9662391e19c976f44cbd2c57995eed8e131669022b626ad2ab";
+  
+  m.def("_ClassB_class_method", [](py::type cls) -> std::string {
+        // extract X from cls arg
+        auto val = cls.attr("X").cast<std::string>();
+        return val;
+        }, py::return_value_policy::automatic  , py::arg("cls"));
+
+
+
+  m.def("_ClassB_method", [](py::object self) -> int {
+        // extract instance variable
+        return self.attr("x").cast<int>();
+        }, py::return_value_policy::automatic  , py::arg("self"));
+
+
+
+  m.def("_ClassB_static_method", [](int i) -> int {
+        return i + 1000;
+        }, py::return_value_policy::automatic  , py::arg("i"));
+
+
+
+  m.def("_ClassC_class_method", [](py::type cls) -> std::string {
+        // extract X from cls arg
+        auto val = cls.attr("X").cast<std::string>();
+        return val;
+        }, py::return_value_policy::automatic  , py::arg("cls"));
+
+
+
+  m.def("_ClassC_method", [](py::object self) -> int {
+        return 3;
+        }, py::return_value_policy::automatic  , py::arg("self"));
+
+
+}
@@ -0,0 +1,26 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_nested, m) {
+  m.doc() = "test_nested module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "9d89b99e71a0a010a27be65380fb61cb60c18c4d07e7fabf0f82ec7424c0a2ac";
+  
+  m.def("_outer_inner", [](double x, int i) -> double {
+        return x * i;
+        }, py::return_value_policy::automatic  , py::arg("x"), py::arg("i"));
+
+
+}
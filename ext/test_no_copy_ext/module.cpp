@@ -0,0 +1,63 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/numpy.h>
+#include <xenoform/arrays.h>
+#include <xenoform/stats.h>
+#include <xenoform/span.h>
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_no_copy, m) {
+  m.doc() = "test_no_copy module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "80be851949a9bffa4ecf7d6f8bfcb33315339f7e3858219e786ae438d9a32c4d";
+  
+  m.def("_first", [](py::array_t<double> données) -> double {return données.at(0);}, py::return_value_policy::automatic  , py::arg("données"));
+
+
+{
+  static constexpr char xenoform_a_name[] = "double.a";
+  xenoform::register_array_copies(m);
+
+  m.def("_double", xenoform::instrument(m, "double", [](xenoform::array_arg<py::array_t<double>, false, xenoform_a_name> a) -> void {auto acc = a.mutable_unchecked<1>(); for (py::ssize_t i = 0; i < acc.shape(0); ++i) acc(i) *= 2;}), py::return_value_policy::automatic  , py::arg("a"));
+
+}
+{
+  static constexpr char xenoform_a_name[] = "double_strict.a";
+  xenoform::register_array_copies(m);
+
+  m.def("_double_strict", [](xenoform::array_arg<py::array_t<double>, true, xenoform_a_name> a) -> void {auto acc = a.mutable_unchecked<1>(); for (py::ssize_t i = 0; i < acc.shape(0); ++i) acc(i) *= 2;}, py::return_value_policy::automatic  , py::arg("a"));
+
+}
+{
+  static constexpr char xenoform_a_name[] = "total.a";
+  xenoform::register_array_copies(m);
+
+  m.def("_total", xenoform::instrument(m, "total", [](xenoform::array_arg<xenoform::mdspan<const double, 2>, false, xenoform_a_name> a) -> double {double sum = 0.0; for (size_t i = 0; i < a.size(); ++i) sum += a.data_handle()[i]; return sum;}), py::return_value_policy::automatic  , py::arg("a"));
+
+}
+{
+  static constexpr char xenoform_a_name[] = "total_strict.a";
+  xenoform::register_array_copies(m);
+
+  m.def("_total_strict", [](xenoform::array_arg<std::span<const double>, true, xenoform_a_name> a) -> double {double sum = 0.0; for (double x : a) sum += x; return sum;}, py::return_value_policy::automatic  , py::arg("a"));
+
+}
+{
+  static constexpr char xenoform_données_name[] = "first_strict.données";
+  xenoform::register_array_copies(m);
+
+  m.def("_first_strict", [](xenoform::array_arg<py::array_t<double>, true, xenoform_données_name> données) -> double {return données.at(0);}, py::return_value_policy::automatic  , py::arg("données"));
+
+}
+}
@@ -0,0 +1,41 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_numpy, m) {
+  m.doc() = "test_numpy module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "9c4d49ca31c44b3e9c6635ab97caee606f908d306b6a11a33f7481de7a8dd336";
+  
+  m.def("_by_ref", [](py::array_t<double>& a) -> void {
+    auto r = a.mutable_unchecked<2>();
+    r(0, 0) = 1.0;
+    }, py::return_value_policy::automatic  , py::arg("a"));
+
+
+
+  m.def("_by_val", [](py::array_t<double> a) -> void {
+    auto r = a.mutable_unchecked<2>();
+    r(0, 0) = 1.0;
+    }, py::return_value_policy::automatic  , py::arg("a"));
+
+
+
+  m.def("_specify_int_bits", [](py::array_t<int32_t> a) -> int64_t {
+    return a.ndim();
+    }, py::return_value_policy::automatic  , py::arg("a"));
+
+
+}
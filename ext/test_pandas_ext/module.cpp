@@ -0,0 +1,59 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <xenoform/pandas.h>
+#include <pybind11/pybind11.h>
+#include <numeric>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_pandas, m) {
+  m.doc() = "test_pandas module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "38880c5d94b62cb55afebe520d99dcfdb74810f0c9bcf2c54a17aef5b6f6fd76";
+  
+  m.def("_cumsum", [](xenoform::series<const double> s) -> xenoform::series<double> {
+    auto result = xenoform::series<double>::like(s);
+    double total = 0.0;
+    for (size_t i = 0; i < s.size(); ++i) result[i] = total += s[i];
+    return result;
+    }, py::return_value_policy::automatic  , py::arg("s"));
+
+
+
+  m.def("_passthrough", [](xenoform::series<const int64_t> s) -> xenoform::series<const int64_t> {return s;}, py::return_value_policy::automatic  , py::arg("s"));
+
+
+
+  m.def("_row_sums", [](xenoform::frame<const double> df) -> xenoform::series<double> {
+    auto result = xenoform::series<double>(df.index(), df.rows());
+    for (size_t i = 0; i < df.rows(); ++i) {
+      result[i] = 0.0;
+      for (size_t j = 0; j < df.cols(); ++j) result[i] += df(i, j);
+    }
+    return result;
+    }, py::return_value_policy::automatic  , py::arg("df"));
+
+
+
+  m.def("_scaled", [](xenoform::frame<const int32_t> df, int k) -> xenoform::frame<double> {
+    auto result = xenoform::frame<double>::like(df);
+    for (size_t j = 0; j < df.cols(); ++j)
+      for (size_t i = 0; i < df.rows(); ++i) result(i, j) = k * df(i, j);
+    return result;
+    }, py::return_value_policy::automatic  , py::arg("df"), py::arg("k"));
+
+
+
+  m.def("_total", [](xenoform::series<const double> s) -> double {return std::accumulate(s.begin(), s.end(), 0.0);}, py::return_value_policy::automatic  , py::arg("s"));
+
+
+}
@@ -0,0 +1,43 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: XENOFORM_PARALLEL_THRESHOLD=1000
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <xenoform/vectorize.h>
+#include <pybind11/pybind11.h>
+#include <cmath>
+#include <stdexcept>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_parallel, m) {
+  m.doc() = "test_parallel module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "926ac7d244dde4fadb21f0b91e6518d98f3a6fae7780def293ed4c28f26d475a";
+  
+  m.def("_checked_sqrt", [](double x) -> double {
+    if (x < 0.0) throw std::domain_error("negative");
+    return std::sqrt(x);
+    }, py::return_value_policy::automatic  , py::arg("x").noconvert());
+
+
+  m.def("_checked_sqrt", xenoform::parallel_vectorize([](double x) -> double {
+    if (x < 0.0) throw std::domain_error("negative");
+    return std::sqrt(x);
+    }), py::return_value_policy::automatic  , py::arg("x"));
+
+
+
+  m.def("_maxp", [](int i, int j) -> int {return i < j ? j : i;}, py::return_value_policy::automatic  , py::arg("i").noconvert(), py::arg("j").noconvert());
+
+
+  m.def("_maxp", xenoform::parallel_vectorize([](int i, int j) -> int {return i < j ? j : i;}), py::return_value_policy::automatic  , py::arg("i"), py::arg("j"));
+
+
+}
@@ -0,0 +1,24 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: release
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_profiles, m) {
+  m.doc() = "test_profiles module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "55026b553f967f04e735e6f56dc567e89fdb9694f885eec034d8b911780dade8";
+  
+  m.def("_add", [](int i, int j) -> int {return i + j;}, py::return_value_policy::automatic  , py::arg("i"), py::arg("j"));
+
+
+}
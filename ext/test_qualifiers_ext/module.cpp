@@ -0,0 +1,50 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/stl.h>
+#include <pybind11/pybind11.h>
+#include <numeric>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_qualifiers, m) {
+  m.doc() = "test_qualifiers module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "b01b5e393b9b9b78937e8aca7ff9110519ad87ec7e4fbf916abc911eb3fee531";
+  
+  m.def("_vector_sum_using_cptrc", [](const std::vector<int>* const v) -> int {
+    return std::accumulate(v->begin(), v->end(), 0);
+    }, py::return_value_policy::automatic  , py::arg("v"));
+
+
+
+  m.def("_vector_sum_using_cref", [](const std::vector<int>& v) -> int {
+    return std::accumulate(v.begin(), v.end(), 0);
+    }, py::return_value_policy::automatic  , py::arg("v"));
+
+
+
+  m.def("_vector_sum_using_py", [](py::list v) -> int {
+    int sum = 0;
+    for (py::handle item: v) {
+      sum += item.cast<int>(); // needs type checking
+    }
+    return sum;
+    }, py::return_value_policy::automatic  , py::arg("v"));
+
+
+
+  m.def("_vector_sum_using_rref", [](std::vector<int>&& v) -> int {
+    return std::accumulate(v.begin(), v.end(), 0);
+    }, py::return_value_policy::automatic  , py::arg("v"));
+
+
+}
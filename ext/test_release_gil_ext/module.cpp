@@ -0,0 +1,39 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+#include <chrono>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_release_gil, m) {
+  m.doc() = "test_release_gil module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "0970c3ceb9c61eb79f531cc289040e845388903ec28a0cb6cfa41817272f885e";
+  
+  m.def("_busy_wait", [](int ms) -> int {
+    auto end = std::chrono::steady_clock::now() + std::chrono::milliseconds(ms);
+    while (std::chrono::steady_clock::now() < end) {}
+    return ms;
+    }, py::return_value_policy::automatic, py::call_guard<py::gil_scoped_release>()  , py::arg("ms"));
+
+
+
+  m.def("_total", [](const py::array_t<double>& a) -> double {
+    auto r = a.unchecked<1>();
+    double sum = 0.0;
+    for (py::ssize_t i = 0; i < r.shape(0); ++i) sum += r(i);
+    return sum;
+    }, py::return_value_policy::automatic, py::call_guard<py::gil_scoped_release>()  , py::arg("a"));
+
+
+}
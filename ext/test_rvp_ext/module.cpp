@@ -0,0 +1,26 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_rvp, m) {
+  m.doc() = "test_rvp module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "d2d816b1f5006b70fc71d7fb364a0b08df8f8d6b82163dce2d8874424daa50ec";
+  
+  m.def("_rvp_function", [](int a, int b) -> double {
+    return a + b;
+    }, py::return_value_policy::reference  , py::arg("a"), py::arg("b"));
+
+
+}
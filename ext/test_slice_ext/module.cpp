@@ -0,0 +1,58 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/stl.h>
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+#include <string>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_slice, m) {
+  m.doc() = "test_slice module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "7daa0c40ea4c6c3d98ff5eae8f3522f4bdbe755278527401ce8e8d891cdf7b64";
+  
+  m.def("_explicit_ellipsis", [](std::variant<int, py::slice, py::ellipsis> a) -> std::string {
+    if (std::get_if<int>(&a)) {
+        return "int";
+    } else if (std::get_if<py::slice>(&a)) {
+        return "slice";
+    } else if (std::get_if<py::ellipsis>(&a)) {
+        return "ellipsis";
+    }
+    throw py::type_error("invalid arg type");
+    }, py::return_value_policy::automatic  , py::arg("a"));
+
+
+
+  m.def("_parse_slice", [](int length, py::slice s) -> std::vector<int> {
+    py::ssize_t start = 0, stop = 0, step = 0, slice_length = 0;
+    if (!s.compute(10, &start, &stop, &step, &slice_length)) {
+        throw py::error_already_set();
+    }
+    std::vector<int> indices;
+    indices.reserve(slice_length);
+    for (py::ssize_t i = 0; i < slice_length; ++i) {
+        indices.push_back(start + i * step);
+    }
+    return indices;
+    }, py::return_value_policy::automatic  , py::arg("length"), py::arg("s"));
+
+
+
+  m.def("_slice_shape", [](py::array_t<double> a, py::args indices) -> std::vector<int> {
+    py::array slice = a[indices];
+    return std::vector<int>(slice.shape(), slice.shape() + slice.ndim());
+    }, py::return_value_policy::automatic  , py::arg("a"));
+
+
+}
@@ -0,0 +1,33 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_specialisations, m) {
+  m.doc() = "test_specialisations module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "9c794da47e5a78a8d1df88b5c5d9e091952351dc8badeb7badc2f65a5b5152ec";
+  
+  m.def("_len_bytes", [](py::bytes a) -> std::size_t {
+    py::buffer_info info(py::buffer(a).request());
+    return static_cast<std::size_t>(info.size);
+    }, py::return_value_policy::automatic  , py::arg("a"));
+
+
+
+  m.def("_len_byteseq", [](py::buffer a) -> std::size_t {
+    return static_cast<std::size_t>(a.request().size);
+    }, py::return_value_policy::automatic  , py::arg("a"));
+
+
+}
@@ -0,0 +1,45 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <xenoform/stats.h>
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_stats, m) {
+  m.doc() = "test_stats module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "b55bb7300fa9a0ccbffd0a42aae4bc5b597adbea1e14633a61eb039d2cd95a7a";
+  
+  m.def("_count", xenoform::instrument(m, "count", [](int n) -> int {
+    int total = 0;
+    for (int i = 0; i < n; ++i) total += i % 3;
+    return total;
+    }), py::return_value_policy::automatic  , py::arg("n"));
+
+
+
+  m.def("_nogil", xenoform::instrument(m, "nogil", [](int x) -> int {return x + 1;}), py::return_value_policy::automatic, py::call_guard<py::gil_scoped_release>()  , py::arg("x"));
+
+
+
+  m.def("_plain", [](int x) -> int {return x;}, py::return_value_policy::automatic  , py::arg("x"));
+
+
+
+  m.def("_square", xenoform::instrument(m, "square", [](double x) -> double {return x * x;}), py::return_value_policy::automatic  , py::arg("x").noconvert());
+
+
+  m.def("_square", xenoform::instrument(m, "square", py::vectorize([](double x) -> double {return x * x;})), py::return_value_policy::automatic  , py::arg("x"));
+
+
+}
@@ -0,0 +1,54 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/stl.h>
+#include <pybind11/pybind11.h>
+#include <numeric>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_stl, m) {
+  m.doc() = "test_stl module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "4e816580236611183a6183c134cd5ea57061278b51daf983a24cd47dc86b5b70";
+  
+  m.def("_frozenset_length", [](const std::unordered_set<int> s) -> int {
+    // s.insert(5);
+    return s.size();
+    }, py::return_value_policy::automatic  , py::arg("s"));
+
+
+
+  m.def("_map_sum", [](std::unordered_map<int, int> d) -> int {
+    return std::accumulate(d.begin(), d.end(), 0, [](int value, std::pair<int,int> p) { return value + p.second; });
+    }, py::return_value_policy::automatic  , py::arg("d"));
+
+
+
+  m.def("_set_sum", [](std::unordered_set<int> s) -> int {
+    return std::accumulate(s.begin(), s.end(), 0);
+    }, py::return_value_policy::automatic  , py::arg("s"));
+
+
+
+  m.def("_tuple_sum", [](std::tuple<int, int, int, int> t4) -> int {
+    // summing a C++ tuple is not straightforward
+    return std::get<0>(t4) + std::get<1>(t4) + std::get<2>(t4) + std::get<3>(t4);
+    }, py::return_value_policy::automatic  , py::arg("t4"));
+
+
+
+  m.def("_vector_sum", [](std::vector<int> v) -> int {
+    return std::accumulate(v.begin(), v.end(), 0);
+    }, py::return_value_policy::automatic  , py::arg("v"));
+
+
+}
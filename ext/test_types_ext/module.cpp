@@ -0,0 +1,37 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+#include <functional>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_types, m) {
+  m.doc() = "test_types module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "8b94a10372cbd7b1fdbf7f0c1db98adf344a4654ddfba7fa33e4b653a8a13fab";
+  
+  m.def("_fibonacci", [](uint64_t n) -> uint64_t {
+    // Since this function body is put into an anonymous lambda, it cannot be called recursively.
+    // Workaround: put the recursive implementation into a named lambda that captures its scope and call this
+    // (NB cannot use auto for type deduction in this case)
+
+    std::function<uint64_t(uint64_t)> impl = [&impl](uint64_t n) -> uint64_t {
+        if (n < 2) {
+            return n;
+        }
+        return impl(n - 2) + impl(n - 1);
+    };
+    return impl(n);
+    }, py::return_value_policy::automatic  , py::arg("n"));
+
+
+}
@@ -0,0 +1,27 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+#include <string>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_typing, m) {
+  m.doc() = "test_typing module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "ea61eca827af270aa0ef76ca3b820c9e0cf36553fe750eeec07c16367750aba0";
+  
+  m.def("_f", [](int i, double x, bool b) -> std::string {
+    return "hello";
+    }, py::return_value_policy::automatic  , py::arg("i"), py::arg("x"), py::kw_only(), py::arg("b"));
+
+
+}
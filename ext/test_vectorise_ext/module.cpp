@@ -0,0 +1,28 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_vectorise, m) {
+  m.doc() = "test_vectorise module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "6997a4a1bee93cf95951f6fb81b2324506cef7c1e8b6df14dcc524a096502cb5";
+  
+  m.def("_maxv", [](int i, int j) -> int {return i < j ? j : i;}, py::return_value_policy::automatic  , py::arg("i").noconvert(), py::arg("j").noconvert());
+
+
+  m.def("_maxv", py::vectorize([](int i, int j) -> int {return i < j ? j : i;}), py::return_value_policy::automatic  , py::arg("i"), py::arg("j"));
+
+
+}
@@ -0,0 +1,26 @@
+
+// generated by xenoform 0.1.3
+// cxx_std: 20
+// profile: default
+// pgo: None
+// defines: 
+// extra include paths: []
+// extra cxxflags: 
+// extra ldflags: 
+
+#include <pybind11/pybind11.h>
+
+
+namespace py = pybind11;
+using namespace py::literals;
+
+PYBIND11_MODULE(test_warmup, m) {
+  m.doc() = "test_warmup module generated by xenoform 0.1.3";
+  m.attr("__checksum__") = "7474907580ff372b1ca10a756e5533a09e26fe2657ca4097b1ead213fb02284d";
+  
+  m.def("_warm", [](int i) -> int {
+    return i + 1;
+    }, py::return_value_policy::automatic  , py::arg("i"));
+
+
+}
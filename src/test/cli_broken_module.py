@@ -0,0 +1,10 @@
+from xenoform import compile
+
+# used by test_cli, deliberately doesn't compile
+
+
+@compile()
+def broken() -> int:  # type: ignore[empty-body]
+    """
+    return undefined_variable;
+    """
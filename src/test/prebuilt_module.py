@@ -0,0 +1,10 @@
+from xenoform import compile
+
+# imported by test_warmup with prebuilding enabled
+
+
+@compile()
+def prebuilt(i: int) -> int:  # type: ignore[empty-body]
+    """
+    return i * 2;
+    """
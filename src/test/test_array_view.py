@@ -0,0 +1,105 @@
+from typing import Annotated
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from xenoform import ArrayView, CppTypeError, compile
+from xenoform.types import translate_type
+from xenoform.utils import gil_unsafe_args
+
+
+@compile()
+def total(a: Annotated[npt.NDArray[np.float64], ArrayView()]) -> float:  # type: ignore[empty-body]
+    """
+    double sum = 0.0;
+    for (double x : a) sum += x;
+    return sum;
+    """
+
+
+@compile()
+def scale(a: Annotated[npt.NDArray[np.float64], ArrayView(mutable=True)], k: float) -> None:
+    "for (double& x : a) x *= k;"
+
+
+@compile(release_gil=True)
+def trace(m: Annotated[npt.NDArray[np.int64], ArrayView(2)]) -> int:  # type: ignore[empty-body]
+    """
+    int64_t sum = 0;
+    for (size_t i = 0; i < std::min(m.extent(0), m.extent(1)); ++i) sum += m(i, i);
+    return sum;
+    """
+
+
+@compile()
+def fill(t: Annotated[npt.NDArray[np.int32], ArrayView(3, mutable=True)]) -> None:
+    """
+    for (size_t i = 0; i < t.extent(0); ++i)
+      for (size_t j = 0; j < t.extent(1); ++j)
+        for (size_t k = 0; k < t.extent(2); ++k)
+          t(i, j, k) = 100 * i + 10 * j + k;
+    """
+
+
+def test_translate() -> None:
+    assert str(translate_type(Annotated[npt.NDArray[np.float64], ArrayView()])) == "std::span<const double>"  # type: ignore[arg-type]
+    assert (
+        str(translate_type(Annotated[npt.NDArray[np.float32], ArrayView(2, mutable=True)]))  # type: ignore[arg-type]
+        == "xenoform::mdspan<float, 2>"
+    )
+    assert translate_type(Annotated[npt.NDArray[np.float64], ArrayView()]).headers({"std::span": "<span.h>"}) == [  # type: ignore[arg-type]
+        "<span.h>"
+    ]
+    with pytest.raises(CppTypeError):
+        translate_type(Annotated[list[float], ArrayView()])  # type: ignore[arg-type]
+    with pytest.raises(CppTypeError):
+        ArrayView(0)
+    # views aren't python objects, so are safe to use without the GIL
+    assert not gil_unsafe_args(trace)
+
+
+def test_span() -> None:
+    a = np.arange(5, dtype=np.float64)
+    assert total(a) == 10.0
+    # const views convert, e.g. ints, lists and non-contiguous arrays
+    assert total(np.arange(5)) == 10.0  # type: ignore[arg-type]
+    assert total([1.0, 2.0]) == 3.0  # type: ignore[arg-type]
+    assert total(a[::2]) == 6.0
+    with pytest.raises(TypeError):
+        total(np.ones((2, 2)))
+
+
+def test_mutable_span() -> None:
+    a = np.arange(4, dtype=np.float64)
+    scale(a, 2.0)
+    assert np.array_equal(a, [0.0, 2.0, 4.0, 6.0])
+    # mutable views must not be copies
+    with pytest.raises(TypeError):
+        scale(np.arange(4), 2.0)  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        scale(a[::2], 2.0)
+    a.flags.writeable = False
+    with pytest.raises(TypeError):
+        scale(a, 2.0)
+
+
+def test_mdspan() -> None:
+    m = np.arange(12).reshape(3, 4)
+    assert trace(m) == 0 + 5 + 10
+    assert trace(np.asfortranarray(m)) == 15
+    with pytest.raises(TypeError):
+        trace(np.arange(3))
+
+    t = np.zeros((2, 3, 4), dtype=np.int32)
+    fill(t)
+    assert t[1, 2, 3] == 123
+    assert t[0, 1, 2] == 12
+
+
+def test_return_view() -> None:
+    with pytest.raises(CppTypeError):
+
+        @compile()
+        def f() -> Annotated[npt.NDArray[np.float64], ArrayView()]:  # type: ignore[empty-body]
+            "return {};"
@@ -4,7 +4,8 @@ from typing import Annotated, Any
 import pytest
 
 from xenoform import CompilationError, CppTypeError, Platform, platform_specific
-from xenoform.compile import _check_build_fetch_module_impl, _parse_macros, compile
+from xenoform.build import _parse_macros
+from xenoform.compile import _check_build_fetch_module_impl, compile
 from xenoform.cppmodule import FunctionSpec, ModuleSpec, ReturnValuePolicy
 from xenoform.types import CppQualifier
 from xenoform.utils import translate_function_signature
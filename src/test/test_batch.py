@@ -0,0 +1,100 @@
+import itertools
+from typing import Annotated, Self
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from xenoform import CppQualifier, compile, starmap, stats
+
+
+@compile(batch=True)
+def describe(name: str, count: int | None, scale: float = 1.0) -> str:  # type: ignore[empty-body]
+    "return name + ':' + (count ? std::to_string(static_cast<int>(*count * scale)) : std::string(\"none\"));"
+
+
+@compile(batch=True, vectorise=True)
+def add(i: float, j: float) -> float:  # type: ignore[empty-body]
+    "return i + j;"
+
+
+@compile(batch=True, instrument=True)
+def total(a: npt.NDArray[np.float64]) -> float:  # type: ignore[empty-body]
+    "auto acc = a.unchecked<1>(); double sum = 0.0; for (py::ssize_t i = 0; i < acc.shape(0); ++i) sum += acc(i); return sum;"
+
+
+@compile(batch=True)
+def append(values: Annotated[list[int], CppQualifier.Ref], value: int) -> None:
+    "values.push_back(value);"
+
+
+@compile()
+def unbatched(i: int) -> int:  # type: ignore[empty-body]
+    "return i;"
+
+
+class Counter:
+    @compile(batch=True)
+    def scaled(self: Self, k: int) -> int:  # type: ignore[empty-body]
+        'return k * self.attr("n").cast<int>();'
+
+    n = 3
+
+
+def test_starmap() -> None:
+    items = [("a", 1, 2.0), ("b", None, 1.0), ("c", 3, 0.5)]
+    assert starmap(describe, items) == ["a:2", "b:none", "c:1"]
+    assert starmap(describe, items) == list(itertools.starmap(describe, items))
+    # any iterable, after the stub has been replaced (which keeps the batched entry point), or of the compiled function
+    assert hasattr(describe, "_xenoform_batch")
+    assert starmap(describe, (("d", i, 1.0) for i in range(2))) == ["d:0", "d:1"]
+    assert starmap(describe.func, [("e", 2, 1.0)]) == ["e:2"]  # type: ignore[attr-defined]
+    assert starmap(describe, []) == []
+
+
+def test_starmap_vectorised() -> None:
+    # the batch calls the scalar function
+    assert starmap(add, [(1.0, 2.0), (3, 4)]) == [3.0, 7.0]
+    assert (add(np.ones(2), 1.0) == 2.0).all()  # type: ignore[arg-type, attr-defined]
+
+
+def test_starmap_errors() -> None:
+    # all arguments must be given
+    with pytest.raises(TypeError, match="batch item 1: expected a tuple of 3 argument"):
+        starmap(describe, [("a", 1, 1.0), ("b", 1)])
+    with pytest.raises(TypeError, match="batch item 0: expected a tuple"):
+        starmap(describe, ["abc"])  # type: ignore[list-item]
+    with pytest.raises(TypeError, match=r"batch item 0: argument 1 \(str\) could not be converted"):
+        starmap(describe, [("a", "1", 1.0)])
+    with pytest.raises(ValueError, match="unbatched is not a function compiled with batch=True"):
+        starmap(unbatched, [(1,)])
+    with pytest.raises(ValueError):
+        starmap(len, [([1],)])
+
+
+def test_starmap_arrays_and_stats() -> None:
+    arrays = [(np.full(n, 1.0),) for n in range(5)]
+    before = stats().get("test_batch.total")
+    assert starmap(total, arrays) == [0.0, 1.0, 2.0, 3.0, 4.0]
+    # each call is counted
+    assert stats()["test_batch.total"].calls == (before.calls if before else 0) + 5
+
+
+def test_starmap_void_and_references() -> None:
+    values: list[int] = []
+    # converted (i.e. copied) arguments, so the list itself is unchanged
+    assert starmap(append, [(values, 1), (values, 2)]) == [None, None]
+    assert values == []
+
+
+def test_starmap_method() -> None:
+    counter = Counter()
+    assert starmap(Counter.scaled, [(counter, 1), (counter, 2)]) == [3, 6]
+
+
+def test_batch_options() -> None:
+    with pytest.raises(ValueError, match="batch cannot be used with"):
+
+        @compile(batch=True)
+        def f(*args: int) -> int:  # type: ignore[empty-body]
+            "return 0;"
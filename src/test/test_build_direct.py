@@ -0,0 +1,152 @@
+import importlib
+import io
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TextIO
+
+import pytest
+
+from xenoform import CompilationError
+from xenoform.build import build_direct, compile_flags, link_flags
+from xenoform.compile import _check_build_fetch_module_impl, module_root_dir
+from xenoform.cppmodule import FunctionSpec, ModuleSpec, ReturnValuePolicy
+
+build_module = importlib.import_module("xenoform.build")
+
+if platform.system() == "Windows":
+    pytest.skip("direct build backend not supported on windows", allow_module_level=True)
+
+
+def _spec(body: str) -> ModuleSpec:
+    return ModuleSpec().add_function(
+        FunctionSpec(
+            name="f",
+            body=body,
+            arg_annotations=', py::arg("i")',
+            scope=(),
+            return_value_policy=ReturnValuePolicy.Automatic,
+        ),
+        define_macros=["OFFSET=1"],
+        cxx_std=17,
+    )
+
+
+def test_flags() -> None:
+    spec = _spec("")
+    flags = compile_flags(spec)
+    assert "-std=c++17" in flags
+    assert "-DOFFSET=1" in flags
+    assert "-fvisibility=hidden" in flags
+    assert link_flags(ModuleSpec(extra_link_args=["-lm", "-lm"])).count("-lm") == 1
+
+
+def test_flags_macos(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(platform, "system", lambda: "Darwin")
+    assert "-stdlib=libc++" in compile_flags(_spec(""))
+    assert link_flags(_spec(""))[:3] == ["-bundle", "-undefined", "dynamic_lookup"]
+
+
+def test_direct_build_windows(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(platform, "system", lambda: "Windows")
+    with pytest.raises(CompilationError):
+        build_direct("windows_module", module_root_dir, _spec(""))
+
+
+def test_direct_build(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XENOFORM_BUILD_BACKEND", "direct")
+    module = _check_build_fetch_module_impl("direct_module", _spec("[](int i) -> int { return i + OFFSET; }"))
+    assert module._f(1) == 2
+
+
+def test_direct_build_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XENOFORM_BUILD_BACKEND", "direct")
+    with pytest.raises(CompilationError):
+        _check_build_fetch_module_impl("broken_direct_module", _spec("[](int i) -> int {\n#error\n}"))
+
+
+def test_precompiled_header(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XENOFORM_BUILD_BACKEND", "direct")
+    _check_build_fetch_module_impl("direct_module_pch1", _spec("[](int i) -> int { return i + 1; }"))
+    pch_dirs = set((module_root_dir / "_pch").iterdir())
+    assert pch_dirs
+    assert "-include" in (module_root_dir / "direct_module_pch1_ext" / "build.log").read_text()
+    # a module with the same headers and flags reuses the same precompiled header
+    _check_build_fetch_module_impl("direct_module_pch2", _spec("[](int i) -> int { return i + 2; }"))
+    assert set((module_root_dir / "_pch").iterdir()) == pch_dirs
+
+
+def test_no_precompiled_header(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XENOFORM_BUILD_BACKEND", "direct")
+    monkeypatch.setenv("XENOFORM_PRECOMPILED_HEADERS", "false")
+    module = _check_build_fetch_module_impl("direct_module_nopch", _spec("[](int i) -> int { return i + 3; }"))
+    assert module._f(1) == 4
+    assert "-include" not in (module_root_dir / "direct_module_nopch_ext" / "build.log").read_text()
+
+
+def test_precompiled_header_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XENOFORM_BUILD_BACKEND", "direct")
+    monkeypatch.setenv("CPPFLAGS", "-DPCH_FAILURE_TEST")  # so that the header isn't already cached
+    run = build_module._run
+
+    def fail_header(cmd: list[str], log: TextIO) -> int:
+        if "c++-header" in cmd:
+            raise CompilationError("header")
+        return int(run(cmd, log))
+
+    # not fatal, the module is compiled without it
+    monkeypatch.setattr(build_module, "_run", fail_header)
+    module = _check_build_fetch_module_impl("direct_module_pch_fail", _spec("[](int i) -> int { return i + 4; }"))
+    assert module._f(1) == 5
+    assert "-include" not in (module_root_dir / "direct_module_pch_fail_ext" / "build.log").read_text()
+
+
+def test_compiler_slots(monkeypatch: pytest.MonkeyPatch) -> None:
+    # build_workers limits the compiler processes running at once, however many threads (e.g. building different
+    # modules) start them
+    monkeypatch.setenv("XENOFORM_BUILD_WORKERS", "2")
+    cmd = [sys.executable, "-c", "import time; time.sleep(0.5)"]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: build_module._run(cmd, io.StringIO()), range(4)))
+    assert time.perf_counter() - start >= 1.0
+
+
+def _two_function_spec(g_body: str) -> ModuleSpec:
+    spec = ModuleSpec()
+    for name, body in [("f", "[](int i) -> int { return i + 1; }"), ("g", g_body)]:
+        spec.add_function(
+            FunctionSpec(
+                name=name,
+                body=body,
+                arg_annotations=', py::arg("i")',
+                scope=(),
+                return_value_policy=ReturnValuePolicy.Automatic,
+            )
+        )
+    return spec
+
+
+def test_incremental_build(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XENOFORM_BUILD_BACKEND", "direct")
+    monkeypatch.setenv("XENOFORM_INCREMENTAL_BUILD", "true")
+    obj_dir = module_root_dir / "incremental_module_ext" / "obj"
+
+    module = _check_build_fetch_module_impl("incremental_module", _two_function_spec("[](int i) { return i * 2; }"))
+    assert module._f(1) == 2
+    assert module._g(2) == 4
+    objects = {obj.name.split("-")[0]: obj.name for obj in obj_dir.iterdir()}
+    assert set(objects) == {"module", "_f", "_g"}
+
+    # editing one function only recompiles that function (and the module definition, which contains the checksum)
+    _check_build_fetch_module_impl("incremental_module", _two_function_spec("[](int i) { return i * 3; }"))
+    new_objects = {obj.name.split("-")[0]: obj.name for obj in obj_dir.iterdir()}
+    assert new_objects["_f"] == objects["_f"]
+    assert new_objects["_g"] != objects["_g"]
+    assert new_objects["module"] != objects["module"]
+
+
+def test_cannot_split() -> None:
+    assert _spec("").can_split()
+    assert not ModuleSpec(headers=['"inline.cpp"']).can_split()
@@ -0,0 +1,225 @@
+import inspect
+import platform
+import shutil
+from typing import Annotated, Any
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from xenoform import AnnotationError, ArrayView, CppTypeError, compile
+from xenoform.capi import capi_signature
+from xenoform.compile import _check_build_fetch_module_impl, _module_registry, module_root_dir
+from xenoform.cppmodule import FunctionSpec, ModuleSpec, ReturnValuePolicy
+
+
+@compile(binding="capi")
+def score(x: float, n: int = 3, *, flag: bool = False) -> float:  # type: ignore[empty-body]
+    "return flag ? -x * n : x * n;"
+
+
+@compile(binding="capi", extra_includes=["<algorithm>"], help="clamp i to [lo, hi]")
+def clamp(i: int, lo: int, hi: int, /) -> np.int64:  # type: ignore[empty-body]
+    "return std::clamp<int64_t>(i, lo, hi);"
+
+
+@compile(binding="capi", release_gil=True)
+def total(a: Annotated[npt.NDArray[np.float64], ArrayView()]) -> float:  # type: ignore[empty-body]
+    "double sum = 0.0; for (double x : a) sum += x; return sum;"
+
+
+@compile(binding="capi")
+def fill(a: Annotated[npt.NDArray[np.int32], ArrayView(mutable=True)], value: int) -> None:
+    "for (auto& x : a) x = value;"
+
+
+@compile(binding="capi")
+def check(ok: bool) -> bool:  # type: ignore[empty-body]
+    'if (!ok) throw std::invalid_argument("not ok"); return ok;'
+
+
+@compile(binding="capi")
+def answer() -> np.float32:  # type: ignore[empty-body]
+    "return 42.0f;"
+
+
+def test_translate() -> None:
+    def f(a: Annotated[npt.NDArray[np.float64], ArrayView()], k: int = 2, /, *, b: bool = True) -> float:  # type: ignore[empty-body]
+        pass
+
+    signature = capi_signature(f)
+    assert signature.lambda_signature() == "[](std::span<const double> a, int k, bool b) -> double"
+    assert signature.args[1].default == "2"
+    assert signature.args[2].default == "true"
+    assert (signature.pos_only, signature.max_positional) == (2, 2)
+    assert signature.text_signature == "(a, k=2, /, *, b=True)"
+
+    def g(s: str) -> None:
+        pass
+
+    def h(a: npt.NDArray[np.float64]) -> None:
+        pass
+
+    def i(x: Annotated[float, "uint64_t"]) -> Annotated[npt.NDArray[np.float64], ArrayView()]:  # type: ignore[empty-body]
+        pass
+
+    def j(*args: int) -> None:
+        pass
+
+    for func in (g, h, i):
+        with pytest.raises(CppTypeError):
+            capi_signature(func)
+    with pytest.raises(AnnotationError):
+        capi_signature(j)
+
+
+def test_options() -> None:
+    with pytest.raises(ValueError, match="binding must be"):
+
+        @compile(binding="ctypes")  # type: ignore[arg-type]
+        def g(x: float) -> float:  # type: ignore[empty-body]
+            "return x;"
+
+    options: list[dict[str, Any]] = [{"vectorise": True}, {"batch": True}, {"instrument": True}]
+    for kwargs in options:
+        with pytest.raises(ValueError, match="the capi binding cannot be used with"):
+
+            @compile(binding="capi", **kwargs)
+            def f(x: float) -> float:  # type: ignore[empty-body]
+                "return x;"
+
+    # array arguments are std::span views
+    with pytest.raises(ValueError, match="the capi binding requires cxx_std=20 or later, not 17"):
+
+        @compile(binding="capi", cxx_std=17)
+        def h(x: float) -> float:  # type: ignore[empty-body]
+            "return x;"
+
+
+def test_module_source() -> None:
+    # all the functions in this module use the capi binding, so pybind11 isn't needed
+    module_spec = _module_registry["test_capi"]
+    assert module_spec.capi_only()
+    assert not module_spec.can_split()
+    code, _ = module_spec.make_source("test_capi")
+    assert "pybind11" not in code
+    assert "PyInit_test_capi" in code
+
+
+def test_call() -> None:
+    assert score(2.0) == 6.0
+    assert score(2.0, 4, flag=True) == -8.0
+    assert score(n=2, x=1) == 2.0
+    # numpy scalars
+    assert score(np.float32(0.5), np.int64(2)) == 1.0  # type: ignore[arg-type]
+    assert clamp(10, 0, 5) == 5
+    assert answer() == 42.0
+    assert check(np.bool_(True)) is True  # type: ignore[arg-type]
+    assert str(inspect.signature(score)) == "(x: float, n: int = 3, *, flag: bool = False) -> float"
+    # the compiled function has the signature, without annotations
+    assert str(inspect.signature(score.func)) == "(x, n=3, *, flag=False)"  # type: ignore[attr-defined]
+    assert clamp.__doc__.endswith("clamp i to [lo, hi]")  # type: ignore[union-attr]
+
+
+def test_call_errors() -> None:
+    with pytest.raises(TypeError, match=r"score\(\): argument 'x' must be float, not str"):
+        score("1")  # type: ignore[arg-type]
+    with pytest.raises(TypeError, match=r"score\(\): argument 'n' must be int, not float"):
+        score(1.0, 2.5)  # type: ignore[arg-type]
+    with pytest.raises(TypeError, match=r"score\(\) missing required argument 'x'"):
+        score()  # type: ignore[call-arg]
+    with pytest.raises(TypeError, match=r"score\(\) takes at most 2 positional argument"):
+        score(1.0, 2, True)  # type: ignore[call-arg]
+    with pytest.raises(TypeError, match=r"score\(\) got an unexpected keyword argument 'm'"):
+        score(1.0, m=2)  # type: ignore[call-arg]
+    with pytest.raises(TypeError, match=r"score\(\) got multiple values for argument 'x'"):
+        score(1.0, x=2)  # type: ignore[misc]
+    with pytest.raises(TypeError, match=r"clamp\(\) got an unexpected keyword argument 'lo'"):
+        clamp(1, lo=0, hi=2)  # type: ignore[call-arg]
+    with pytest.raises(TypeError, match=r"clamp\(\): argument 'lo' is out of range"):
+        clamp(1, 2**31, 2)
+    with pytest.raises(TypeError, match=r"check\(\): argument 'ok' must be bool, not int"):
+        check(1)  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="not ok"):
+        check(False)
+
+
+def test_views() -> None:
+    assert total(np.arange(5, dtype=np.float64)) == 10.0
+    assert total(np.array([], dtype=np.float64)) == 0.0
+    a = np.zeros(4, dtype=np.int32)
+    fill(a, 3)
+    assert (a == 3).all()
+    # arrays are never copied
+    with pytest.raises(
+        TypeError, match=r"total\(\): argument 'a' must be a C-contiguous 1-D array of float64, not 1-D"
+    ):
+        total(np.arange(5))  # type: ignore[arg-type]
+    with pytest.raises(TypeError, match=r"total\(\): argument 'a' must be a C-contiguous 1-D array of float64 \(not"):
+        total(np.arange(6, dtype=np.float64)[::2])
+    with pytest.raises(TypeError, match="not 2-D"):
+        total(np.ones((2, 2)))
+    with pytest.raises(TypeError, match="writeable array of int32"):
+        a.flags.writeable = False
+        fill(a, 1)
+    with pytest.raises(TypeError, match="must be a C-contiguous 1-D array"):
+        total([1.0, 2.0])  # type: ignore[arg-type]
+
+
+def _capi_spec() -> ModuleSpec:
+    def capi_f(i: int) -> int:  # type: ignore[empty-body]
+        pass
+
+    capi = capi_signature(capi_f)
+    return ModuleSpec().add_function(
+        FunctionSpec(
+            name="f",
+            body=capi.lambda_signature() + " { return i * 3; }",
+            arg_annotations="",
+            scope=(),
+            return_value_policy=ReturnValuePolicy.Automatic,
+            capi=capi,
+        ),
+        headers=["<xenoform/capi.h>"],
+    )
+
+
+def _mixed_spec() -> ModuleSpec:
+    return _capi_spec().add_function(
+        FunctionSpec(
+            name="g",
+            body="[](int i) -> int { return i * 2; }",
+            arg_annotations=', py::arg("i")',
+            scope=(),
+            return_value_policy=ReturnValuePolicy.Automatic,
+        )
+    )
+
+
+@pytest.mark.parametrize("backend", ["setuptools", "direct"])
+def test_mixed_module(backend: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    if backend == "direct" and platform.system() == "Windows":
+        pytest.skip("direct build backend not supported on windows")
+    monkeypatch.setenv("XENOFORM_BUILD_BACKEND", backend)
+    module_name = f"capi_mixed_{backend}"
+    shutil.rmtree(module_root_dir / f"{module_name}_ext", ignore_errors=True)
+    module_spec = _mixed_spec()
+    assert not module_spec.capi_only()
+    assert "<pybind11/pybind11.h>" in module_spec.make_source(module_name)[0]
+    module = _check_build_fetch_module_impl(module_name, module_spec)
+    assert module._f(2) == 6
+    assert module._g(2) == 4
+
+
+def test_direct_build_no_precompiled_header(monkeypatch: pytest.MonkeyPatch) -> None:
+    if platform.system() == "Windows":
+        pytest.skip("direct build backend not supported on windows")
+    monkeypatch.setenv("XENOFORM_BUILD_BACKEND", "direct")
+    monkeypatch.setenv("XENOFORM_PRECOMPILED_HEADERS", "true")
+    shutil.rmtree(module_root_dir / "capi_only_direct_ext", ignore_errors=True)
+    module_spec = _capi_spec()
+    assert module_spec.capi_only()
+    module = _check_build_fetch_module_impl("capi_only_direct", module_spec)
+    assert module._f(2) == 6
+    # the precompiled header would include pybind11
+    assert "-include" not in (module_root_dir / "capi_only_direct_ext" / "build.log").read_text()
@@ -0,0 +1,82 @@
+import os
+import platform
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from xenoform.__main__ import main
+from xenoform.compile import module_root_dir
+
+TEST_DIR = Path(__file__).parent
+
+
+@pytest.fixture(autouse=True)
+def _restore_environ() -> Iterator[None]:
+    # main sets environment variables for the build settings
+    environ = os.environ.copy()
+    yield
+    os.environ.clear()
+    os.environ.update(environ)
+
+
+def test_cli_build(capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["build", str(TEST_DIR / "prebuilt_module.py"), "-j", "2"]) == 0
+    assert "prebuilt_module: " in capsys.readouterr().out
+
+
+def test_cli_build_failure(capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["build", str(TEST_DIR / "prebuilt_module.py"), str(TEST_DIR / "cli_broken_module.py")]) == 1
+    assert "CompilationError" in capsys.readouterr().err
+
+
+def test_cli_build_missing_target(capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["build", "no_such_package"]) == 1
+    assert "ModuleNotFoundError" in capsys.readouterr().err
+
+
+def test_cli_build_directory(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    # a directory of scripts, not on sys.path
+    (tmp_path / "cli_dir_module.py").write_text(
+        "from xenoform import compile\n\n\n"
+        "@compile()\n"
+        "def triple(i: int) -> int:  # type: ignore[empty-body]\n"
+        '    "return i * 3;"\n'
+    )
+    assert main(["build", str(tmp_path)]) == 0
+    assert "cli_dir_module: " in capsys.readouterr().out
+
+
+def test_cli_build_package() -> None:
+    # imports the package and all its submodules, none of which contain compiled functions
+    assert main(["build", "xenoform"]) == 0
+
+
+def test_cli_build_profile(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # so that the variable set by main is removed afterwards
+    monkeypatch.setenv("XENOFORM_PROFILE", "default")
+    (tmp_path / "cli_profile_module.py").write_text(
+        "from xenoform import compile\n\n\n"
+        "@compile()\n"
+        "def quadruple(i: int) -> int:  # type: ignore[empty-body]\n"
+        '    "return i * 4;"\n'
+    )
+    assert main(["build", str(tmp_path), "--profile", "size"]) == 0
+    assert (module_root_dir / "cli_profile_module_ext_size").is_dir()
+
+
+def test_cli_build_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("XENOFORM_BUILD_BACKEND", raising=False)
+    monkeypatch.setattr(platform, "system", lambda: "Linux")
+    assert main(["build", str(TEST_DIR / "prebuilt_module.py"), "-j", "1"]) == 0
+    assert "XENOFORM_BUILD_BACKEND" not in os.environ
+    # the setuptools backend can only build one module at a time
+    assert main(["build", str(TEST_DIR / "prebuilt_module.py"), "-j", "2"]) == 0
+    assert os.environ["XENOFORM_BUILD_BACKEND"] == "direct"
+
+
+def test_cli_build_setuptools_warning(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    monkeypatch.setenv("XENOFORM_BUILD_BACKEND", "setuptools")
+    assert main(["build", str(TEST_DIR / "prebuilt_module.py"), "-j", "2"]) == 0
+    assert "warning: the setuptools build backend builds one module at a time, not 2" in capsys.readouterr().err
+    assert os.environ["XENOFORM_BUILD_BACKEND"] == "setuptools"
@@ -0,0 +1,41 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from xenoform import config
+from xenoform.config import get_setting
+
+
+@pytest.fixture
+def config_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Iterator[Path]:
+    path = tmp_path / "xenoform.toml"
+    monkeypatch.setattr(config, "CONFIG_FILE", path)
+    config._load_config.cache_clear()
+    yield path
+    config._load_config.cache_clear()
+
+
+def test_settings(monkeypatch: pytest.MonkeyPatch, config_file: Path) -> None:
+    config_file.write_text('[extensions]\nbuild_backend = "direct"\nbuild_workers = 3\nprebuild = true\n')
+    monkeypatch.delenv("XENOFORM_BUILD_BACKEND", raising=False)
+    monkeypatch.delenv("XENOFORM_BUILD_WORKERS", raising=False)
+    monkeypatch.delenv("XENOFORM_PREBUILD", raising=False)
+    assert get_setting("build_backend", "setuptools") == "direct"
+    assert get_setting("build_workers", 1) == 3
+    assert get_setting("prebuild", False) is True
+    assert get_setting("artefact_store", "") == ""
+
+    # environment variables take precedence
+    monkeypatch.setenv("XENOFORM_BUILD_BACKEND", "setuptools")
+    monkeypatch.setenv("XENOFORM_BUILD_WORKERS", "5")
+    monkeypatch.setenv("XENOFORM_PREBUILD", "off")
+    assert get_setting("build_backend", "direct") == "setuptools"
+    assert get_setting("build_workers", 1) == 5
+    assert get_setting("prebuild", True) is False
+
+
+def test_no_config_file(monkeypatch: pytest.MonkeyPatch, config_file: Path) -> None:
+    monkeypatch.delenv("XENOFORM_BUILD_BACKEND", raising=False)
+    assert not config_file.exists()
+    assert get_setting("build_backend", "setuptools") == "setuptools"
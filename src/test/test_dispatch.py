@@ -0,0 +1,42 @@
+import inspect
+from functools import partial
+from types import BuiltinFunctionType
+from typing import Self
+
+from xenoform import compile
+
+
+@compile()
+def add(i: int, j: int) -> int:  # type: ignore[empty-body]
+    """
+    return i + j;
+    """
+
+
+class Adder:
+    @compile()
+    def add(self: Self, i: int) -> int:  # type: ignore[empty-body]
+        """
+        return i + 1;
+        """
+
+
+def test_rebind_function() -> None:
+    stub = add
+    assert not isinstance(stub, BuiltinFunctionType)
+    assert add(1, 2) == 3
+    # the module attribute now refers to the compiled function, keeping the stub's metadata...
+    assert add.__name__ == "add"
+    assert add.__wrapped__ is stub  # type: ignore[attr-defined]
+    assert inspect.signature(add) == inspect.signature(stub)
+    assert isinstance(add, partial) and isinstance(add.func, BuiltinFunctionType)
+    # ...but the stub still works
+    assert stub(2, 3) == 5
+
+
+def test_rebind_method() -> None:
+    a = Adder()
+    assert a.add(1) == 2
+    # methods are not rebound
+    assert not isinstance(Adder.add, BuiltinFunctionType)
+    assert a.add(2) == 3
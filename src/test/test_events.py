@@ -0,0 +1,125 @@
+import logging
+import platform
+import shutil
+
+import pytest
+
+from xenoform import Event, Phase, compile, subscribe
+from xenoform.compile import _check_build_fetch_module_impl, module_root_dir
+from xenoform.cppmodule import FunctionSpec, ModuleSpec, ReturnValuePolicy
+from xenoform.events import emit, timed
+
+
+def _spec(body: str) -> ModuleSpec:
+    return ModuleSpec().add_function(
+        FunctionSpec(
+            name="f",
+            body=body,
+            arg_annotations=', py::arg("i")',
+            scope=(),
+            return_value_policy=ReturnValuePolicy.Automatic,
+        )
+    )
+
+
+def _build_events(backend: str, monkeypatch: pytest.MonkeyPatch) -> list[Event]:
+    monkeypatch.setenv("XENOFORM_BUILD_BACKEND", backend)
+    module_name = f"events_{backend}"
+    shutil.rmtree(module_root_dir / f"{module_name}_ext", ignore_errors=True)
+    events: list[Event] = []
+    unsubscribe = subscribe(events.append)
+    try:
+        module = _check_build_fetch_module_impl(module_name, _spec("[](int i) -> int { return i * 3; }"))
+        assert module._f(2) == 6
+        # again, now up-to-date
+        _check_build_fetch_module_impl(module_name, _spec("[](int i) -> int { return i * 3; }"))
+    finally:
+        unsubscribe()
+    assert all(event.module == f"{module_name}_ext.{module_name}" for event in events)
+    assert all(event.duration_s is not None and event.duration_s >= 0 for event in events)
+    return events
+
+
+def test_build_events_setuptools(monkeypatch: pytest.MonkeyPatch) -> None:
+    events = _build_events("setuptools", monkeypatch)
+    phases = [event.phase for event in events]
+    assert phases == [Phase.Generate, Phase.Check, Phase.Build, Phase.Import, Phase.Generate, Phase.Check, Phase.Import]
+    assert events[1].details["status"] == "missing"
+    assert events[5].details["status"] == "current"
+    assert events[0].details["size_bytes"] > 0
+    assert events[2].details["size_bytes"] == events[3].details["size_bytes"] > 0
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="direct build backend not supported on windows")
+def test_build_events_direct(monkeypatch: pytest.MonkeyPatch) -> None:
+    events = _build_events("direct", monkeypatch)
+    by_phase = {event.phase: event for event in events}
+    assert Phase.Build not in by_phase
+    assert by_phase[Phase.Compile].details["compiled"] == 1
+    assert by_phase[Phase.Compile].details["peak_rss_bytes"] > 1024 * 1024
+    assert by_phase[Phase.Link].details["size_bytes"] > 0
+
+
+def test_register_and_redirect_events() -> None:
+    events: list[Event] = []
+    unsubscribe = subscribe(events.append)
+    try:
+
+        @compile()
+        def triple(i: int) -> int:  # type: ignore[empty-body]
+            "return i * 3;"
+
+        assert triple(2) == 6
+    finally:
+        unsubscribe()
+    register, redirect = events[0], events[-1]
+    assert register.phase == Phase.Register
+    assert register.module == "test_events_ext.test_events"
+    assert register.details["function"] == "test_register_and_redirect_events.triple"
+    assert redirect.phase == Phase.Redirect
+    assert redirect.module == "test_events_ext.test_events"
+    assert redirect.details["function"] == "test_register_and_redirect_events_triple"
+
+
+def test_unsubscribe() -> None:
+    events: list[Event] = []
+    unsubscribe = subscribe(events.append)
+    emit(Phase.Import, "m")
+    unsubscribe()
+    unsubscribe()
+    emit(Phase.Import, "m")
+    assert len(events) == 1
+    assert events[0].duration_s is None
+
+
+def test_subscriber_error(caplog: pytest.LogCaptureFixture) -> None:
+    def fail(_: Event) -> None:
+        raise RuntimeError("subscriber")
+
+    unsubscribe = subscribe(fail)
+    try:
+        emit(Phase.Import, "m")
+    finally:
+        unsubscribe()
+    assert "RuntimeError: subscriber" in caplog.text
+
+
+def test_timed_error() -> None:
+    events: list[Event] = []
+    unsubscribe = subscribe(events.append)
+    try:
+        with pytest.raises(ValueError), timed(Phase.Compile, "m", objects=1):
+            raise ValueError
+    finally:
+        unsubscribe()
+    assert events[0].details == {"objects": 1, "error": "ValueError"}
+
+
+def test_logging(caplog: pytest.LogCaptureFixture) -> None:
+    with caplog.at_level(logging.DEBUG, logger="xenoform"):
+        emit(Phase.Link, "m", duration_s=0.5, size_bytes=100)
+    record = caplog.records[-1]
+    assert record.xenoform_phase == "link"  # type: ignore[attr-defined]
+    assert record.xenoform_module == "m"  # type: ignore[attr-defined]
+    assert record.xenoform_duration_s == 0.5  # type: ignore[attr-defined]
+    assert record.xenoform_size_bytes == 100  # type: ignore[attr-defined]
@@ -0,0 +1,55 @@
+import sys
+import sysconfig
+
+import pytest
+
+from xenoform import compile
+from xenoform.cppmodule import FunctionSpec, ModuleSpec, ReturnValuePolicy, gil_not_used
+
+FREE_THREADED = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+
+
+@compile()
+def square(x: float) -> float:  # type: ignore[empty-body]
+    """
+    return x * x;
+    """
+
+
+def _module_spec() -> ModuleSpec:
+    return ModuleSpec().add_function(
+        FunctionSpec(
+            name="f",
+            body="[]() -> int { return 0; }",
+            arg_annotations="",
+            scope=(),
+            return_value_policy=ReturnValuePolicy.Automatic,
+        )
+    )
+
+
+def test_gil_not_used_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("XENOFORM_FREE_THREADING", raising=False)
+    assert gil_not_used() == FREE_THREADED
+
+
+def test_module_options(monkeypatch: pytest.MonkeyPatch) -> None:
+    module_spec = _module_spec()
+
+    monkeypatch.setenv("XENOFORM_FREE_THREADING", "1")
+    code, hashval = module_spec.make_source("ft_module")
+    assert "PYBIND11_MODULE(ft_module, m, py::mod_gil_not_used())" in code
+    split_code, _ = module_spec.make_split_source("ft_module")
+    assert "PYBIND11_MODULE(ft_module, m, py::mod_gil_not_used())" in split_code
+
+    monkeypatch.setenv("XENOFORM_FREE_THREADING", "0")
+    code, hashval_gil = module_spec.make_source("ft_module")
+    assert "PYBIND11_MODULE(ft_module, m)" in code
+    # changing the setting causes a rebuild
+    assert hashval != hashval_gil
+
+
+@pytest.mark.skipif(not FREE_THREADED, reason="requires a free-threaded interpreter")
+def test_gil_stays_disabled() -> None:
+    assert square(3.0) == 9.0
+    assert not sys._is_gil_enabled()  # type: ignore[attr-defined]
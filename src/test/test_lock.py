@@ -0,0 +1,111 @@
+import importlib
+import socket
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from xenoform.compile import _check_build_fetch_module_impl, module_root_dir
+from xenoform.cppmodule import FunctionSpec, ModuleSpec, ReturnValuePolicy
+from xenoform.lock import FileLock
+
+compile_module = importlib.import_module("xenoform.compile")
+
+HOLD_LOCK = """
+import sys, time
+from pathlib import Path
+from xenoform.lock import FileLock
+lock = FileLock(Path(sys.argv[1]))
+lock.acquire()
+print("locked", flush=True)
+time.sleep(float(sys.argv[2]))
+"""
+
+
+def test_lock_threads(tmp_path: Path) -> None:
+    lock_file = tmp_path / "threads.lock"
+    active, max_active = 0, 0
+    counter_lock = threading.Lock()
+
+    def work() -> None:
+        nonlocal active, max_active
+        with FileLock(lock_file):
+            with counter_lock:
+                active += 1
+                max_active = max(max_active, active)
+            time.sleep(0.01)
+            with counter_lock:
+                active -= 1
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert max_active == 1
+
+
+def test_lock_processes(tmp_path: Path) -> None:
+    lock_file = tmp_path / "processes.lock"
+    p = subprocess.Popen([sys.executable, "-c", HOLD_LOCK, str(lock_file), "60"], stdout=subprocess.PIPE, text=True)
+    try:
+        assert p.stdout and p.stdout.readline().strip() == "locked"
+        lock = FileLock(lock_file, timeout=0.2)
+        assert not lock.try_acquire()
+        assert lock.holder() == f"{socket.gethostname()} {p.pid}"
+        with pytest.raises(TimeoutError):
+            lock.acquire()
+        # a crashed holder doesn't leave a stale lock
+        p.kill()
+        p.wait()
+        with FileLock(lock_file, timeout=5):
+            pass
+    finally:
+        p.kill()
+        p.wait()
+
+
+def test_lock_reentry(tmp_path: Path) -> None:
+    lock = FileLock(tmp_path / "reentry.lock")
+    assert lock.holder() == ""
+    assert lock.try_acquire()
+    assert lock.try_acquire()
+    lock.acquire()
+    lock.release()
+    lock.release()
+    assert FileLock(tmp_path / "reentry.lock").try_acquire()
+
+
+def test_wait_for_other_build(monkeypatch: pytest.MonkeyPatch) -> None:
+    spec = ModuleSpec().add_function(
+        FunctionSpec(
+            name="f",
+            body="[]() -> int { return 9; }",
+            arg_annotations="",
+            scope=(),
+            return_value_policy=ReturnValuePolicy.Automatic,
+        )
+    )
+    assert _check_build_fetch_module_impl("locked_module", spec)._f() == 9
+    _, hashval = spec.make_source("locked_module")
+
+    # another process holds the lock, and has built the module by the time it releases it
+    lock = FileLock(module_root_dir / "locked_module_ext" / "build.lock")
+    lock.acquire()
+    checksums = iter([None, hashval])
+    monkeypatch.setattr(compile_module, "_installed_checksum", lambda *_: next(checksums))
+
+    def fail(*_args: object) -> None:
+        raise AssertionError("module should not be rebuilt")
+
+    monkeypatch.setattr(compile_module, "_build_module", fail)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(_check_build_fetch_module_impl, "locked_module", spec)
+        time.sleep(0.2)
+        assert not future.done()
+        lock.release()
+        assert future.result(timeout=5)._f() == 9
@@ -0,0 +1,60 @@
+import importlib
+from dataclasses import replace
+
+import pytest
+
+from xenoform import compile
+from xenoform.manifest import MANIFEST_FILE, Manifest
+
+compile_module = importlib.import_module("xenoform.compile")
+
+
+@compile()
+def answer() -> int:  # type: ignore[empty-body]
+    """
+    return 42;
+    """
+
+
+def test_manifest() -> None:
+    assert answer() == 42
+
+    module_dir = compile_module.module_root_dir / "test_manifest_ext"
+    manifest = Manifest.load(module_dir)
+    assert manifest is not None
+    assert manifest.is_current(module_dir)
+    _, hashval = compile_module._module_registry["test_manifest"].make_source("test_manifest")
+    assert manifest.checksum == hashval
+
+    assert not replace(manifest, size=manifest.size + 1).is_current(module_dir)
+    assert not replace(manifest, toolchain="cpython-0").is_current(module_dir)
+    assert not replace(manifest, binary="missing.so").is_current(module_dir)
+
+
+def test_manifest_avoids_subprocess(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert answer() == 42
+
+    def fail(_module_name: str) -> str | None:
+        raise AssertionError("up-to-date check should not spawn a subprocess")
+
+    monkeypatch.setattr(compile_module, "_get_module_checksum", fail)
+    module = compile_module._check_build_fetch_module_impl(
+        "test_manifest", compile_module._module_registry["test_manifest"]
+    )
+    manifest = Manifest.load(compile_module.module_root_dir / "test_manifest_ext")
+    assert manifest
+    assert module.__checksum__ == manifest.checksum
+
+
+def test_legacy_module_without_manifest() -> None:
+    assert answer() == 42
+    module_dir = compile_module.module_root_dir / "test_manifest_ext"
+    manifest = Manifest.load(module_dir)
+    assert manifest
+
+    # modules built by earlier versions are checked in a subprocess, and a manifest is written
+    (module_dir / MANIFEST_FILE).unlink()
+    assert compile_module._installed_checksum("test_manifest", module_dir) == manifest.checksum
+    assert Manifest.load(module_dir) == manifest
+
+    assert compile_module._get_module_checksum("no_such_module") is None
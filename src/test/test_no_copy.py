@@ -0,0 +1,114 @@
+from typing import Annotated
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from xenoform import ArrayView, array_copies, compile, reset_stats
+from xenoform.compile import _module_registry
+
+
+@compile(no_copy=True)
+def double_strict(a: npt.NDArray[np.float64]) -> None:
+    "auto acc = a.mutable_unchecked<1>(); for (py::ssize_t i = 0; i < acc.shape(0); ++i) acc(i) *= 2;"
+
+
+@compile(no_copy=False, instrument=True)
+def double(a: npt.NDArray[np.float64]) -> None:
+    "auto acc = a.mutable_unchecked<1>(); for (py::ssize_t i = 0; i < acc.shape(0); ++i) acc(i) *= 2;"
+
+
+@compile(no_copy=True)
+def total_strict(a: Annotated[npt.NDArray[np.float64], ArrayView()]) -> float:  # type: ignore[empty-body]
+    "double sum = 0.0; for (double x : a) sum += x; return sum;"
+
+
+@compile(instrument=True)
+def total(a: Annotated[npt.NDArray[np.float64], ArrayView(2)]) -> float:  # type: ignore[empty-body]
+    "double sum = 0.0; for (size_t i = 0; i < a.size(); ++i) sum += a.data_handle()[i]; return sum;"
+
+
+@compile()
+def first(données: npt.NDArray[np.float64]) -> float:  # type: ignore[empty-body]
+    "return données.at(0);"
+
+
+@compile(no_copy=True)
+def first_strict(données: npt.NDArray[np.float64]) -> float:  # type: ignore[empty-body]
+    "return données.at(0);"
+
+
+def test_no_copy() -> None:
+    a = np.ones(3)
+    double_strict(a)
+    assert (a == 2.0).all()
+    with pytest.raises(TypeError, match=r"double_strict.a: array of dtype int64 would be converted to float64"):
+        double_strict(np.ones(3, dtype=np.int64))
+    with pytest.raises(TypeError, match=r"double_strict.a: array of dtype >f8"):
+        double_strict(np.ones(3, dtype=">f8"))
+    with pytest.raises(TypeError, match=r"double_strict.a: list would be converted to an array of float64"):
+        double_strict([1.0, 2.0])  # type: ignore[arg-type]
+    # array_t doesn't need to be contiguous
+    double_strict(a[::2])
+    assert list(a) == [4.0, 2.0, 4.0]
+
+
+def test_no_copy_view() -> None:
+    a = np.arange(4, dtype=np.float64)
+    assert total_strict(a) == 6.0
+    with pytest.raises(TypeError, match=r"total_strict.a: non-C-contiguous array would be copied"):
+        total_strict(a[::2])
+    # not a copy, so the usual error
+    with pytest.raises(TypeError, match="incompatible function arguments"):
+        total_strict(np.ones((2, 2)))
+
+
+def test_array_copies() -> None:
+    reset_stats()
+    a = np.ones(3, dtype=np.float32)
+    # the copy is modified, not the original
+    double(a)  # type: ignore[arg-type]
+    double(a)  # type: ignore[arg-type]
+    assert (a == 1.0).all()
+    double(np.ones(3))
+    m = np.ones((3, 4))
+    total(m)
+    total(m.T)
+    total(m.astype(np.int32))
+    copies = array_copies()
+    assert copies["test_no_copy.double.a"] == 2
+    assert copies["test_no_copy.total.a"] == 2
+    assert "test_no_copy.double_strict.a" not in copies
+    # only instrumented functions count copies
+    first(np.ones(2, dtype=np.float32))
+    assert "test_no_copy.first.données" not in array_copies()
+    reset_stats()
+    assert array_copies()["test_no_copy.double.a"] == 0
+
+
+def test_no_copy_setting(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XENOFORM_NO_COPY", "true")
+
+    @compile()
+    def f(a: npt.NDArray[np.float64]) -> None:
+        "return;"
+
+    functions = {f.name: f for f in _module_registry["test_no_copy"].functions}
+    assert "xenoform::array_arg<py::array_t<double>, true, xenoform_a_name>" in functions["f"].body
+    assert "xenoform::array_arg<py::array_t<double>, false, xenoform_a_name>" in functions["double"].body
+    assert functions["f"].array_args == ("a",)
+
+
+def test_array_arg_wrapping() -> None:
+    functions = {f.name: f for f in _module_registry["test_no_copy"].functions}
+    # unchanged unless copies are rejected or counted
+    assert functions["first"].body.startswith("[](py::array_t<double> données) -> double")
+    assert not functions["first"].array_args
+    # the name is a string declared with the function, so can contain any valid identifier
+    assert "xenoform::array_arg<py::array_t<double>, true, xenoform_données_name>" in functions["first_strict"].body
+    assert 'static constexpr char xenoform_données_name[] = "first_strict.données";' in (
+        functions["first_strict"].definition()
+    )
+    with pytest.raises(TypeError, match=r"first_strict.données: array of dtype float32 would be converted"):
+        first_strict(np.ones(2, dtype=np.float32))
+    assert first_strict(np.ones(2)) == 1.0
@@ -0,0 +1,139 @@
+from typing import Annotated
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from xenoform import CppTypeError, PandasView, compile
+from xenoform.types import translate_type
+from xenoform.utils import gil_unsafe_args, translate_function_signature
+
+
+@compile()
+def cumsum(s: pd.Series) -> pd.Series:  # type: ignore[empty-body]
+    """
+    auto result = xenoform::series<double>::like(s);
+    double total = 0.0;
+    for (size_t i = 0; i < s.size(); ++i) result[i] = total += s[i];
+    return result;
+    """
+
+
+@compile()
+def passthrough(  # type: ignore[empty-body]
+    s: Annotated[pd.Series, PandasView(np.int64)],
+) -> Annotated[pd.Series, "xenoform::series<const int64_t>"]:
+    "return s;"
+
+
+@compile(extra_includes=["<numeric>"])
+def total(s: pd.Series) -> float:  # type: ignore[empty-body]
+    "return std::accumulate(s.begin(), s.end(), 0.0);"
+
+
+@compile()
+def row_sums(df: pd.DataFrame) -> pd.Series:  # type: ignore[empty-body]
+    """
+    auto result = xenoform::series<double>(df.index(), df.rows());
+    for (size_t i = 0; i < df.rows(); ++i) {
+      result[i] = 0.0;
+      for (size_t j = 0; j < df.cols(); ++j) result[i] += df(i, j);
+    }
+    return result;
+    """
+
+
+@compile()
+def scaled(df: Annotated[pd.DataFrame, PandasView(np.int32)], k: int) -> pd.DataFrame:  # type: ignore[empty-body]
+    """
+    auto result = xenoform::frame<double>::like(df);
+    for (size_t j = 0; j < df.cols(); ++j)
+      for (size_t i = 0; i < df.rows(); ++i) result(i, j) = k * df(i, j);
+    return result;
+    """
+
+
+def test_translate() -> None:
+    assert str(translate_type(pd.Series)) == "xenoform::series<double>"
+    assert str(translate_type(Annotated[pd.DataFrame, PandasView(np.int64)])) == "xenoform::frame<int64_t>"  # type: ignore[arg-type]
+    assert translate_type(pd.Series).headers({"xenoform::series": "<pandas.h>"}) == ["<pandas.h>"]
+
+    def f(df: Annotated[pd.DataFrame, PandasView(np.int32)], k: int) -> pd.DataFrame:  # type: ignore[empty-body]
+        pass
+
+    # arguments are read-only
+    signature, _, headers = translate_function_signature(f)
+    assert signature == "[](xenoform::frame<const int32_t> df, int k) -> xenoform::frame<double>"
+    assert headers == ["<xenoform/pandas.h>", "<xenoform/pandas.h>"]
+    with pytest.raises(CppTypeError):
+        translate_type(Annotated[list[float], PandasView()])  # type: ignore[arg-type]
+    # series and frames hold python objects
+    assert sorted(gil_unsafe_args(f)) == ["df", "return"]
+
+
+def test_series() -> None:
+    s = pd.Series([1.0, 2.0, 3.0], index=["a", "b", "c"], name="x")
+    result = cumsum(s)
+    assert result.equals(pd.Series([1.0, 3.0, 6.0], index=["a", "b", "c"], name="x"))
+    assert result.index is s.index
+    # an empty series
+    assert cumsum(pd.Series([], dtype=np.float64)).empty
+
+
+def test_series_strided() -> None:
+    values = np.arange(10, dtype=np.float64)
+    assert cumsum(pd.Series(values[::2], copy=False)).to_list() == [0.0, 2.0, 6.0, 12.0, 20.0]
+    assert cumsum(pd.Series(values[::-3], copy=False)).to_list() == [9.0, 15.0, 18.0, 18.0]
+    assert total(pd.Series(values[1::3], copy=False)) == 12.0
+
+
+def test_series_passthrough() -> None:
+    s = pd.Series(np.arange(5, dtype=np.int64))
+    assert passthrough(s) is s
+
+
+def test_series_no_copy() -> None:
+    with pytest.raises(TypeError, match=r"pd\.Series: values of dtype int64 would be converted to float64"):
+        cumsum(pd.Series([1, 2, 3]))
+    # values whose stride isn't a multiple of their size can't be viewed
+    record = np.zeros(3, dtype=[("x", np.float64), ("flag", np.int8)])
+    with pytest.raises(TypeError, match=r"pd\.Series: values of dtype float64 are not aligned"):
+        cumsum(pd.Series(record["x"], copy=False))
+    with pytest.raises(TypeError, match="incompatible function arguments"):
+        cumsum(np.ones(3))  # type: ignore[arg-type]
+
+
+def test_frame() -> None:
+    df = pd.DataFrame({"a": [1.0, 2.0], "b": [10.0, 20.0], "c": [100.0, 200.0]}, index=[5, 6])
+    assert row_sums(df).equals(pd.Series([111.0, 222.0], index=[5, 6]))
+    # single-dtype frame from a C-contiguous array
+    values = np.arange(12, dtype=np.float64).reshape(4, 3)
+    assert (row_sums(pd.DataFrame(values)).to_numpy() == values.sum(axis=1)).all()
+    # no columns
+    assert (row_sums(pd.DataFrame(index=range(3))) == 0.0).all()
+
+
+def test_frame_row_major() -> None:
+    # a single (rows, columns) block, so each column is strided
+    values = np.arange(12, dtype=np.float64).reshape(4, 3)
+    df = pd.DataFrame(values, index=list("wxyz"), copy=False)
+    assert np.shares_memory(df[0].to_numpy(), values)
+    assert row_sums(df).equals(pd.Series(values.sum(axis=1), index=list("wxyz")))
+    # as are series taken from it
+    assert cumsum(df[1]).to_list() == [1.0, 5.0, 12.0, 22.0]
+    assert total(df.loc["x"]) == 12.0  # type: ignore[arg-type]
+    ints = pd.DataFrame(np.arange(6, dtype=np.int32).reshape(3, 2), copy=False)
+    assert scaled(ints, 2).equals(pd.DataFrame(2.0 * np.arange(6).reshape(3, 2)))
+
+
+def test_frame_result() -> None:
+    df = pd.DataFrame({"x": [1, 2, 3], "y": [4, 5, 6]}, index=list("pqr"), dtype=np.int32)
+    result = scaled(df, 2)
+    assert result.equals(pd.DataFrame({"x": [2.0, 4.0, 6.0], "y": [8.0, 10.0, 12.0]}, index=list("pqr")))
+    assert result.columns.equals(df.columns)
+
+
+def test_frame_no_copy() -> None:
+    df = pd.DataFrame({"a": [1.0, 2.0], "b": [1, 2]})
+    with pytest.raises(TypeError, match=r"pd\.DataFrame column b: values of dtype int64 would be converted to float64"):
+        row_sums(df)
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from xenoform import compile
+
+# parallel vectorised functions are in their own module, which is built with the OpenMP flags (if supported)
+
+
+@compile(vectorise="parallel")
+def maxp(i: int, j: int) -> int:  # type: ignore[empty-body]
+    "return i < j ? j : i;"
+
+
+# the threshold applies to the whole module
+@compile(
+    vectorise="parallel", define_macros=["XENOFORM_PARALLEL_THRESHOLD=1000"], extra_includes=["<cmath>", "<stdexcept>"]
+)
+def checked_sqrt(x: float) -> float:  # type: ignore[empty-body]
+    """
+    if (x < 0.0) throw std::domain_error("negative");
+    return std::sqrt(x);
+    """
+
+
+def test_parallel_max() -> None:
+    assert (maxp(range(5), range(4, -1, -1)) == [4, 3, 2, 3, 4]).all()  # type: ignore[arg-type, attr-defined, comparison-overlap]
+
+
+def test_parallel_max_scalar() -> None:
+    assert maxp(0, 1) == 1
+    assert isinstance(maxp(np.array([0]), 1), np.ndarray)  # type: ignore[arg-type]
+
+
+def test_parallel_max_incompatible() -> None:
+    # as py::vectorize
+    with pytest.raises(RuntimeError, match="operands could not be broadcast together"):
+        maxp(range(5), range(6))  # type: ignore[arg-type]
+
+
+def test_parallel_max_mixed() -> None:
+    assert (maxp(range(5), 3) == [3, 3, 3, 3, 4]).all()  # type: ignore[arg-type, attr-defined, comparison-overlap]
+    a = np.ones((3, 3), dtype=int)
+    b = np.array([0, 1, 2])
+    assert (maxp(a, b) == np.array([[1, 1, 2]] * 3)).all()  # type: ignore[arg-type, attr-defined]
+    # general broadcasting (neither operand is full size)
+    assert (maxp(b.reshape(3, 1), b) == np.maximum(b.reshape(3, 1), b)).all()  # type: ignore[arg-type]
+
+
+def test_parallel_matches_serial() -> None:
+    rng = np.random.default_rng(19937)
+    a = rng.integers(-100, 100, size=(100, 1000))
+    b = rng.integers(-100, 100, size=1000)
+    assert (maxp(a, b) == np.maximum(a, b)).all()  # type: ignore[arg-type, attr-defined]
+    # non-contiguous input
+    assert (maxp(a.T, a.T) == a.T).all()  # type: ignore[arg-type, attr-defined]
+
+
+def test_parallel_exception() -> None:
+    x = np.arange(10000.0)
+    assert np.allclose(checked_sqrt(x), np.sqrt(x))  # type: ignore[arg-type]
+    x[5000] = -1.0
+    with pytest.raises(ValueError, match="negative"):
+        checked_sqrt(x)  # type: ignore[arg-type]
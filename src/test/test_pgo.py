@@ -0,0 +1,95 @@
+import importlib
+import os
+import platform
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from xenoform import CompilationError
+from xenoform.__main__ import main
+from xenoform.build import PGO_DIR, pgo_flags, pgo_stage
+from xenoform.compile import module_root_dir
+
+build_module = importlib.import_module("xenoform.build")
+
+if platform.system() == "Windows":
+    pytest.skip("profile-guided optimisation not supported on windows", allow_module_level=True)
+
+
+@pytest.fixture(autouse=True)
+def _restore_environ() -> Iterator[None]:
+    # main sets environment variables for the build settings
+    environ = os.environ.copy()
+    yield
+    os.environ.clear()
+    os.environ.update(environ)
+
+
+WORKLOAD = """
+from xenoform import compile
+
+
+@compile()
+def collatz(n: int) -> int:  # type: ignore[empty-body]
+    '''
+    int steps = 0;
+    while (n != 1) {
+        n = n % 2 ? 3 * n + 1 : n / 2;
+        ++steps;
+    }
+    return steps;
+    '''
+
+
+if __name__ == "__main__":
+    assert sum(collatz(i) for i in range(1, 1000)) == 59431
+"""
+
+
+def test_pgo_stage(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.delenv("XENOFORM_PGO", raising=False)
+    assert pgo_stage(tmp_path) is None
+    (tmp_path / PGO_DIR).mkdir()
+    (tmp_path / PGO_DIR / "module.gcda").touch()
+    assert pgo_stage(tmp_path) == "use"
+    monkeypatch.setenv("XENOFORM_PGO", "off")
+    assert pgo_stage(tmp_path) is None
+    monkeypatch.setenv("XENOFORM_PGO", "generate")
+    assert pgo_stage(tmp_path) == "generate"
+
+
+def test_pgo_flags(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    assert pgo_flags(None, tmp_path, tmp_path) == ([], [])
+    compile_args, link_args = pgo_flags("generate", tmp_path, tmp_path / "build")
+    assert f"-fprofile-generate={tmp_path / PGO_DIR}" in compile_args
+    assert f"-fprofile-prefix-path={tmp_path / 'build'}" in compile_args
+    assert link_args == ["-fprofile-generate"]
+    assert f"-fprofile-use={tmp_path / PGO_DIR}" in pgo_flags("use", tmp_path, tmp_path)[0]
+
+    monkeypatch.setattr(build_module, "compiler_version", lambda _: "Apple clang version 17.0.0")
+    with pytest.raises(CompilationError):
+        pgo_flags("use", tmp_path, tmp_path)
+
+
+@pytest.mark.parametrize("backend", ["setuptools", "direct"])
+def test_cli_pgo(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, backend: str) -> None:
+    monkeypatch.setenv("XENOFORM_BUILD_BACKEND", backend)
+    monkeypatch.delenv("XENOFORM_PGO", raising=False)
+    workload = tmp_path / f"pgo_workload_{backend}.py"
+    workload.write_text(WORKLOAD)
+    assert main(["pgo", str(workload)]) == 0
+
+    module_dir = module_root_dir / f"{workload.stem}_ext"
+    assert any((module_dir / PGO_DIR).glob("*.gcda"))
+    assert "// pgo: use" in (module_dir / "module.cpp").read_text()
+    if backend == "direct":
+        # setuptools output isn't logged under pytest
+        assert "-fprofile-use" in (module_dir / "build.log").read_text()
+
+
+def test_cli_pgo_workload_failure(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    workload = tmp_path / "pgo_failing_workload.py"
+    workload.write_text("raise SystemExit(3)\n")
+    assert main(["pgo", str(workload), "arg"]) == 1
+    assert "failed (3)" in capsys.readouterr().err
@@ -0,0 +1,116 @@
+import platform
+import shutil
+from pathlib import Path
+
+import pytest
+
+from xenoform import BuildProfile, compile
+from xenoform.build import build_profile, compile_flags, link_flags, profile_flags
+from xenoform.compile import _check_build_fetch_module_impl, _ext_name, module_root_dir
+from xenoform.cppmodule import FunctionSpec, ModuleSpec, ReturnValuePolicy
+from xenoform.manifest import extension_filename
+
+
+@compile(profile="release")
+def add(i: int, j: int) -> int:  # type: ignore[empty-body]
+    "return i + j;"
+
+
+def _spec(profile: BuildProfile) -> ModuleSpec:
+    return ModuleSpec().add_function(
+        FunctionSpec(
+            name="f",
+            body="[](int i) -> int { return i * 2; }",
+            arg_annotations=', py::arg("i")',
+            scope=(),
+            return_value_policy=ReturnValuePolicy.Automatic,
+        ),
+        extra_compile_args=["-O1"],
+        profile=profile,
+    )
+
+
+def test_build_profile(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("XENOFORM_PROFILE", raising=False)
+    assert build_profile() == BuildProfile.Default
+    assert build_profile("lto") == BuildProfile.Lto
+    # the environment variable takes precedence over the decorator
+    monkeypatch.setenv("XENOFORM_PROFILE", "debug")
+    assert build_profile() == BuildProfile.Debug
+    assert build_profile("lto") == BuildProfile.Debug
+    monkeypatch.setenv("XENOFORM_PROFILE", "fastest")
+    with pytest.raises(ValueError):
+        build_profile()
+
+
+@pytest.mark.parametrize("system", ["Linux", "Darwin", "Windows"])
+def test_profile_flags(monkeypatch: pytest.MonkeyPatch, system: str) -> None:
+    monkeypatch.setattr(platform, "system", lambda: system)
+    assert profile_flags(BuildProfile.Default) == ([], [])
+    for profile in BuildProfile:
+        compile_args, link_args = profile_flags(profile)
+        assert all(isinstance(arg, str) for arg in compile_args + link_args)
+    optimise = "/O" if system == "Windows" else "-O"
+    assert any(arg.startswith(optimise) for arg in profile_flags(BuildProfile.Size)[0])
+
+
+def test_profile_flags_order() -> None:
+    # extra compile args follow (so can override) the profile's flags
+    flags = compile_flags(_spec(BuildProfile.Native))
+    assert flags.index("-march=native") < flags.index("-O1")
+    assert "-flto" in link_flags(_spec(BuildProfile.Lto))
+
+
+def test_profile_conflict() -> None:
+    with pytest.raises(ValueError):
+        _spec(BuildProfile.Release).add_function(
+            FunctionSpec(
+                name="g",
+                body="[]() {}",
+                arg_annotations="",
+                scope=(),
+                return_value_policy=ReturnValuePolicy.Automatic,
+            ),
+            profile=BuildProfile.Debug,
+        )
+
+
+def test_profile_module_dir() -> None:
+    assert _ext_name("m", None) == _ext_name("m", BuildProfile.Default) == "m_ext"
+    assert _ext_name("m", BuildProfile.Size) == "m_ext_size"
+
+
+def test_profile_decorator(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("XENOFORM_PROFILE", raising=False)
+    assert add(2, 3) == 5
+    assert (module_root_dir / "test_profiles_ext_release" / extension_filename("test_profiles")).exists()
+
+
+def test_switch_profiles(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XENOFORM_BUILD_BACKEND", "direct")
+    binaries = {}
+    for profile in (BuildProfile.Debug, BuildProfile.Size):
+        module = _check_build_fetch_module_impl("profiled_module", _spec(profile))
+        assert module._f(2) == 4
+        binaries[profile] = module_root_dir / f"profiled_module_ext_{profile}" / extension_filename("profiled_module")
+        assert binaries[profile].exists()
+    assert "-g" in (module_root_dir / "profiled_module_ext_debug" / "build.log").read_text().split()
+
+    # switching back doesn't rebuild
+    mtime_ns = binaries[BuildProfile.Debug].stat().st_mtime_ns
+    _check_build_fetch_module_impl("profiled_module", _spec(BuildProfile.Debug))
+    assert binaries[BuildProfile.Debug].stat().st_mtime_ns == mtime_ns
+
+
+def test_native_not_stored(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("XENOFORM_BUILD_BACKEND", "direct")
+    monkeypatch.setenv("XENOFORM_ARTEFACT_STORE", str(tmp_path))
+    # so that both profiles are built (and so published, if they are stored)
+    for profile in (BuildProfile.Native, BuildProfile.Release):
+        shutil.rmtree(module_root_dir / f"native_module_ext_{profile}", ignore_errors=True)
+    # the binary may not run on other hosts with the same architecture
+    module = _check_build_fetch_module_impl("native_module", _spec(BuildProfile.Native))
+    assert module._f(2) == 4
+    assert not any(tmp_path.iterdir())
+    _check_build_fetch_module_impl("native_module", _spec(BuildProfile.Release))
+    assert any(tmp_path.iterdir())
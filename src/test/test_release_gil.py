@@ -0,0 +1,60 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from xenoform import AnnotationError, CppQualifier, compile
+from xenoform.utils import gil_unsafe_args
+
+
+@compile(release_gil=True, extra_includes=["<chrono>"])
+def busy_wait(ms: int) -> int:  # type: ignore[empty-body]
+    """
+    auto end = std::chrono::steady_clock::now() + std::chrono::milliseconds(ms);
+    while (std::chrono::steady_clock::now() < end) {}
+    return ms;
+    """
+
+
+@compile(release_gil=True)
+def total(a: Annotated[npt.NDArray[np.float64], CppQualifier.CRef]) -> float:  # type: ignore[empty-body]
+    """
+    auto r = a.unchecked<1>();
+    double sum = 0.0;
+    for (py::ssize_t i = 0; i < r.shape(0); ++i) sum += r(i);
+    return sum;
+    """
+
+
+def test_release_gil_concurrent() -> None:
+    assert busy_wait(1) == 1
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert list(executor.map(busy_wait, [250, 250])) == [250, 250]
+    # the calls run in parallel rather than one after the other
+    assert time.perf_counter() - start < 0.45
+
+
+def test_release_gil_array() -> None:
+    assert total(np.arange(5, dtype=np.float64)) == 10.0
+
+
+def test_gil_unsafe_args() -> None:
+    def f(  # type: ignore[empty-body]
+        a: npt.NDArray[np.float64],
+        b: Annotated[npt.NDArray[np.float64], CppQualifier.CRef],
+        c: list[int],
+        *args: int,
+        **kwargs: int,
+    ) -> npt.NDArray[np.float64]: ...
+
+    assert sorted(gil_unsafe_args(f)) == ["a", "args", "return"]
+
+    with pytest.raises(AnnotationError):
+
+        @compile(release_gil=True)
+        def unsafe(a: npt.NDArray[np.float64]) -> float:  # type: ignore[empty-body]
+            "return 0.0;"
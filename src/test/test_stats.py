@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from xenoform import CallStats, compile, reset_stats, stats
+from xenoform.compile import _module_registry
+
+
+@compile(instrument=True)
+def count(n: int) -> int:  # type: ignore[empty-body]
+    """
+    int total = 0;
+    for (int i = 0; i < n; ++i) total += i % 3;
+    return total;
+    """
+
+
+@compile(instrument=True, vectorise=True)
+def square(x: float) -> float:  # type: ignore[empty-body]
+    "return x * x;"
+
+
+@compile(instrument=True, release_gil=True)
+def nogil(x: int) -> int:  # type: ignore[empty-body]
+    "return x + 1;"
+
+
+@compile(instrument=False)
+def plain(x: int) -> int:  # type: ignore[empty-body]
+    "return x;"
+
+
+def test_stats() -> None:
+    reset_stats()
+    for n in (10, 1000, 100000):
+        count(n)
+    nogil(1)
+    plain(1)
+
+    all_stats = stats()
+    assert "test_stats.plain" not in all_stats
+    count_stats = all_stats["test_stats.count"]
+    assert isinstance(count_stats, CallStats)
+    assert count_stats.calls == 3
+    assert 0 < count_stats.min_ns <= count_stats.mean_ns <= count_stats.max_ns
+    assert count_stats.total_ns >= count_stats.max_ns
+    assert count_stats.mean_ns == pytest.approx(count_stats.total_ns / 3)
+    assert sum(count_stats.histogram) == 3
+    assert all_stats["test_stats.nogil"].calls == 1
+
+
+def test_stats_vectorised() -> None:
+    reset_stats()
+    # the scalar and vectorised overloads share the same statistics, an array counts as a single call
+    square(2.0)
+    assert np.array_equal(square(np.array([1.0, 2.0])), [1.0, 4.0])  # type: ignore[arg-type]
+    assert stats()["test_stats.square"].calls == 2
+
+
+def test_reset_stats() -> None:
+    count(10)
+    reset_stats()
+    count_stats = stats()["test_stats.count"]
+    assert count_stats.calls == count_stats.total_ns == count_stats.min_ns == count_stats.max_ns == 0
+    assert count_stats.mean_ns == 0.0
+    assert not any(count_stats.histogram)
+
+
+def test_instrument_setting(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XENOFORM_INSTRUMENT", "true")
+
+    @compile()
+    def f() -> None:
+        "return;"
+
+    @compile(instrument=False)
+    def g() -> None:
+        "return;"
+
+    functions = {f.name: f for f in _module_registry["test_stats"].functions}
+    assert functions["f"].instrument
+    assert not functions["g"].instrument
+    assert not functions["plain"].instrument
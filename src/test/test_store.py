@@ -0,0 +1,96 @@
+import importlib
+import shutil
+from pathlib import Path
+
+import pytest
+
+from xenoform.compile import _check_build_fetch_module_impl, module_root_dir
+from xenoform.cppmodule import FunctionSpec, ModuleSpec, ReturnValuePolicy
+from xenoform.manifest import extension_filename
+from xenoform.store import artefact_key, local_dependencies, publish
+
+compile_module = importlib.import_module("xenoform.compile")
+
+
+def _spec() -> ModuleSpec:
+    return ModuleSpec().add_function(
+        FunctionSpec(
+            name="f",
+            body="[]() -> int { return 7; }",
+            arg_annotations="",
+            scope=(),
+            return_value_policy=ReturnValuePolicy.Automatic,
+        )
+    )
+
+
+def test_store(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("XENOFORM_ARTEFACT_STORE", str(tmp_path))
+    module_dir = module_root_dir / "stored_module_ext"
+    shutil.rmtree(module_dir, ignore_errors=True)
+
+    assert _check_build_fetch_module_impl("stored_module", _spec())._f() == 7
+    _, hashval = _spec().make_source("stored_module")
+    key = artefact_key(hashval)
+    artefact = tmp_path / key[:2] / key / extension_filename("stored_module")
+    assert artefact.exists()
+
+    # e.g. a different checkout: the module is fetched from the store rather than compiled
+    shutil.rmtree(module_dir)
+
+    def fail(*_args: object) -> None:
+        raise AssertionError("module should not be rebuilt")
+
+    monkeypatch.setattr(compile_module, "build", fail)
+    _check_build_fetch_module_impl("stored_module", _spec())
+    assert (module_dir / extension_filename("stored_module")).read_bytes() == artefact.read_bytes()
+
+    # publishing again is a no-op
+    publish(tmp_path, key, module_dir / extension_filename("stored_module"))
+    assert [p.name for p in (tmp_path / key[:2]).iterdir()] == [key]
+
+
+def test_local_dependencies_not_stored(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("XENOFORM_ARTEFACT_STORE", str(tmp_path))
+    shutil.rmtree(module_root_dir / "local_header_module_ext", ignore_errors=True)
+    # the contents of the header could differ elsewhere, which the key wouldn't reflect
+    spec = ModuleSpec(headers=['"test_lib.h"'], include_paths=["../../src/test"]).add_function(
+        FunctionSpec(
+            name="f",
+            body="[]() -> int { return fibonacci_template<10>(); }",
+            arg_annotations="",
+            scope=(),
+            return_value_policy=ReturnValuePolicy.Automatic,
+        )
+    )
+    assert local_dependencies(spec) == ['"test_lib.h"', "../../src/test"]
+    assert _check_build_fetch_module_impl("local_header_module", spec)._f() == 55
+    assert not any(tmp_path.iterdir())
+
+    assert not local_dependencies(ModuleSpec(headers=["<cmath>"], extra_link_args=["-lm", "-fopenmp"]))
+    assert local_dependencies(
+        ModuleSpec(extra_compile_args=["-Ilib"], extra_link_args=["-Llib", "-lm", "lib/x.a"])
+    ) == [
+        "-Ilib",
+        "-Llib",
+        "lib/x.a",
+    ]
+
+
+def test_publish_race(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    store, key = tmp_path / "store", "ab" * 32
+    binary = tmp_path / "module.so"
+    binary.write_bytes(b"binary")
+    copy2 = shutil.copy2
+
+    def copy_then_publish_elsewhere(src: Path, dst: Path) -> None:
+        copy2(src, dst)
+        # another process publishes the same artefact first
+        (store / key[:2] / key).mkdir()
+        (store / key[:2] / key / binary.name).write_bytes(b"other")
+
+    monkeypatch.setattr(shutil, "copy2", copy_then_publish_elsewhere)
+    publish(store, key, binary)
+    # the existing artefact is kept and the temporary directory is removed
+    assert [p.name for p in (store / key[:2]).iterdir()] == [key]
+    assert (store / key[:2] / key / binary.name).read_bytes() == b"other"
@@ -0,0 +1,48 @@
+import importlib
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+
+import pytest
+
+compile_module = importlib.import_module("xenoform.compile")
+
+
+def test_single_flight(monkeypatch: pytest.MonkeyPatch) -> None:
+    builds: Counter[str] = Counter()
+
+    def slow_build(module_name: str) -> ModuleType:
+        builds[module_name] += 1
+        time.sleep(0.5)
+        return ModuleType(module_name)
+
+    monkeypatch.setattr(compile_module, "_build", slow_build)
+    names = ["threaded_module_a", "threaded_module_b"] * 8
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(names)) as executor:
+        modules = list(executor.map(compile_module._get_module, names))
+    elapsed = time.perf_counter() - start
+
+    # each module is built once, and every caller gets the same module...
+    assert builds == {"threaded_module_a": 1, "threaded_module_b": 1}
+    assert len({id(m) for m in modules}) == 2
+    # ...and different modules are built concurrently
+    assert elapsed < 1.0
+
+
+def test_failed_build_is_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    attempts = 0
+
+    def flaky_build(module_name: str) -> ModuleType:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise RuntimeError("first attempt fails")
+        return ModuleType(module_name)
+
+    monkeypatch.setattr(compile_module, "_build", flaky_build)
+    with pytest.raises(RuntimeError):
+        compile_module._get_module("flaky_module")
+    assert compile_module._get_module("flaky_module").__name__ == "flaky_module"
@@ -1,7 +1,12 @@
+import platform
+from pathlib import Path
+
 import numpy as np
 import pytest
 
-from xenoform import compile
+from xenoform import build, compile
+from xenoform.compile import _get_function
+from xenoform.cppmodule import FunctionSpec, ModuleSpec, ReturnValuePolicy
 
 
 @compile(vectorise=True)
@@ -17,6 +22,17 @@ def test_vectorised_max_scalar() -> None:
     assert maxv(0, 1) == 1
 
 
+def test_vectorised_scalar_overload() -> None:
+    # scalars call the scalar overload, everything else the vectorised one
+    assert "Overloaded function" in (_get_function("test_vectorise", "_maxv").__doc__ or "")
+    assert type(maxv(0, 1)) is int
+    # size-1 arrays aren't converted to scalars
+    assert isinstance(maxv(np.array([0]), np.array([1])), np.ndarray)  # type: ignore[arg-type]
+    assert isinstance(maxv(np.array([0.0]), 1), np.ndarray)  # type: ignore[arg-type]
+    assert (maxv([0], [1]) == [1]).all()  # type: ignore[arg-type, attr-defined, comparison-overlap]
+    assert maxv(np.int64(2), 1) == 2  # type: ignore[arg-type]
+
+
 def test_vectorised_max_incompatible() -> None:
     with pytest.raises(RuntimeError):
         maxv(range(5), range(6))  # type: ignore[arg-type]
@@ -30,3 +46,81 @@ def test_vectorised_max_mixed_2d() -> None:
     a = np.ones((3, 3))
     b = np.array([0, 1, 2])
     assert (maxv(a, b) == np.array([[1, 1, 2]] * 3)).all()  # type: ignore[arg-type, attr-defined]
+
+
+def test_vectorise_invalid() -> None:
+    with pytest.raises(ValueError):
+
+        @compile(vectorise="serial")  # type: ignore[arg-type]
+        def f(i: int) -> int:  # type: ignore[empty-body]
+            "return i;"
+
+    with pytest.raises(ValueError):
+
+        @compile(vectorise=True, release_gil=True)
+        def g(i: int) -> int:  # type: ignore[empty-body]
+            "return i;"
+
+
+@pytest.mark.parametrize(
+    ("system", "flags"),
+    [
+        ("Linux", (["-fopenmp"], ["-fopenmp"])),
+        ("Darwin", (["-Xpreprocessor", "-fopenmp"], ["-lomp"])),
+        ("Windows", (["/openmp"], [])),
+    ],
+)
+def test_openmp_flags(monkeypatch: pytest.MonkeyPatch, system: str, flags: tuple[list[str], list[str]]) -> None:
+    monkeypatch.setattr(platform, "system", lambda: system)
+    assert build._openmp_candidates()[0] == flags
+    monkeypatch.setattr(build, "_openmp_supported", lambda *_: True)
+    build.openmp_flags.cache_clear()
+    assert build.openmp_flags() == flags
+    build.openmp_flags.cache_clear()
+
+
+def test_openmp_homebrew(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    # libomp is keg-only, so isn't on the default search paths
+    monkeypatch.setattr(platform, "system", lambda: "Darwin")
+    monkeypatch.setenv("HOMEBREW_PREFIX", str(tmp_path))
+    (tmp_path / "opt" / "libomp").mkdir(parents=True)
+    libomp = tmp_path / "opt" / "libomp"
+    monkeypatch.setattr(build, "_openmp_supported", lambda _, link_args: f"-L{libomp}/lib" in link_args)
+    build.openmp_flags.cache_clear()
+    assert build.openmp_flags() == (
+        ["-Xpreprocessor", "-fopenmp", f"-I{libomp}/include"],
+        [f"-L{libomp}/lib", "-lomp"],
+    )
+    build.openmp_flags.cache_clear()
+
+
+def test_openmp_at_build(monkeypatch: pytest.MonkeyPatch) -> None:
+    # the flags are added when a module with a parallel function is built, not when it's registered
+    monkeypatch.setattr(build, "openmp_flags", lambda: (["-fopenmp"], ["-lgomp"]))
+    cases: list[tuple[bool | str, bool]] = [(True, False), ("parallel", True)]
+    for vectorise, expected in cases:
+        spec = ModuleSpec().add_function(
+            FunctionSpec(
+                name="f",
+                body="[](int i) { return i; }",
+                arg_annotations=', py::arg("i")',
+                scope=(),
+                return_value_policy=ReturnValuePolicy.Automatic,
+                vectorise=vectorise,
+            )
+        )
+        assert not spec.extra_compile_args
+        assert ("-fopenmp" in build.compile_flags(spec)) == expected
+        assert ("-lgomp" in build.link_flags(spec)) == expected
+
+
+def test_openmp_unsupported(monkeypatch: pytest.MonkeyPatch) -> None:
+    # parallel loops run serially
+    monkeypatch.setattr(platform, "system", lambda: "Linux")
+    monkeypatch.setattr(build, "_openmp_supported", lambda *_: False)
+    build.openmp_flags.cache_clear()
+    assert build.openmp_flags() == ([], [])
+    build.openmp_flags.cache_clear()
+    # with the running compiler (and without caching the unsupported flags)
+    monkeypatch.undo()
+    assert build._openmp_supported(*build.openmp_flags()) or build.openmp_flags() == ([], [])
@@ -0,0 +1,93 @@
+import importlib
+import importlib.machinery
+import sys
+import time
+from types import ModuleType
+
+import pytest
+
+from xenoform import CompilationError, compile, warmup
+
+compile_module = importlib.import_module("xenoform.compile")
+
+
+@compile()
+def warm(i: int) -> int:  # type: ignore[empty-body]
+    """
+    return i + 1;
+    """
+
+
+def test_warmup() -> None:
+    timings = warmup(["test_warmup"])
+    assert list(timings) == ["test_warmup"]
+    assert timings["test_warmup"] >= 0.0
+    assert warm(1) == 2
+
+
+def test_warmup_no_wait() -> None:
+    assert warmup(["test_warmup"], wait=False) == {}
+    assert compile_module._builds["test_warmup"].result().__name__ == "test_warmup_ext.test_warmup"
+
+
+def test_warmup_unknown_module() -> None:
+    with pytest.raises(ValueError):
+        warmup(["not_a_registered_module"])
+
+
+def test_warmup_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(_module_name: str, _module_spec: object) -> None:
+        raise CompilationError("oops")
+
+    monkeypatch.setattr(compile_module, "_check_build_fetch_module_impl", fail)
+    monkeypatch.setitem(compile_module._module_registry, "failing_module", compile_module.ModuleSpec())
+    with pytest.raises(ExceptionGroup) as e:
+        warmup(["failing_module"])
+    assert e.group_contains(CompilationError)
+    # failed builds can be retried
+    assert "failing_module" not in compile_module._builds
+
+
+def test_prebuild(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XENOFORM_PREBUILD", "true")
+    # it may already have been built, e.g. by another test
+    monkeypatch.setattr(compile_module, "_prebuilding", set())
+    monkeypatch.delitem(compile_module._builds, "prebuilt_module", raising=False)
+    # (re)import, since it may already have been imported during collection
+    prebuilt_module_name = f"{__package__}.prebuilt_module"
+    monkeypatch.delitem(sys.modules, prebuilt_module_name, raising=False)
+    prebuilt_module = importlib.import_module(prebuilt_module_name)
+
+    assert "prebuilt_module" in compile_module._prebuilding
+    # the build is started in the background once the module has been imported
+    for _ in range(1000):
+        if future := compile_module._builds.get("prebuilt_module"):
+            break
+        time.sleep(0.01)
+    assert future
+    assert future.result().__name__ == "prebuilt_module_ext.prebuilt_module"
+    assert prebuilt_module.prebuilt(2) == 4
+
+
+def test_schedule_prebuild_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    started: list[str] = []
+    monkeypatch.setattr(compile_module, "_build_async", started.append)
+    monkeypatch.setattr(compile_module, "_prebuilding", set())
+    # functions in scripts are never prebuilt
+    compile_module._schedule_prebuild("script_module", "__main__")
+    assert not compile_module._prebuilding
+    # waits for the python module to finish importing
+    module = ModuleType("importing_module")
+    module.__spec__ = importlib.machinery.ModuleSpec("importing_module", None)
+    module.__spec__._initializing = True  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "importing_module", module)
+    compile_module._schedule_prebuild("importing_module", "importing_module")
+    compile_module._schedule_prebuild("importing_module", "importing_module")
+    time.sleep(0.05)
+    assert not started
+    module.__spec__._initializing = False  # type: ignore[attr-defined]
+    for _ in range(100):
+        if started:
+            break
+        time.sleep(0.01)
+    assert started == ["importing_module"]
@@ -3,10 +3,12 @@ import importlib.metadata
 __version__ = importlib.metadata.version("xenoform")
 
 
-from .compile import compile
+from .build import BuildProfile
+from .compile import CallStats, array_copies, compile, reset_stats, starmap, stats, warmup
 from .cppmodule import ReturnValuePolicy
 from .errors import AnnotationError, CompilationError, CppTypeError
-from .types import CppQualifier
+from .events import Event, Phase, subscribe
+from .types import ArrayView, CppQualifier, PandasView
 from .utils import (
     Platform,
     platform_specific,
@@ -14,12 +16,24 @@ from .utils import (
 
 __all__ = [
     "AnnotationError",
+    "ArrayView",
+    "BuildProfile",
+    "CallStats",
     "CompilationError",
     "CppQualifier",
     "CppTypeError",
+    "Event",
+    "PandasView",
+    "Phase",
     "Platform",
     "ReturnValuePolicy",
     "__version__",
+    "array_copies",
     "compile",
     "platform_specific",
+    "reset_stats",
+    "starmap",
+    "stats",
+    "subscribe",
+    "warmup",
 ]
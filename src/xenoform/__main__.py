@@ -0,0 +1,145 @@
+"""
+Command line interface, e.g. to build all the compiled modules in a package ahead of time:
+
+python -m xenoform build my_package -j 8
+
+or to build the compiled modules used by a script with profile-guided optimisation:
+
+python -m xenoform pgo workload.py
+"""
+
+import argparse
+import importlib
+import os
+import pkgutil
+import platform
+import subprocess
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+from types import ModuleType
+
+from xenoform.build import BuildBackend, BuildProfile
+from xenoform.compile import _module_registry, warmup
+from xenoform.config import get_setting
+
+
+def _import_path(path: Path) -> ModuleType:
+    """Import a python source file, as part of its package if it's in one"""
+    path = path.resolve()
+    parts = [] if path.stem == "__init__" else [path.stem]
+    parent = path.parent
+    while (parent / "__init__.py").exists():
+        parts.insert(0, parent.name)
+        parent = parent.parent
+    if str(parent) not in sys.path:
+        sys.path.insert(0, str(parent))
+    return importlib.import_module(".".join(parts))
+
+
+def _import_target(target: str) -> list[ModuleType]:
+    """Import a python source file, all the python files in a directory, or a module or package (and submodules)"""
+    path = Path(target)
+    if path.is_file():
+        return [_import_path(path)]
+    if path.is_dir():
+        return [_import_path(file) for file in sorted(path.rglob("*.py"))]
+    module = importlib.import_module(target)
+    modules = [module]
+    if hasattr(module, "__path__"):
+        modules.extend(
+            importlib.import_module(info.name)
+            for info in pkgutil.walk_packages(module.__path__, prefix=module.__name__ + ".")
+        )
+    return modules
+
+
+def _set_build_backend(jobs: int) -> None:
+    """
+    The setuptools backend builds one module at a time, so use the direct backend for parallel builds, unless a backend
+    has been configured
+    """
+    backend = get_setting("build_backend", "")
+    if jobs == 1 or backend == BuildBackend.Direct:
+        return
+    if not backend and platform.system() != "Windows":
+        os.environ["XENOFORM_BUILD_BACKEND"] = BuildBackend.Direct.value
+    else:
+        print(
+            f"warning: the setuptools build backend builds one module at a time, not {jobs}. Set build_backend to "
+            '"direct" (where supported) for parallel builds',
+            file=sys.stderr,
+        )
+
+
+def build(targets: Sequence[str], jobs: int, profile: str | None = None) -> int:
+    """Import the targets and build all the compiled modules they contain. Returns the number of failures"""
+    os.environ["XENOFORM_BUILD_WORKERS"] = str(jobs)
+    _set_build_backend(jobs)
+    if profile:
+        os.environ["XENOFORM_PROFILE"] = profile
+
+    errors: list[Exception] = []
+    module_names: set[str] = set()
+    for target in targets:
+        try:
+            module_names.update(Path(m.__file__).stem for m in _import_target(target) if m.__file__)
+        except Exception as e:
+            errors.append(e)
+    module_names &= set(_module_registry)
+
+    try:
+        timings = warmup(sorted(module_names))
+    except ExceptionGroup as eg:
+        errors.extend(eg.exceptions)
+    else:
+        for name, t in timings.items():
+            print(f"{name}: {t:.3f}s")
+
+    for error in errors:
+        print(f"{type(error).__name__}: {error}", file=sys.stderr)
+    return len(errors)
+
+
+def pgo(workload: str, args: Sequence[str], jobs: int) -> int:
+    """
+    Run the workload with the compiled modules it uses built with instrumentation, to collect profile data, then
+    rebuild the modules in the workload script using the profile data. Returns the number of failures
+    """
+    p = subprocess.run([sys.executable, workload, *args], env={**os.environ, "XENOFORM_PGO": "generate"}, check=False)
+    if p.returncode:
+        print(f"workload {workload} failed ({p.returncode})", file=sys.stderr)
+        return 1
+    return build([workload], jobs)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Entry point for python -m xenoform"""
+    parser = argparse.ArgumentParser(prog="python -m xenoform", description="xenoform command line tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="build all the compiled modules in packages/modules/files")
+    build_parser.add_argument("targets", nargs="+", help="package or module names, or paths to files or directories")
+    build_parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="number of parallel builds")
+    build_parser.add_argument(
+        "-p", "--profile", choices=list(BuildProfile), help="build profile, overriding any set in the code or config"
+    )
+
+    pgo_parser = subparsers.add_parser(
+        "pgo", help="build the compiled modules in a script with profile-guided optimisation, using it as the workload"
+    )
+    pgo_parser.add_argument("workload", help="path to a python script that runs a representative workload")
+    pgo_parser.add_argument("args", nargs=argparse.REMAINDER, help="arguments for the workload")
+    pgo_parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="number of parallel builds")
+
+    args = parser.parse_args(argv)
+    match args.command:
+        case "build":
+            return 1 if build(args.targets, args.jobs, args.profile) else 0
+        case "pgo":
+            return 1 if pgo(args.workload, args.args, args.jobs) else 0
+    return 2  # pragma: no cover
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,450 @@
+import os
+import platform
+import shlex
+import shutil
+import subprocess
+import sysconfig
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from enum import StrEnum
+from functools import cache
+from hashlib import sha256
+from pathlib import Path
+from typing import TextIO
+
+import numpy as np
+import pybind11
+from pybind11.setup_helpers import Pybind11Extension, build_ext
+from setuptools import setup
+
+from xenoform.config import get_setting
+from xenoform.cppmodule import ModuleSpec
+from xenoform.errors import CompilationError
+from xenoform.events import Phase, timed
+from xenoform.logger import get_logger
+from xenoform.manifest import extension_filename
+from xenoform.utils import _deduplicate, group_headers
+
+logger = get_logger()
+
+
+class BuildBackend(StrEnum):
+    """How compiled modules are built"""
+
+    Setuptools = "setuptools"
+    Direct = "direct"
+
+
+class BuildProfile(StrEnum):
+    """Named sets of optimisation flags. Modules built with each profile are kept separately"""
+
+    Default = "default"
+    Debug = "debug"
+    Release = "release"
+    Native = "native"
+    Lto = "lto"
+    Size = "size"
+
+
+def build_profile(profile: str | None = None) -> BuildProfile:
+    """
+    The build profile: the XENOFORM_PROFILE environment variable takes precedence over the requested profile (i.e.
+    from the decorator), which takes precedence over the profile setting in xenoform.toml
+    """
+    if profile is None or "XENOFORM_PROFILE" in os.environ:
+        profile = get_setting("profile", BuildProfile.Default.value)
+    return BuildProfile(profile)
+
+
+class Pgo(StrEnum):
+    """Profile-guided optimisation settings"""
+
+    # use the profile data for the module, if present
+    Auto = "auto"
+    # instrument modules to collect profile data
+    Generate = "generate"
+    # ignore any profile data
+    Off = "off"
+
+
+# the subdirectory of the module directory containing the profile data
+PGO_DIR = "pgo"
+
+
+def pgo_stage(module_dir: Path) -> str | None:
+    """Whether the module should be built to generate profile data, or to use it, or neither"""
+    match Pgo(get_setting("pgo", Pgo.Auto.value)):
+        case Pgo.Generate:
+            return "generate"
+        case Pgo.Auto if any((module_dir / PGO_DIR).glob("*.gcda")):
+            return "use"
+    return None
+
+
+def pgo_flags(stage: str | None, module_dir: Path, build_dir: Path) -> tuple[list[str], list[str]]:
+    """
+    The compiler and linker flags for the PGO stage. The profile data files are named after the object files' paths
+    relative to build_dir, so they are found when the module is rebuilt, even in a different (temporary) directory
+    """
+    if not stage:
+        return [], []
+    if platform.system() == "Windows" or "clang" in compiler_version(tuple(compiler())):
+        raise CompilationError("profile-guided optimisation is only supported with GCC")
+    pgo_dir = module_dir.resolve() / PGO_DIR
+    prefix = f"-fprofile-prefix-path={build_dir.resolve()}"
+    if stage == "generate":
+        return [f"-fprofile-generate={pgo_dir}", prefix], ["-fprofile-generate"]
+    # allow for inconsistent counts from multithreaded workloads, and profiles from earlier versions of the code
+    return [
+        f"-fprofile-use={pgo_dir}",
+        prefix,
+        "-fprofile-correction",
+        "-Wno-missing-profile",
+        "-Wno-error=coverage-mismatch",
+    ], []
+
+
+# setuptools builds change the working directory and redirect stdout, so cannot run concurrently
+_setuptools_lock = threading.Lock()
+# objects may be compiled in parallel
+_log_lock = threading.Lock()
+# limits the compiler processes running at once, across concurrent module builds and the objects within them
+_compiler_slots: dict[int, threading.Semaphore] = {}
+_compiler_slots_lock = threading.Lock()
+
+
+def _parse_macros(macro_list: list[str]) -> dict[str, str | None]:
+    """Map ["DEF1", "DEF2=3"] to {"DEF1": None, "DEF2": "3"}"""
+    return {kv[0]: kv[1] if len(kv) == 2 else None for d in macro_list for kv in [d.split("=", 1)]}
+
+
+def include_dir() -> str:
+    """The location of the headers shipped with xenoform"""
+    return str(Path(__file__).parent / "include")
+
+
+def _include_dirs(module_spec: ModuleSpec) -> list[str]:
+    return [np.get_include(), include_dir(), *_deduplicate(module_spec.include_paths)]
+
+
+def _openmp_candidates() -> list[tuple[list[str], list[str]]]:
+    """The compiler and linker flags that might enable OpenMP, in order of preference"""
+    match platform.system():
+        case "Windows":
+            return [(["/openmp"], [])]
+        case "Darwin":
+            # Apple clang requires libomp, e.g. from homebrew, which (being keg-only) isn't on the default search paths
+            prefixes = _deduplicate([os.environ.get("HOMEBREW_PREFIX", "/opt/homebrew"), "/opt/homebrew", "/usr/local"])
+            return [(["-Xpreprocessor", "-fopenmp"], ["-lomp"])] + [
+                (["-Xpreprocessor", "-fopenmp", f"-I{libomp}/include"], [f"-L{libomp}/lib", "-lomp"])
+                for libomp in (Path(prefix) / "opt" / "libomp" for prefix in prefixes)
+                if libomp.is_dir()
+            ]
+        case _:
+            return [(["-fopenmp"], ["-fopenmp"])]
+
+
+def _openmp_supported(compile_args: list[str], link_args: list[str]) -> bool:
+    """Whether a program using OpenMP can be compiled and linked with the flags"""
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "openmp.cpp"
+        source.write_text("#include <omp.h>\nint main() { return omp_get_max_threads() > 0 ? 0 : 1; }\n")
+        cmd = [*compiler(), *compile_args, str(source), "-o", str(Path(tmp) / "openmp"), *link_args]
+        return subprocess.run(cmd, capture_output=True, check=False).returncode == 0
+
+
+@cache
+def openmp_flags() -> tuple[list[str], list[str]]:
+    """
+    The compiler and linker flags that enable OpenMP. If the compiler doesn't support it (e.g. Apple clang without
+    libomp) there are none, and parallel vectorised loops run serially
+    """
+    candidates = _openmp_candidates()
+    # MSVC always supports it
+    if platform.system() == "Windows":
+        return candidates[0]
+    for compile_args, link_args in candidates:
+        if _openmp_supported(compile_args, link_args):
+            return compile_args, link_args
+    logger("OpenMP is not available, so parallel vectorised functions will run serially")
+    return [], []
+
+
+def profile_flags(profile: BuildProfile) -> tuple[list[str], list[str]]:
+    """The compiler and linker flags for the build profile. These precede any extra compile and link args"""
+    msvc = platform.system() == "Windows"
+    match profile:
+        case BuildProfile.Debug:
+            # python is built with -DNDEBUG, which would disable assertions
+            return (["/Od", "/Zi"], ["/DEBUG"]) if msvc else (["-O0", "-g", "-UNDEBUG"], [])
+        case BuildProfile.Release:
+            return (["/O2"], []) if msvc else (["-O3"], [])
+        case BuildProfile.Native:
+            # MSVC has no equivalent of -march=native
+            return (["/O2"], []) if msvc else (["-O3", "-march=native"], [])
+        case BuildProfile.Lto:
+            return (["/O2", "/GL"], ["/LTCG"]) if msvc else (["-O3", "-flto"], ["-flto"])
+        case BuildProfile.Size:
+            if msvc:
+                return ["/O1"], []
+            # symbols are hidden by default, also strip them (the macOS linker doesn't support -s)
+            return ["-Os"], ["-Wl,-x"] if platform.system() == "Darwin" else ["-s"]
+        case _:
+            return [], []
+
+
+def _extra_args(module_spec: ModuleSpec) -> tuple[list[str], list[str]]:
+    """The module's extra compile and link args, preceded by those of its build profile (and OpenMP, if required)"""
+    compile_args, link_args = profile_flags(BuildProfile(module_spec.profile or BuildProfile.Default))
+    # only resolved when a module is built, since checking OpenMP support compiles a test program
+    if any(function.vectorise == "parallel" for function in module_spec.functions):
+        openmp_compile_args, openmp_link_args = openmp_flags()
+        compile_args, link_args = compile_args + openmp_compile_args, link_args + openmp_link_args
+    return (
+        _deduplicate([*compile_args, *module_spec.extra_compile_args]),
+        _deduplicate([*link_args, *module_spec.extra_link_args]),
+    )
+
+
+def build_setuptools(module_name: str, module_dir: Path, module_spec: ModuleSpec) -> None:
+    """Build module.cpp in module_dir using setuptools and pybind11's extension helpers"""
+    extra_compile_args, extra_link_args = _extra_args(module_spec)
+    pgo_compile_args, pgo_link_args = pgo_flags(module_spec.pgo, module_dir, module_dir)
+    ext_modules = [
+        Pybind11Extension(
+            module_name,
+            ["module.cpp"],
+            define_macros=list(_parse_macros(_deduplicate(module_spec.define_macros)).items()),
+            extra_compile_args=extra_compile_args + pgo_compile_args,
+            extra_link_args=extra_link_args + pgo_link_args,
+            include_dirs=_include_dirs(module_spec),
+            cxx_std=module_spec.cxx_std,
+        )
+    ]
+
+    with _setuptools_lock:
+        cwd = Path.cwd()
+        try:
+            os.chdir(module_dir)
+            # Redirect stdout to a log file (does not work in pytest)
+            # Redirecting stderr doesnt work at all
+            with Path("./build.log").open("w") as fd, redirect_stdout(fd), redirect_stderr(fd):
+                setup(
+                    name=module_name + "_ext",
+                    ext_modules=ext_modules,
+                    script_args=["build_ext", "--inplace"],
+                    cmdclass={"build_ext": build_ext},
+                )
+        except SystemExit as e:
+            raise CompilationError(str(e)) from e
+        finally:
+            os.chdir(cwd)
+
+
+def compiler() -> list[str]:
+    """The C++ compiler command, as used by setuptools"""
+    return shlex.split(os.environ.get("CXX") or sysconfig.get_config_var("CXX") or "c++")
+
+
+@cache
+def compiler_version(cxx: tuple[str, ...]) -> str:
+    """The first line of the compiler's --version output"""
+    p = subprocess.run([*cxx, "--version"], capture_output=True, text=True, check=False)
+    return p.stdout.partition("\n")[0]
+
+
+def compile_flags(module_spec: ModuleSpec) -> list[str]:
+    """The compiler flags that setuptools and Pybind11Extension would use"""
+    flags = [
+        *shlex.split(sysconfig.get_config_var("OPT") or ""),
+        *shlex.split(sysconfig.get_config_var("CCSHARED") or ""),
+        "-fvisibility=hidden",
+        f"-std=c++{module_spec.cxx_std}",
+    ]
+    env_flags = shlex.split(os.environ.get("CFLAGS", "")) + shlex.split(os.environ.get("CPPFLAGS", ""))
+    if not any(flag.startswith("-g") for flag in env_flags):
+        flags.append("-g0")
+    flags.extend(env_flags)
+    if platform.system() == "Darwin":
+        flags.append("-stdlib=libc++")
+    paths = sysconfig.get_paths()
+    include_dirs = [paths["include"], paths["platinclude"], pybind11.get_include(), *_include_dirs(module_spec)]
+    flags.extend(f"-I{include_dir}" for include_dir in _deduplicate(include_dirs))
+    for name, value in _parse_macros(_deduplicate(module_spec.define_macros)).items():
+        flags.append(f"-D{name}" if value is None else f"-D{name}={value}")
+    return flags + _extra_args(module_spec)[0]
+
+
+def link_flags(module_spec: ModuleSpec) -> list[str]:
+    """The linker flags for a python extension module"""
+    if platform.system() == "Darwin":
+        flags = ["-bundle", "-undefined", "dynamic_lookup", "-stdlib=libc++"]
+    else:
+        flags = ["-shared"]
+    flags.extend(shlex.split(os.environ.get("LDFLAGS", "")))
+    return flags + _extra_args(module_spec)[1]
+
+
+def _compiler_slot() -> threading.Semaphore:
+    """
+    A slot for a compiler process. There are build_workers slots in total, so that compiling the objects of a module in
+    parallel, while other modules are being built, doesn't start more processes than that
+    """
+    workers = get_setting("build_workers", os.cpu_count() or 1)
+    with _compiler_slots_lock:
+        return _compiler_slots.setdefault(workers, threading.Semaphore(max(workers, 1)))
+
+
+def _run(cmd: list[str], log: TextIO) -> int:
+    """
+    Run a compiler command, logging its output and raising CompilationError if it fails. Returns the peak resident set
+    size of the command, in bytes
+    """
+    with _compiler_slot(), subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True) as p:
+        output = p.stdout.read() if p.stdout else ""
+        # wait4, unlike wait, returns the resource usage of the process
+        _, status, usage = os.wait4(p.pid, 0)
+        p.returncode = os.waitstatus_to_exitcode(status)
+    with _log_lock:
+        log.write(shlex.join(cmd) + "\n" + output)
+        log.flush()
+    if p.returncode:
+        raise CompilationError(f"{shlex.join(cmd)} failed ({p.returncode}):\n{output}")
+    # kB on linux, bytes on macOS
+    return usage.ru_maxrss * (1 if platform.system() == "Darwin" else 1024)
+
+
+def _precompiled_header(
+    cxx: list[str], flags: list[str], module_spec: ModuleSpec, pch_root: Path, log: TextIO
+) -> list[str]:
+    """
+    Returns the flags required to use a precompiled header containing the module's pybind11 headers, building it if
+    necessary. Headers are cached by header set, compiler and flags, so are shared by all modules that match.
+    """
+    headers = [h for h in group_headers(module_spec.headers)[2] if h.startswith("<pybind11/")]
+    version = compiler_version(tuple(cxx))
+    key = sha256("\n".join([*headers, version, *cxx, *flags]).encode()).hexdigest()
+    pch_dir = pch_root / key
+    header = pch_dir / "xenoform_pch.h"
+    pch = pch_dir / ("xenoform_pch.h.pch" if "clang" in version else "xenoform_pch.h.gch")
+    if not pch.exists():
+        logger(f"building precompiled header {pch}")
+        pch_dir.mkdir(parents=True, exist_ok=True)
+        # write then rename, so that concurrent builds never see partial files
+        tmp_header = pch_dir / f".xenoform_pch.h.{os.getpid()}.{threading.get_ident()}"
+        tmp_header.write_text("".join(f"#include {h}\n" for h in headers))
+        tmp_header.replace(header)
+        tmp_pch = pch.with_name(f".{pch.name}.{os.getpid()}.{threading.get_ident()}")
+        try:
+            _run([*cxx, *flags, "-x", "c++-header", str(header), "-o", str(tmp_pch)], log)
+        except CompilationError:
+            # not fatal, just compile without
+            logger("failed to build precompiled header, see build.log")
+            return []
+        tmp_pch.replace(pch)
+    return ["-include", str(header)]
+
+
+def _compile_split(
+    module_name: str, module_dir: Path, module_spec: ModuleSpec, cxx: list[str], flags: list[str], log: TextIO
+) -> tuple[list[Path], int, int]:
+    """
+    Compile the module definition and each function separately (and concurrently), caching the objects by the hash of
+    their source, compiler and flags, so that only those that have changed need to be recompiled. Returns the objects,
+    the number compiled, and the peak resident set size (in bytes) of the compiler.
+    """
+    code, units = module_spec.make_split_source(module_name)
+    _, hashval = module_spec.make_source(module_name)
+    src_dir, obj_dir = module_dir / "src", module_dir / "obj"
+    src_dir.mkdir(exist_ok=True)
+    obj_dir.mkdir(exist_ok=True)
+    toolchain = "\n".join([compiler_version(tuple(cxx)), *cxx, *flags])
+
+    objects: list[Path] = []
+    pending: list[tuple[Path, Path]] = []
+    for name, unit_code in {"module": code.replace("__HASH__", hashval), **units}.items():
+        key = sha256((unit_code + toolchain).encode()).hexdigest()
+        obj = obj_dir / f"{name}-{key[:16]}.o"
+        objects.append(obj)
+        if not obj.exists():
+            source = src_dir / f"{name}.cpp"
+            source.write_text(unit_code)
+            pending.append((source, obj))
+
+    logger(f"compiling {len(pending)} of {len(objects)} objects for {module_name}")
+
+    def compile_object(source: Path, obj: Path) -> int:
+        tmp_obj = obj.with_name(f".{obj.name}.{os.getpid()}")
+        peak_rss = _run([*cxx, *flags, "-c", str(source), "-o", str(tmp_obj)], log)
+        tmp_obj.replace(obj)
+        return peak_rss
+
+    # the number of compiler processes (including those building other modules) is limited by _compiler_slot
+    with ThreadPoolExecutor(max_workers=get_setting("build_workers", os.cpu_count() or 1)) as executor:
+        # consuming the results propagates any errors
+        peak_rss = max(executor.map(lambda job: compile_object(*job), pending), default=0)
+
+    # remove objects from previous builds
+    for obj in obj_dir.iterdir():
+        if obj not in objects:
+            obj.unlink(missing_ok=True)
+    return objects, len(pending), peak_rss
+
+
+def build_direct(module_name: str, module_dir: Path, module_spec: ModuleSpec) -> None:
+    """
+    Build module.cpp in module_dir by invoking the compiler and linker directly. The build takes place in a temporary
+    directory and the module is moved into place when complete. The working directory is never changed so builds of
+    different modules can safely run concurrently.
+    """
+    if platform.system() == "Windows":
+        raise CompilationError("the direct build backend does not support MSVC, use the setuptools backend")
+    cxx = compiler()
+    qualified_name = f"{module_dir.name}.{module_name}"
+    with (
+        (module_dir / "build.log").open("w") as log,
+        tempfile.TemporaryDirectory(dir=module_dir, prefix=".build-") as tmp,
+    ):
+        build_dir = Path(tmp)
+        # relative, since GCC only names profile data files relative to the build directory for relative paths
+        obj = Path(os.path.relpath(build_dir / "module.o"))
+        binary = build_dir / extension_filename(module_name)
+        flags = compile_flags(module_spec)
+        pgo_compile_args, pgo_link_args = pgo_flags(module_spec.pgo, module_dir, build_dir)
+        # the profile data is named after the object file, so PGO builds compile a single, uncached, object. Modules
+        # that only use the capi binding don't include pybind11, so don't need the precompiled header
+        if get_setting("precompiled_headers", True) and not (module_spec.pgo or module_spec.capi_only()):
+            flags += _precompiled_header(cxx, flags, module_spec, module_dir.parent / "_pch", log)
+        with timed(Phase.Compile, qualified_name) as details:
+            if get_setting("incremental_build", False) and module_spec.can_split() and not module_spec.pgo:
+                objects, compiled, peak_rss = _compile_split(module_name, module_dir, module_spec, cxx, flags, log)
+            else:
+                peak_rss = _run(
+                    [*cxx, *flags, *pgo_compile_args, "-c", str(module_dir / "module.cpp"), "-o", str(obj)], log
+                )
+                objects, compiled = [obj], 1
+            details.update(objects=len(objects), compiled=compiled, peak_rss_bytes=peak_rss)
+        with timed(Phase.Link, qualified_name) as details:
+            peak_rss = _run(
+                [*cxx, *map(str, objects), "-o", str(binary), *link_flags(module_spec), *pgo_link_args], log
+            )
+            details.update(size_bytes=binary.stat().st_size, peak_rss_bytes=peak_rss)
+        binary.replace(module_dir / binary.name)
+
+
+def build(module_name: str, module_dir: Path, module_spec: ModuleSpec) -> None:
+    """Build the module using the configured backend"""
+    backend = BuildBackend(get_setting("build_backend", BuildBackend.Setuptools.value))
+    logger(f"building {module_dir.name}.{module_name} with {backend} backend...")
+    if module_spec.pgo == "generate":
+        # otherwise the new profile data would be merged with that from a previous version
+        shutil.rmtree(module_dir / PGO_DIR, ignore_errors=True)
+    match backend:
+        case BuildBackend.Setuptools:
+            with timed(Phase.Build, f"{module_dir.name}.{module_name}") as details:
+                build_setuptools(module_name, module_dir, module_spec)
+                details["size_bytes"] = (module_dir / extension_filename(module_name)).stat().st_size
+        case BuildBackend.Direct:
+            build_direct(module_name, module_dir, module_spec)
@@ -0,0 +1,134 @@
+"""Bindings generated directly against the CPython C API, rather than pybind11, for compile(binding="capi")"""
+
+import inspect
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from xenoform.errors import AnnotationError, CppTypeError
+from xenoform.types import translate_type
+from xenoform.utils import _translate_value
+
+# C++ types that can be converted directly
+_SCALAR_TYPES = ("bool", "int", "int32_t", "int64_t", "float", "double")
+_SPAN_ELEMENT_TYPES = ("int32_t", "int64_t", "float", "double")
+
+_definition_template = """
+  {{
+    static PyMethodDef functions[] = {{
+        {{"{function_name}",
+         reinterpret_cast<PyCFunction>(reinterpret_cast<void (*)()>(
+             +[](PyObject*, PyObject* const* args_, Py_ssize_t nargs_, PyObject* kwnames_) -> PyObject* {{
+               static const char* const names_[] = {{{names}nullptr}};
+               PyObject* values_[{n} + 1];
+               if (!xenoform::capi::parse_args("{name}", names_, {n}, {pos_only}, {max_positional}, args_, nargs_,
+                                               kwnames_, values_))
+                 return nullptr;
+               {arg_holders}
+               if (!({arg_loads}))
+                 return nullptr;
+               return xenoform::capi::call<{release_gil}>({function_body}{arg_values});
+             }})),
+         METH_FASTCALL | METH_KEYWORDS, R\"\"\"({doc})\"\"\"}},
+        {{nullptr, nullptr, 0, nullptr}}}};
+    xenoform::capi::add_functions(m, functions);
+  }}
+"""
+
+
+@dataclass(frozen=True)
+class CApiArg:
+    """An argument: its name, C++ type, and default value (as C++), if any"""
+
+    name: str
+    type: str
+    default: str | None = None
+
+
+@dataclass(frozen=True)
+class CApiSignature:
+    """
+    A function signature translated for the C API binding. Only scalars (bool, integers and floating point) and 1-D
+    array views are supported, so the conversions are simple enough to generate without pybind11
+    """
+
+    name: str
+    args: tuple[CApiArg, ...]
+    return_type: str
+    # the number of positional-only arguments, and the number that can be passed by position
+    pos_only: int
+    max_positional: int
+    # the python signature, without annotations, e.g. "(x, n=3)"
+    text_signature: str
+
+    def lambda_signature(self) -> str:
+        """The C++ lambda implementing the function, without the body"""
+        return f"[]({', '.join(f'{arg.type} {arg.name}' for arg in self.args)}) -> {self.return_type}"
+
+    def definition(self, function_name: str, function_body: str, help: str | None, *, release_gil: bool) -> str:
+        """
+        The code that adds the function to the module (m, a PyObject* or a pybind11 module), as a METH_FASTCALL
+        wrapper that converts the arguments and calls the function body
+        """
+        return _definition_template.format(
+            function_name=function_name,
+            name=self.name,
+            names="".join(f'"{arg.name}", ' for arg in self.args),
+            n=len(self.args),
+            pos_only=self.pos_only,
+            max_positional=self.max_positional,
+            arg_holders="\n               ".join(
+                f"xenoform::capi::arg<{arg.type}> arg_{arg.name}{f'({arg.default})' if arg.default else ''};"
+                for arg in self.args
+            ),
+            arg_loads=" && ".join(
+                [f'arg_{arg.name}.load(values_[{i}], "{self.name}", "{arg.name}")' for i, arg in enumerate(self.args)]
+                or ["true"]
+            ),
+            release_gil=str(release_gil).lower(),
+            function_body=function_body,
+            arg_values="".join(f", arg_{arg.name}.get()" for arg in self.args),
+            # the signature line makes the python signature available to inspect.signature
+            doc=f"{function_name}{self.text_signature}\n--\n\n{help or ''}",
+        )
+
+
+def _capi_type(func: Callable[..., Any], var_name: str, type_: Any) -> str:
+    cpptype = translate_type(type_)
+    if cpptype.view:
+        supported = var_name != "return" and cpptype.view.ndim == 1 and repr(cpptype.subtypes[0]) in _SPAN_ELEMENT_TYPES
+    else:
+        supported = not (cpptype.override or cpptype.qualfier or cpptype.subtypes) and (
+            cpptype.type in _SCALAR_TYPES or (var_name == "return" and cpptype.type == "void")
+        )
+    if supported:
+        return repr(cpptype)
+    raise CppTypeError(
+        f"{func.__name__}: the capi binding doesn't support {var_name} of type {cpptype}. Supported types are bool, "
+        "int and float (and numpy equivalents), and 1-D ArrayView annotated arrays of int32/64 and float32/64"
+    )
+
+
+def capi_signature(func: Callable[..., Any]) -> CApiSignature:
+    """Translates the function's signature for the C API binding, raising an error if it isn't supported"""
+    sig = inspect.signature(func)
+    args = []
+    for name, param in sig.parameters.items():
+        if param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
+            raise AnnotationError(f"{func.__name__}: the capi binding doesn't support *args or **kwargs")
+        default = None if param.default is inspect.Parameter.empty else _translate_value(param.default)
+        args.append(CApiArg(name, _capi_type(func, name, param.annotation), default))
+    kinds = [param.kind for param in sig.parameters.values()]
+    return CApiSignature(
+        name=func.__name__,
+        args=tuple(args),
+        return_type=_capi_type(func, "return", sig.return_annotation),
+        pos_only=kinds.count(inspect.Parameter.POSITIONAL_ONLY),
+        max_positional=len(kinds) - kinds.count(inspect.Parameter.KEYWORD_ONLY),
+        text_signature=str(
+            sig.replace(
+                parameters=[param.replace(annotation=inspect.Parameter.empty) for param in sig.parameters.values()],
+                return_annotation=inspect.Signature.empty,
+            )
+        ),
+    )
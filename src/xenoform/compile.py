@@ -1,34 +1,35 @@
+import copy
 import importlib
 import inspect
 import os
 import subprocess
 import sys
+import threading
+import time
 from collections import defaultdict
-from collections.abc import Callable
-from contextlib import redirect_stderr, redirect_stdout
-from functools import cache, lru_cache, wraps
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache, partial, update_wrapper, wraps
 from pathlib import Path
 from types import ModuleType
-from typing import ParamSpec, TypeVar, cast
-
-import numpy as np
-import toml
-from pybind11.setup_helpers import Pybind11Extension, build_ext
-from setuptools import setup
+from typing import Any, Literal, ParamSpec, TypeVar, cast
 
+from xenoform.build import BuildProfile, build, build_profile, pgo_stage
+from xenoform.capi import CApiSignature, capi_signature
+from xenoform.config import get_setting
 from xenoform.cppmodule import FunctionSpec, ModuleSpec, ReturnValuePolicy
-from xenoform.errors import AnnotationError, CompilationError
+from xenoform.errors import AnnotationError
+from xenoform.events import Phase, emit, timed
+from xenoform.lock import FileLock
 from xenoform.logger import get_logger
-from xenoform.utils import _deduplicate, get_function_scope, translate_function_signature
+from xenoform.manifest import Manifest, extension_filename
+from xenoform.store import artefact_key, fetch, local_dependencies, publish, store_dir
+from xenoform.utils import array_args, get_function_scope, gil_unsafe_args, translate_function_signature
 
 
 def _get_module_root_dir() -> Path:
-    path = Path("./ext")  # default
-    config_file = Path("xenoform.toml")
-    if config_file.exists():
-        config = toml.load(config_file)
-        path = Path(config["extensions"]["module_root_dir"])
-    return path
+    return Path(get_setting("module_root_dir", "./ext"))
 
 
 module_root_dir = _get_module_root_dir()
@@ -39,14 +40,16 @@ sys.path.append(str(module_root_dir))
 logger = get_logger()
 
 _module_registry: dict[str, ModuleSpec] = defaultdict(ModuleSpec)
+# functions may be registered (e.g. by concurrent imports) while other modules are being built
+_registry_lock = threading.Lock()
 
 
-# need to load module in a subprocess to check its up-to-date to avoid polluting sys.modules
-# otherwise if a rebuild is done, the module is already loaded and the changes are not picked up
-# importlib.reload doesn't work here, the old module remains in memory
+# modules built without a manifest (by earlier versions) need to be loaded in a subprocess to check they are
+# up-to-date, to avoid polluting sys.modules. Otherwise if a rebuild is done, the module is already loaded and the
+# changes are not picked up. importlib.reload doesn't work here, the old module remains in memory
 def _get_module_checksum(module_name: str) -> str | None:
     p = subprocess.run(
-        ["python", "-c", f"import {module_name} as m; print(m.__checksum__)"],
+        [sys.executable, "-c", f"import {module_name} as m; print(m.__checksum__)"],
         check=False,
         capture_output=True,
         text=True,
@@ -56,90 +59,290 @@ def _get_module_checksum(module_name: str) -> str | None:
     return None
 
 
-def _parse_macros(macro_list: list[str]) -> dict[str, str | None]:
-    """Map ["DEF1", "DEF2=3"] to {"DEF1": None, "DEF2": "3"}"""
-    return {kv[0]: kv[1] if len(kv) == 2 else None for d in macro_list for kv in [d.split("=", 1)]}
+def _installed_checksum(module_name: str, module_dir: Path) -> str | None:
+    """The checksum of the existing compiled module, if present"""
+    manifest = Manifest.load(module_dir)
+    if manifest:
+        return manifest.checksum if manifest.is_current(module_dir) else None
+    module_checksum = _get_module_checksum(f"{module_root_dir.name}.{module_dir.name}.{module_name}")
+    binary = module_dir / extension_filename(module_name)
+    if module_checksum and binary.exists():
+        # avoid the subprocess next time
+        Manifest.create(module_checksum, binary).save(module_dir)
+    return module_checksum
+
+
+def _ext_name(module_name: str, profile: str | None) -> str:
+    """
+    The name of the package containing the compiled module. Modules built with a profile other than the default are
+    kept alongside, e.g. my_module_ext_release, so switching between profiles doesn't require a rebuild
+    """
+    if profile in (None, BuildProfile.Default):
+        return f"{module_name}_ext"
+    return f"{module_name}_ext_{profile}"
 
 
 def _check_build_fetch_module_impl(
     module_name: str,
     module_spec: ModuleSpec,
 ) -> ModuleType:
-    ext_name = module_name + "_ext"
+    ext_name = _ext_name(module_name, module_spec.profile)
 
     module_dir = module_root_dir / ext_name
     module_dir.mkdir(exist_ok=True, parents=True)
+    module_spec = replace(module_spec, pgo=pgo_stage(module_dir))
+    qualified_name = f"{ext_name}.{module_name}"
 
-    code, hashval = module_spec.make_source(module_name)
+    with timed(Phase.Generate, qualified_name, functions=len(module_spec.functions)) as details:
+        code, hashval = module_spec.make_source(module_name)
+        details["size_bytes"] = len(code)
 
     # if a built module already exists, and matches the hash of the source code, just use it
-    module_checksum = _get_module_checksum(f"{module_root_dir.name}.{ext_name}.{module_name}")
-
-    # assume exists and up-to-date
-    exists, outdated = True, False
-    if not module_checksum:
-        logger(f"module {module_root_dir.name}.{ext_name}.{module_name} not found")
-        exists = False
-    elif module_checksum != hashval:
-        logger(f"module is outdated ({hashval})")
-        outdated = True
-    else:
-        logger(f"module is up-to-date ({hashval})")
+    with timed(Phase.Check, qualified_name) as details:
+        module_checksum = _installed_checksum(module_name, module_dir)
+
+        # assume exists and up-to-date
+        exists, outdated = True, False
+        if not module_checksum:
+            logger(f"module {module_root_dir.name}.{ext_name}.{module_name} not found")
+            exists = False
+        elif module_checksum != hashval:
+            logger(f"module is outdated ({hashval})")
+            outdated = True
+        else:
+            logger(f"module is up-to-date ({hashval})")
+        details["status"] = "missing" if not exists else "outdated" if outdated else "current"
 
     if outdated or not exists:
-        logger(f"(re)building module {module_root_dir.name}.{ext_name}.{module_name}")
-
-        # save the code with the hash embedded
-        with (module_dir / "module.cpp").open("w") as fd:
-            fd.write(code.replace("__HASH__", str(hashval)))
-
-        logger(f"wrote {module_dir}/module.cpp")
-
-        ext_modules = [
-            Pybind11Extension(
-                module_name,
-                ["module.cpp"],
-                define_macros=list(_parse_macros(_deduplicate(module_spec.define_macros)).items()),
-                extra_compile_args=_deduplicate(module_spec.extra_compile_args),
-                extra_link_args=_deduplicate(module_spec.extra_link_args),
-                include_dirs=[np.get_include(), *_deduplicate(module_spec.include_paths)],
-                cxx_std=module_spec.cxx_std,
-            )
-        ]
-
-        logger(f"building {module_root_dir.name}.{ext_name}.{module_name}...")
-        cwd = Path.cwd()
-        try:
-            os.chdir(module_dir)
-            # Redirect stdout to a log file (does not work in pytest)
-            # Redirecting stderr doesnt work at all
-            with Path("./build.log").open("w") as fd, redirect_stdout(fd), redirect_stderr(fd):
-                setup(
-                    name=ext_name,
-                    ext_modules=ext_modules,
-                    script_args=["build_ext", "--inplace"],
-                    cmdclass={"build_ext": build_ext},
+        # only one process builds the module, any others wait for it, then use it
+        lock = FileLock(module_dir / "build.lock")
+        if not lock.try_acquire():
+            logger(f"waiting for {module_root_dir.name}.{ext_name}.{module_name} to be built by {lock.holder()}")
+            lock.acquire()
+        with lock:
+            if _installed_checksum(module_name, module_dir) == hashval:
+                logger(f"module {module_root_dir.name}.{ext_name}.{module_name} was built by another process")
+            else:
+                _build_module(module_name, module_dir, module_spec, code, hashval)
+    with timed(Phase.Import, qualified_name) as details:
+        module = importlib.import_module(qualified_name)
+        details["size_bytes"] = Path(module.__file__ or "").stat().st_size
+    return module
+
+
+def _build_module(module_name: str, module_dir: Path, module_spec: ModuleSpec, code: str, hashval: str) -> None:
+    qualified_name = f"{module_root_dir.name}.{module_dir.name}.{module_name}"
+    logger(f"(re)building module {qualified_name}")
+
+    # save the code with the hash embedded
+    with (module_dir / "module.cpp").open("w") as fd:
+        fd.write(code.replace("__HASH__", str(hashval)))
+
+    logger(f"wrote {module_dir}/module.cpp")
+
+    binary = module_dir / extension_filename(module_name)
+    # profile-guided builds depend on more than the source code and toolchain, native builds on the host CPU, and
+    # modules with local headers or libraries on their contents
+    local = module_spec.pgo or module_spec.profile == BuildProfile.Native or local_dependencies(module_spec)
+    store = None if local else store_dir()
+    key = artefact_key(hashval) if store else ""
+    fetched = False
+    if store:
+        with timed(Phase.Fetch, f"{module_dir.name}.{module_name}") as details:
+            fetched = details["found"] = fetch(store, key, module_name, module_dir)
+    if fetched:
+        logger(f"fetched {qualified_name} from {store}")
+    else:
+        build(module_name, module_dir, module_spec)
+        if store:
+            publish(store, key, binary)
+    Manifest.create(hashval, binary).save(module_dir)
+    importlib.invalidate_caches()  # without this, newly built modules are not found
+    logger(f"built {qualified_name}")
+
+
+# loaded modules, and per-module locks so that each is only built (or checked and loaded) once
+_modules: dict[str, ModuleType] = {}
+_module_locks: defaultdict[str, threading.Lock] = defaultdict(threading.Lock)
+# modules being built (or checked and loaded) in the background
+_builds: dict[str, Future[ModuleType]] = {}
+_build_times: dict[str, float] = {}
+_prebuilding: set[str] = set()
+_builds_lock = threading.Lock()
+_executor: ThreadPoolExecutor | None = None
+
+
+def _build(module_name: str) -> ModuleType:
+    start = time.perf_counter()
+    # build from a snapshot, so it's unaffected by functions being registered concurrently
+    with _registry_lock:
+        module_spec = copy.deepcopy(_module_registry[module_name])
+    module = _check_build_fetch_module_impl(module_name, module_spec)
+    _build_times[module_name] = time.perf_counter() - start
+    logger(f"imported compiled module {module.__name__}")
+    return module
+
+
+def _build_in_background(module_name: str) -> ModuleType:
+    try:
+        return _get_module(module_name)
+    except BaseException:
+        # so that a subsequent attempt will retry rather than reraise
+        with _builds_lock:
+            _builds.pop(module_name, None)
+        raise
+
+
+def _build_async(module_name: str) -> Future[ModuleType]:
+    """Start building (or checking and loading) the module in a background thread, unless already started"""
+    global _executor
+    with _builds_lock:
+        if module_name not in _builds:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=get_setting("build_workers", os.cpu_count() or 1), thread_name_prefix="xenoform"
                 )
-        except SystemExit as e:
-            raise CompilationError(str(e)) from e
-        finally:
-            os.chdir(cwd)
-        importlib.invalidate_caches()  # without this, newly built modules are not found
-        logger(f"built {module_root_dir.name}.{ext_name}.{module_name}")
-    return importlib.import_module(f"{ext_name}.{module_name}")
+            _builds[module_name] = _executor.submit(_build_in_background, module_name)
+        return _builds[module_name]
+
+
+def _prebuild_when_imported(module_name: str, py_module_name: str) -> None:
+    """Wait until the python module has finished importing, i.e. all its functions are registered, then build"""
+    while (py_module := sys.modules.get(py_module_name)) and getattr(py_module.__spec__, "_initializing", False):
+        time.sleep(0.01)
+    _build_async(module_name)
+
+
+def _schedule_prebuild(module_name: str, py_module_name: str) -> None:
+    # scripts register their functions as they run, there is no way to tell when they are all registered
+    if py_module_name == "__main__":
+        return
+    with _builds_lock:
+        if module_name in _prebuilding:
+            return
+        _prebuilding.add(module_name)
+    logger(f"scheduling prebuild of {module_name}")
+    threading.Thread(target=_prebuild_when_imported, args=(module_name, py_module_name), daemon=True).start()
 
 
-@cache  # unlimited module cache
 def _get_module(module_name: str) -> ModuleType:
-    module = _check_build_fetch_module_impl(module_name, _module_registry[module_name])
-    logger(f"imported compiled module {module.__name__}")
+    """
+    Returns the compiled module, building it first if necessary. Concurrent callers for the same module wait for the
+    first to build it, then reuse the result. Different modules can be built concurrently.
+    """
+    if module := _modules.get(module_name):
+        return module
+    with _builds_lock:
+        module_lock = _module_locks[module_name]
+    with module_lock:
+        if not (module := _modules.get(module_name)):
+            module = _modules[module_name] = _build(module_name)
     return module
 
 
+def warmup(modules: Iterable[str] | None = None, *, wait: bool = True) -> dict[str, float]:
+    """
+    Build (or check and load) the specified modules, or all registered modules, concurrently, rather than deferring
+    this until one of their functions is first called.
+
+    Parameters:
+        modules (Iterable[str], optional): Names of the modules (i.e. python source file stems) to warm up.
+        wait (bool, optional, default True): Block until all the modules are loaded.
+
+    Returns:
+        dict[str, float]: the time taken to build or load each module, in seconds. Empty if not waiting.
+
+    Raises:
+        ExceptionGroup: containing the error for each module that failed to build or load.
+    """
+    with _registry_lock:
+        registered = list(_module_registry)
+    module_names = registered if modules is None else list(modules)
+    if unknown := [name for name in module_names if name not in registered]:
+        raise ValueError(f"no compiled functions have been registered for module(s): {', '.join(unknown)}")
+    futures = {name: _build_async(name) for name in module_names}
+    if not wait:
+        return {}
+    errors = [cast(Exception, e) for future in futures.values() if (e := future.exception())]
+    if errors:
+        raise ExceptionGroup("failed to build or load module(s)", errors)
+    timings = {name: _build_times[name] for name in module_names}
+    for name, t in timings.items():
+        logger(f"warmed up {name} in {t:.3f}s")
+    return timings
+
+
+@dataclass(frozen=True)
+class CallStats:
+    """
+    Call statistics for an instrumented function. Times are wall clock, in nanoseconds. histogram[i] is the number of
+    calls that took between 2**i and 2**(i+1) ns (the last bucket also counts anything longer)
+    """
+
+    calls: int
+    total_ns: int
+    min_ns: int
+    max_ns: int
+    mean_ns: float
+    histogram: tuple[int, ...]
+
+
+def stats() -> dict[str, CallStats]:
+    """
+    Returns the call statistics for each instrumented function (see compile(instrument=...)), keyed by
+    "<module>.<function>". Only modules that have been loaded are included.
+    """
+    result = {}
+    for module_name, module in list(_modules.items()):
+        if hasattr(module, "_xenoform_stats"):
+            for function_name, values in module._xenoform_stats().items():
+                values["histogram"] = tuple(values["histogram"])
+                result[f"{module_name}.{function_name}"] = CallStats(**values)
+    return result
+
+
+def array_copies() -> dict[str, int]:
+    """
+    Returns the number of times each array argument has been copied in order to convert it (e.g. to a different dtype),
+    keyed by "<module>.<function>.<argument>". Only arguments of instrumented functions that have been copied, in
+    modules that have been loaded, are included. See compile(instrument=..., no_copy=...)
+    """
+    result = {}
+    for module_name, module in list(_modules.items()):
+        if hasattr(module, "_xenoform_array_copies"):
+            for name, count in module._xenoform_array_copies().items():
+                result[f"{module_name}.{name}"] = count
+    return result
+
+
+def reset_stats() -> None:
+    """Zeroes the call statistics for all instrumented functions, and the array copy counts"""
+    for module in list(_modules.values()):
+        if hasattr(module, "_xenoform_reset_stats"):
+            module._xenoform_reset_stats()
+        if hasattr(module, "_xenoform_reset_array_copies"):
+            module._xenoform_reset_array_copies()
+
+
 P = ParamSpec("P")
 R = TypeVar("R")
 
 
+def starmap[T](func: Callable[..., T], items: Iterable[tuple[Any, ...]]) -> list[T]:
+    """
+    Calls a function compiled with batch=True for each tuple of (positional) arguments in items, returning a list of
+    the results, like list(itertools.starmap(func, items)). The loop runs in C++, in a single call to the module, so
+    only the conversion of each call's arguments and result remains.
+    """
+    if batched := getattr(func, "_xenoform_batch", None):
+        return cast(list[T], batched(items))
+    # e.g. the compiled function itself, rather than the stub
+    module = sys.modules.get(getattr(func, "__module__", None) or "")
+    if module and (batched := getattr(module, f"{getattr(func, '__name__', '')}_batch", None)):
+        return cast(list[T], batched(items))
+    raise ValueError(f"{getattr(func, '__name__', func)} is not a function compiled with batch=True")
+
+
 def _check_annotations[**P, R](func: Callable[P, R]) -> None:
     """Ensures all args and return are typed"""
     sig = inspect.signature(func)
@@ -154,16 +357,108 @@ def _check_annotations[**P, R](func: Callable[P, R]) -> None:
         raise AnnotationError(f"Function {func.__name__} has missing annotations: {missing_annotations}")
 
 
+def _check_options[**P, R](func: Callable[P, R], vectorise: bool | str, release_gil: bool, batch: bool) -> None:
+    """
+    Ensures the vectorise, release_gil and batch options are valid, and compatible with each other and the function
+    """
+    if vectorise not in (False, True, "parallel"):
+        raise ValueError(f"Function {func.__name__}: vectorise must be True, False or 'parallel', not {vectorise!r}")
+
+    arg_spec = inspect.getfullargspec(func)
+    if batch and (arg_spec.varargs or arg_spec.varkw):
+        raise ValueError(f"Function {func.__name__}: batch cannot be used with *args or **kwargs")
+
+    if release_gil and vectorise:
+        raise ValueError(
+            f"Function {func.__name__}: release_gil cannot be used with vectorise, since the arrays are created in "
+            "the function. (Parallel vectorisation releases the GIL for the loop itself)"
+        )
+
+    if release_gil and (unsafe := gil_unsafe_args(func)):
+        raise AnnotationError(
+            f"Function {func.__name__} cannot release the GIL: {', '.join(unsafe)} would be python object(s) "
+            "held by value. Use reference (or pointer) qualifiers for arguments, and return C++ types."
+        )
+
+
+def _translate_signature[**P, R](
+    func: Callable[P, R], capi: CApiSignature | None, *, no_copy: bool, instrumented: bool
+) -> tuple[str, list[str], list[str]]:
+    """The C++ signature, argument annotations and required headers for the binding"""
+    if capi:
+        return capi.lambda_signature(), [], ["<xenoform/capi.h>"]
+    return translate_function_signature(func, no_copy=no_copy, count_copies=instrumented)
+
+
+def _check_binding[**P, R](
+    func: Callable[P, R],
+    binding: str,
+    *,
+    vectorise: bool | str,
+    batch: bool,
+    instrument: bool | None,
+    cxx_std: int,
+) -> None:
+    """Ensures the binding is valid, and compatible with the other options"""
+    if binding not in ("pybind11", "capi"):
+        raise ValueError(f"Function {func.__name__}: binding must be 'pybind11' or 'capi', not {binding!r}")
+    if binding == "capi" and (vectorise or batch or instrument):
+        raise ValueError(
+            f"Function {func.__name__}: the capi binding cannot be used with vectorise, batch or instrument"
+        )
+    if binding == "capi" and cxx_std < 20:
+        # array arguments are std::span views
+        raise ValueError(f"Function {func.__name__}: the capi binding requires cxx_std=20 or later, not {cxx_std}")
+
+
 @lru_cache  # limited function cache
 def _get_function(module_name: str, function_name: str) -> Callable[P, R]:
-    module = _get_module(module_name)
+    # the time from the first call to the function being available, including any build
+    with timed(
+        Phase.Redirect,
+        f"{_ext_name(module_name, _module_registry[module_name].profile)}.{module_name}",
+        function=function_name[1:],
+    ):
+        module = _get_module(module_name)
     logger(f"redirected {module_name}.{function_name[1:]} to compiled function {module.__name__}.{function_name}")
     return cast(Callable[P, R], getattr(module, function_name))
 
 
+def _rebind(func: Callable[..., object], stub: Callable[..., object], compiled: Callable[..., object]) -> None:
+    """
+    Point the module attribute holding the stub at the compiled function, so that subsequent calls go straight to C++.
+    A pybind11 function can't hold attributes, so it's wrapped in a functools.partial (which adds little to the cost of
+    a call) with the stub's name, docstring, __wrapped__ and other attributes, so that e.g. inspect.signature still
+    works. Methods are left alone since pybind11 functions don't bind to instances, as are nested functions and any
+    stubs that have been further decorated or renamed, which will still call the compiled function via the stub.
+    """
+    namespace = func.__globals__
+    if namespace.get(func.__name__) is stub:
+        namespace[func.__name__] = update_wrapper(partial(compiled), stub)
+        logger(f"rebound {func.__module__}.{func.__name__} to compiled function")
+
+
+def _option_headers(*, instrumented: bool, batch: bool) -> list[str]:
+    """The headers required by the instrument and batch options"""
+    return (["<xenoform/stats.h>"] if instrumented else []) + (["<xenoform/batch.h>"] if batch else [])
+
+
+def _add_batch(stub: Callable[..., object], module_name: str, function_spec: FunctionSpec) -> None:
+    """Gives the stub access to the batched entry point, for xenoform.starmap"""
+
+    def call_batch(items: Iterable[tuple[Any, ...]]) -> list[Any]:
+        batched = cast(
+            Callable[[Iterable[tuple[Any, ...]]], list[Any]],
+            _get_function(module_name, f"{function_spec.qualified_cpp_name()}_batch"),
+        )
+        return batched(items)
+
+    stub._xenoform_batch = call_batch  # type: ignore[attr-defined]
+
+
 def compile(
     *,
-    vectorise: bool = False,
+    vectorise: bool | Literal["parallel"] = False,
     define_macros: list[str] | None = None,
     extra_includes: list[str] | None = None,
     extra_include_paths: list[str] | None = None,
@@ -171,6 +466,12 @@ def compile(
     extra_link_args: list[str] | None = None,
     return_value_policy: ReturnValuePolicy = ReturnValuePolicy.Automatic,
     cxx_std: int = 20,
+    profile: BuildProfile | str | None = None,
+    release_gil: bool = False,
+    instrument: bool | None = None,
+    no_copy: bool | None = None,
+    batch: bool = False,
+    binding: Literal["pybind11", "capi"] = "pybind11",
     help: str | None = None,
     verbose: bool = False,
 ) -> Callable[[Callable[P, R]], Callable[P, R]]:
@@ -178,13 +479,26 @@ def compile(
     Decorator factory for compiling C/C++ function implementations into extension modules.
 
     Parameters:
-        vectorise (bool, optional): If True, vectorizes the compiled function for array operations.
+        vectorise (bool | "parallel", optional): If True, vectorizes the compiled function for array operations. If
+            "parallel", the vectorised loop is run across multiple threads using OpenMP, with the GIL released.
         define_macros: list[str] | None = None,
         extra_includes (list[str], optional): Additional header/inline files to include during compilation.
         extra_include_paths (list[str], optional): Additional paths search for headers.
         extra_compile_args (list[str], optional): Extra arguments to pass to the compiler.
         extra_link_args (list[str], optional): Extra arguments to pass to the linker.
         cxx_std (int, optional, default 20): C++ standard to compile
+        profile (BuildProfile | str, optional): the build profile, i.e. set of optimisation flags, overriding the
+            profile setting. The XENOFORM_PROFILE environment variable overrides both.
+        release_gil (bool, optional, default False): release the GIL while the function executes.
+        instrument (bool, optional): record call counts and timings, retrieved with xenoform.stats(), and array argument
+            conversion copies, see xenoform.array_copies(). Defaults to the instrument setting (False).
+        no_copy (bool, optional): raise TypeError rather than copying array arguments that need converting (e.g. to a
+            different dtype). Defaults to the no_copy setting (False).
+        batch (bool, optional, default False): also generate a batched entry point, called with xenoform.starmap(),
+            that calls the function for each tuple of arguments in an iterable in a single call to the module.
+        binding ("pybind11" | "capi", optional, default "pybind11"): how the function is bound. "capi" binds it
+            directly to the CPython C API, which has much lower call overhead, for functions whose arguments and return
+            value are scalars (or 1-D array views).
         help (str, optional): Docstring for the function
         verbose (bool, optional, default False): enable debug logging
 
@@ -192,26 +506,38 @@ def compile(
         Callable[..., Callable[..., Any]]: A function that when called, will return the compiled function.
     """
 
+    # only enable, so that functions registered without verbose don't silence those registered with it
     if verbose:
         logger.enable()
-    else:
-        logger.disable()
 
     def register_function(func: Callable[P, R]) -> Callable[P, R]:
         """This registers the function, actual compilation is deferred"""
+        timestamp, start = time.time(), time.perf_counter()
         scope = get_function_scope(func)
 
         _check_annotations(func)
 
-        sig, args, headers = translate_function_signature(func)
+        _check_options(func, vectorise, release_gil, batch)
+        _check_binding(func, binding, vectorise=vectorise, batch=batch, instrument=instrument, cxx_std=cxx_std)
+
+        capi = capi_signature(func) if binding == "capi" else None
+        # the instrument setting doesn't apply to the capi binding
+        instrumented = not capi and (get_setting("instrument", False) if instrument is None else instrument)
+        rejects_copies = get_setting("no_copy", False) if no_copy is None else no_copy
+        sig, args, headers = _translate_signature(func, capi, no_copy=rejects_copies, instrumented=instrumented)
         module_name = f"{Path(inspect.getfile(func)).stem}"
         function_body = sig + " {" + (func.__doc__ or "") + "}"
+        module_profile = build_profile(profile)
 
-        logger(f"registering {module_name}_ext.{module_name}.{func.__name__} (in {module_root_dir})")
+        logger(
+            f"registering {_ext_name(module_name, module_profile)}.{module_name}.{func.__name__} (in {module_root_dir})"
+        )
 
-        if vectorise:
-            function_body = f"py::vectorize({function_body})"
+        if vectorise == "parallel":
+            headers.append("<xenoform/vectorize.h>")
+        elif vectorise:
             headers.append("<pybind11/numpy.h>")
+        headers += _option_headers(instrumented=instrumented, batch=batch)
 
         arg_defs = "".join(f", {kwarg}" for kwarg in args)
 
@@ -233,24 +559,49 @@ def compile(
             scope=scope,
             return_value_policy=return_value_policy,
             help=help,
+            release_gil=release_gil,
+            vectorise=vectorise,
+            instrument=instrumented,
+            array_args=tuple(array_args(func)) if "<xenoform/arrays.h>" in headers else (),
+            batch=batch,
+            capi=capi,
         )
 
-        _module_registry[module_name].add_function(
-            function_spec,
-            headers=headers + (extra_includes or []),
-            include_paths=extra_include_paths or [],
-            define_macros=define_macros or [],
-            extra_compile_args=extra_compile_args or [],
-            extra_link_args=extra_link_args or [],
-            cxx_std=cxx_std,
+        with _registry_lock:
+            _module_registry[module_name].add_function(
+                function_spec,
+                headers=headers + (extra_includes or []),
+                include_paths=extra_include_paths or [],
+                define_macros=define_macros or [],
+                extra_compile_args=extra_compile_args or [],
+                extra_link_args=extra_link_args or [],
+                cxx_std=cxx_std,
+                profile=module_profile,
+            )
+        emit(
+            Phase.Register,
+            f"{_ext_name(module_name, module_profile)}.{module_name}",
+            timestamp=timestamp,
+            duration_s=time.perf_counter() - start,
+            function=".".join((*scope, func.__name__)),
         )
 
+        if get_setting("prebuild", False):
+            _schedule_prebuild(module_name, func.__module__)
+
+        compiled: Callable[P, R] | None = None
+
         @wraps(func)
         def call_function(*args: P.args, **kwargs: P.kwargs) -> R:
             """Compilation is deferred until here (and cached)"""
-            # error: Argument 1 has incompatible type "*P.args"; expected "Never"  [arg-type]
-            # error: Argument 2 has incompatible type "**P.kwargs"; expected "Never"  [arg-type]
-            return _get_function(module_name, function_spec.qualified_cpp_name())(*args, **kwargs)  # type: ignore[arg-type]
+            nonlocal compiled
+            if compiled is None:
+                compiled = cast(Callable[P, R], _get_function(module_name, function_spec.qualified_cpp_name()))
+                _rebind(func, call_function, compiled)
+            return compiled(*args, **kwargs)
+
+        if batch:
+            _add_batch(call_function, module_name, function_spec)
 
         return call_function
 
@@ -0,0 +1,33 @@
+import os
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import toml
+
+CONFIG_FILE = Path("xenoform.toml")
+
+
+@cache
+def _load_config() -> dict[str, Any]:
+    if CONFIG_FILE.exists():
+        return dict(toml.load(CONFIG_FILE).get("extensions", {}))
+    return {}
+
+
+def _parse_env[T: (str, bool, int)](value: str, default: T) -> T:
+    if isinstance(default, bool):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    if isinstance(default, int):
+        return int(value)
+    return value
+
+
+def get_setting[T: (str, bool, int)](name: str, default: T) -> T:
+    """
+    Returns the value of the setting from (in order of precedence) the XENOFORM_<NAME> environment variable, the
+    [extensions] section of xenoform.toml, or the default
+    """
+    if (value := os.environ.get(f"XENOFORM_{name.upper()}")) is not None:
+        return _parse_env(value, default)
+    return _load_config().get(name, default)  # type: ignore[no-any-return]
@@ -1,3 +1,5 @@
+import re
+import sysconfig
 from dataclasses import dataclass, field
 from enum import StrEnum
 from hashlib import sha256
@@ -6,11 +8,16 @@ from typing import Self
 from itrx import Itr
 
 from xenoform import __version__ as version
+from xenoform.capi import CApiSignature
+from xenoform.config import get_setting
+from xenoform.types import array_arg_name
 from xenoform.utils import _deduplicate, group_headers
 
 _module_template = """
 // generated by xenoform {version}
 // cxx_std: {cxx_std}
+// profile: {profile}
+// pgo: {pgo}
 // defines: {define_macros}
 // extra include paths: {extra_include_paths}
 // extra cxxflags: {extra_compile_args}
@@ -21,19 +28,100 @@ _module_template = """
 namespace py = pybind11;
 using namespace py::literals;
 
-PYBIND11_MODULE({module_name}, m) {{
+PYBIND11_MODULE({module_name}, m{module_options}) {{
   m.doc() = "{module_name} module generated by xenoform {version}";
   m.attr("__checksum__") = "__HASH__";
   {function_definitions}
 }}
 """
 
+# for modules whose functions all use the C API binding, so that the pybind11 headers aren't needed
+_capi_module_template = """
+// generated by xenoform {version}
+// cxx_std: {cxx_std}
+// profile: {profile}
+// pgo: {pgo}
+// defines: {define_macros}
+// extra include paths: {extra_include_paths}
+// extra cxxflags: {extra_compile_args}
+// extra ldflags: {extra_link_args}
+
+{headers}
+
+static PyModuleDef module_def = {{
+    PyModuleDef_HEAD_INIT, "{module_name}", "{module_name} module generated by xenoform {version}", -1, nullptr}};
+
+PyMODINIT_FUNC PyInit_{module_name}() {{
+  PyObject* m = PyModule_Create(&module_def);
+  if (!m)
+    return nullptr;
+  try {{
+    if (PyModule_AddStringConstant(m, "__checksum__", "__HASH__") < 0)
+      throw std::runtime_error("failed to add checksum to module");{module_options}
+    {function_definitions}
+  }} catch (const std::exception& e) {{
+    Py_DECREF(m);
+    PyErr_SetString(PyExc_ImportError, e.what());
+    return nullptr;
+  }}
+  return m;
+}}
+"""
+
 _function_template = """
-  m.def("{function_name}", {function_body}, {return_value_policy} {help} {arg_defs});
+  m.def("{function_name}", {function_body}, {return_value_policy}{call_guard} {help} {arg_defs});
+
+"""
+
+# for incremental builds, each function is compiled separately and registered from a separate module definition
+_split_module_template = """
+// generated by xenoform {version}
 
+#include <pybind11/pybind11.h>
+
+namespace py = pybind11;
+
+{declarations}
+
+PYBIND11_MODULE({module_name}, m{module_options}) {{
+  m.doc() = "{module_name} module generated by xenoform {version}";
+  m.attr("__checksum__") = "__HASH__";
+  {registrations}
+}}
+"""
+
+_function_unit_template = """
+// generated by xenoform {version}
+
+{headers}
+
+namespace py = pybind11;
+using namespace py::literals;
+
+void {register_function}(py::module_& m) {{
+  {function_definition}
+}}
 """
 
 
+def gil_not_used() -> bool:
+    """
+    Whether generated modules declare that they are safe to use without the GIL. By default, only on free-threaded
+    interpreters, where importing a module that doesn't would re-enable the GIL for the whole process
+    """
+    return get_setting("free_threading", bool(sysconfig.get_config_var("Py_GIL_DISABLED")))
+
+
+def _module_options() -> str:
+    return ", py::mod_gil_not_used()" if gil_not_used() else ""
+
+
+def _capi_module_options() -> str:
+    if not gil_not_used():
+        return ""
+    return "\n#ifdef Py_GIL_DISABLED\n    PyUnstable_Module_SetGIL(m, Py_MOD_GIL_NOT_USED);\n#endif"
+
+
 class ReturnValuePolicy(StrEnum):
     """See https://pybind11.readthedocs.io/en/stable/advanced/functions.html#return-value-policies"""
 
@@ -58,12 +146,93 @@ class FunctionSpec:
     scope: tuple[str, ...]
     return_value_policy: ReturnValuePolicy
     help: str | None = None
+    release_gil: bool = False
+    vectorise: bool | str = False
+    instrument: bool = False
+    # the array arguments whose conversion copies are rejected (no_copy) or counted (instrument)
+    array_args: tuple[str, ...] = ()
+    batch: bool = False
+    # the signature, for functions bound directly to the C API rather than by pybind11
+    capi: CApiSignature | None = None
 
     def qualified_cpp_name(self) -> str:
         if self.scope:
             return f"_{'_'.join(self.scope)}_{self.name}"
         return f"_{self.name}"
 
+    def _overloads(self) -> list[tuple[str, str]]:
+        """
+        The function bodies and argument annotations to register. Vectorised functions are preceded by a scalar
+        overload, so that calls with scalar arguments avoid the overhead of vectorisation. Its arguments are not
+        converted, so anything other than scalars of the exact type (e.g. arrays, or an int passed as a float) falls
+        through to the vectorised overload
+        """
+        match self.vectorise:
+            case "parallel":
+                vectorised = f"xenoform::parallel_vectorize({self.body})"
+            case True:
+                vectorised = f"py::vectorize({self.body})"
+            case _:
+                return [(self._instrumented(self.body), self.arg_annotations)]
+        scalar_arg_annotations = re.sub(r'(py::arg\("\w+"\))', r"\1.noconvert()", self.arg_annotations)
+        return [
+            (self._instrumented(self.body), scalar_arg_annotations),
+            (self._instrumented(vectorised), self.arg_annotations),
+        ]
+
+    def _instrumented(self, body: str) -> str:
+        """Wraps the body to record call statistics, if instrumented. Overloads share the same statistics"""
+        if not self.instrument:
+            return body
+        return f'xenoform::instrument(m, "{".".join((*self.scope, self.name))}", {body})'
+
+    def _batch_definition(self) -> str:
+        """
+        The batched entry point, which calls the (scalar) function for each tuple of arguments in an iterable. It holds
+        the GIL, since the arguments and results of each call are converted in the loop
+        """
+        if not self.batch:
+            return ""
+        return _function_template.format(
+            function_name=f"{self.qualified_cpp_name()}_batch",
+            function_body=f"xenoform::batch({self._instrumented(self.body)}, {self.return_value_policy})",
+            arg_defs=', py::arg("items")',
+            return_value_policy=ReturnValuePolicy.Automatic,
+            call_guard="",
+            help="",
+        )
+
+    def _array_arg_names(self) -> str:
+        """Declares the qualified names of the array arguments, which their C++ types refer to"""
+        return "".join(
+            f'\n  static constexpr char {array_arg_name(arg)}[] = "{".".join((*self.scope, self.name, arg))}";'
+            for arg in self.array_args
+        )
+
+    def definition(self) -> str:
+        """The code that adds the function (and any overloads, and batched entry point) to the module"""
+        if self.capi:
+            return self.capi.definition(self.qualified_cpp_name(), self.body, self.help, release_gil=self.release_gil)
+        definition = (
+            "".join(
+                _function_template.format(
+                    function_name=self.qualified_cpp_name(),
+                    function_body=body,
+                    arg_defs=arg_annotations,
+                    return_value_policy=self.return_value_policy,
+                    call_guard=", py::call_guard<py::gil_scoped_release>()" if self.release_gil else "",
+                    # otherwise pybind11 repeats it for each overload
+                    help=f', R"""({self.help})"""' if self.help and i == 0 else "",
+                )
+                for i, (body, arg_annotations) in enumerate(self._overloads())
+            )
+            + self._batch_definition()
+        )
+        if not self.array_args:
+            return definition
+        # in a block, so that the names are local to the function
+        return "{" + self._array_arg_names() + "\n  xenoform::register_array_copies(m);\n" + definition + "}"
+
 
 @dataclass
 class ModuleSpec:
@@ -78,6 +247,9 @@ class ModuleSpec:
     extra_compile_args: list[str] = field(default_factory=list[str])
     extra_link_args: list[str] = field(default_factory=list[str])
     cxx_std: int | None = None
+    profile: str | None = None
+    # the profile-guided optimisation stage, if any: generate or use
+    pgo: str | None = None
 
     def add_function(
         self,
@@ -89,6 +261,7 @@ class ModuleSpec:
         extra_compile_args: list[str] | None = None,
         extra_link_args: list[str] | None = None,
         cxx_std: int = 20,
+        profile: str = "default",
     ) -> Self:
         self.functions.add(function)
         self.headers += headers or []
@@ -101,28 +274,40 @@ class ModuleSpec:
                 "Requested C++ standard {} conflicts with previously set standard. Ensure only one standard per module"
             )
         self.cxx_std = cxx_std
+        if self.profile and self.profile != profile:
+            raise ValueError(
+                f"Requested build profile {profile} conflicts with previously set profile {self.profile}. Ensure only "
+                "one profile per module"
+            )
+        self.profile = profile
         return self
 
+    def _headers(self) -> str:
+        # group_headers adds pybind11, which C API modules don't need
+        pybind11 = not self.capi_only()
+        return (
+            Itr(group_headers(self.headers))
+            .flatten()
+            .filter(lambda h: pybind11 or h != "<pybind11/pybind11.h>")
+            .fold("", lambda hs, h: hs + f"#include {h}\n")
+        )
+
+    def capi_only(self) -> bool:
+        """Whether all the functions are bound directly to the C API, so the module can be built without pybind11"""
+        return bool(self.functions) and all(f.capi for f in self.functions)
+
     def make_source(self, module_name: str) -> tuple[str, str]:
-        headers = Itr(group_headers(self.headers)).flatten().fold("", lambda hs, h: hs + f"#include {h}\n")
+        headers = self._headers()
 
         # sort to prevent rebuilding when nothing has changed but the function ordering
-        function_defs = "\n".join(
-            sorted(
-                _function_template.format(
-                    function_name=f.qualified_cpp_name(),
-                    function_body=f.body,
-                    arg_defs=f.arg_annotations,
-                    return_value_policy=f.return_value_policy,
-                    help=f', R"""({f.help})"""' if f.help else "",
-                )
-                for f in self.functions
-            )
-        )
+        function_defs = "\n".join(sorted(f.definition() for f in self.functions))
         # create the code without the hash
-        code = _module_template.format(
+        capi = self.capi_only()
+        code = (_capi_module_template if capi else _module_template).format(
             version=version,
             cxx_std=self.cxx_std,
+            profile=self.profile,
+            pgo=self.pgo,
             headers=headers,
             extra_include_paths=_deduplicate(self.include_paths),
             # do we need to deduplicate? or will this break something?
@@ -130,7 +315,40 @@ class ModuleSpec:
             extra_compile_args=" ".join(_deduplicate(self.extra_compile_args)),
             extra_link_args=" ".join(self.extra_link_args),
             module_name=module_name,
+            module_options=_capi_module_options() if capi else _module_options(),
             function_definitions=function_defs,
         )
         # return code and hash
         return code, sha256(code.encode()).hexdigest()
+
+    def can_split(self) -> bool:
+        """
+        Functions can only be compiled separately if the module doesn't include inline code, which would then be
+        defined multiple times. C API modules, which compile quickly anyway, are always built in one unit
+        """
+        return not group_headers(self.headers)[0] and not self.capi_only()
+
+    def make_split_source(self, module_name: str) -> tuple[str, dict[str, str]]:
+        """
+        Returns the code for the module definition (without the hash) and, separately, the code for each function,
+        keyed by name. Used for incremental builds.
+        """
+        headers = self._headers()
+        functions = sorted(self.functions, key=lambda f: f.qualified_cpp_name())
+        units = {
+            f.qualified_cpp_name(): _function_unit_template.format(
+                version=version,
+                headers=headers,
+                register_function=f"register{f.qualified_cpp_name()}",
+                function_definition=f.definition(),
+            )
+            for f in functions
+        }
+        code = _split_module_template.format(
+            version=version,
+            module_name=module_name,
+            module_options=_module_options(),
+            declarations="\n".join(f"void register{name}(py::module_& m);" for name in units),
+            registrations="\n  ".join(f"register{name}(m);" for name in units),
+        )
+        return code, units
@@ -0,0 +1,102 @@
+"""
+Structured events for each phase of registering, building and loading compiled modules, for monitoring build and
+startup costs. Events are passed to subscribers and logged (at DEBUG level) to the "xenoform" stdlib logger, with
+the event's fields as extra attributes prefixed with xenoform_, e.g. record.xenoform_duration_s.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any
+
+_log = logging.getLogger("xenoform")
+
+
+class Phase(StrEnum):
+    """The phases of registering, building and loading a compiled module"""
+
+    Register = "register"
+    Generate = "generate"
+    Check = "check"
+    Fetch = "fetch"
+    # the setuptools backend compiles and links in a single step
+    Build = "build"
+    Compile = "compile"
+    Link = "link"
+    Import = "import"
+    Redirect = "redirect"
+
+
+@dataclass(frozen=True)
+class Event:
+    """
+    A phase of registering, building or loading a compiled module. module is the qualified name of the compiled module,
+    e.g. my_module_ext.my_module, timestamp is the (epoch) time the phase started, and details depend on the phase
+    """
+
+    phase: Phase
+    module: str
+    timestamp: float
+    duration_s: float | None = None
+    details: dict[str, Any] = field(default_factory=dict[str, Any])
+
+
+Subscriber = Callable[[Event], None]
+
+_subscribers: list[Subscriber] = []
+_subscribers_lock = threading.Lock()
+
+
+def subscribe(callback: Subscriber) -> Callable[[], None]:
+    """
+    Call the function with each event, from the thread in which the event occurred (modules may be built in
+    background threads). Exceptions raised by the function are logged and ignored. Returns a function that unsubscribes.
+    """
+    with _subscribers_lock:
+        _subscribers.append(callback)
+
+    def unsubscribe() -> None:
+        with _subscribers_lock:
+            if callback in _subscribers:
+                _subscribers.remove(callback)
+
+    return unsubscribe
+
+
+def emit(
+    phase: Phase, module: str, *, timestamp: float | None = None, duration_s: float | None = None, **details: Any
+) -> None:
+    """Pass the event to the subscribers and the logger, if there are any to receive it"""
+    with _subscribers_lock:
+        subscribers = list(_subscribers)
+    if not subscribers and not _log.isEnabledFor(logging.DEBUG):
+        return
+    event = Event(phase, module, time.time() if timestamp is None else timestamp, duration_s, details)
+    for subscriber in subscribers:
+        try:
+            subscriber(event)
+        except Exception:
+            _log.exception("xenoform event subscriber %r failed", subscriber)
+    extra = {"xenoform_phase": str(phase), "xenoform_module": module, "xenoform_duration_s": duration_s}
+    extra.update((f"xenoform_{key}", value) for key, value in details.items())
+    _log.debug("%s %s %s", phase, module, details, extra=extra)
+
+
+@contextmanager
+def timed(phase: Phase, module: str, **details: Any) -> Iterator[dict[str, Any]]:
+    """
+    Emit an event with the duration of the block. Yields the details, so that the block can add to them. If the block
+    raises, the event's details include the type of the exception, as error
+    """
+    timestamp, start = time.time(), time.perf_counter()
+    try:
+        yield details
+    except BaseException as e:
+        details["error"] = type(e).__name__
+        raise
+    finally:
+        emit(phase, module, timestamp=timestamp, duration_s=time.perf_counter() - start, **details)
@@ -0,0 +1,149 @@
+// Numpy array arguments that detect (and optionally forbid) implicit conversion copies
+//
+// Array arguments (py::array_t<T> and array views) of functions with no_copy or instrument set are wrapped in
+// array_arg<Base, NoCopy, Name>, which derives from Base, so the function body is unaffected. An argument that can be
+// used as-is is loaded without conversion. Otherwise (e.g. a different dtype or byte order, a non-contiguous array for a
+// view, or a list) pybind11 would convert it to a new array: with NoCopy this raises TypeError naming the argument and
+// the mismatch, otherwise the copy is counted. The counts are read and reset via functions added to the module, which
+// xenoform.array_copies() and xenoform.reset_stats() call. Name is the qualified name of the argument: a static
+// constexpr string declared with the function, since C++17 can't take a string literal as a template argument.
+
+#pragma once
+
+#include <xenoform/span.h>
+
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+
+#include <atomic>
+#include <map>
+#include <mutex>
+#include <string>
+#include <type_traits>
+#include <utility>
+
+namespace xenoform {
+
+template <typename Base, bool NoCopy, const char* Name> struct array_arg : Base {
+  array_arg() = default;
+  array_arg(Base&& base) : Base(std::move(base)) {}
+};
+
+namespace detail {
+
+namespace py = pybind11;
+
+// the dtype of the array, and whether it must be C-contiguous
+template <typename Base> struct array_traits;
+
+template <typename T, int Flags> struct array_traits<py::array_t<T, Flags>> {
+  using value_type = T;
+  static constexpr bool c_contiguous = (Flags & py::array::c_style) != 0;
+};
+
+template <typename T, size_t N> struct array_traits<mdspan<T, N>> {
+  using value_type = std::remove_cv_t<T>;
+  static constexpr bool c_contiguous = true;
+};
+
+#if __cplusplus >= 202002L
+template <typename T> struct array_traits<std::span<T>> {
+  using value_type = std::remove_cv_t<T>;
+  static constexpr bool c_contiguous = true;
+};
+#endif
+
+// describes why the argument would need to be copied, or returns an empty string if it wouldn't (i.e. it's rejected for
+// some other reason, such as the number of dimensions)
+template <typename Base> std::string copy_reason(py::handle src) {
+  using traits = array_traits<Base>;
+  auto target = py::str(py::dtype::of<typename traits::value_type>()).cast<std::string>();
+  if (!py::isinstance<py::array>(src))
+    return py::str(py::type::of(src).attr("__name__")).cast<std::string>() + " would be converted to an array of " +
+           target;
+  auto array = py::reinterpret_borrow<py::array>(src);
+  if (!array.dtype().equal(py::dtype::of<typename traits::value_type>()))
+    return "array of dtype " + py::str(array.dtype()).cast<std::string>() + " would be converted to " + target;
+  if (traits::c_contiguous && !(array.flags() & py::array::c_style))
+    return "non-C-contiguous array would be copied";
+  return "";
+}
+
+inline std::mutex& copies_mutex() {
+  static std::mutex mutex;
+  return mutex;
+}
+
+// the number of conversion copies of each argument in this module (map nodes are stable, so counters can be cached)
+inline std::map<std::string, std::atomic<uint64_t>>& copies_registry() {
+  static std::map<std::string, std::atomic<uint64_t>> copies;
+  return copies;
+}
+
+inline std::atomic<uint64_t>& copy_counter(const std::string& name) {
+  std::lock_guard<std::mutex> lock(copies_mutex());
+  return copies_registry()[name];
+}
+
+} // namespace detail
+
+// Adds the functions that report and reset the copy counts to the module, if not already present
+inline void register_array_copies(pybind11::module_& m) {
+  if (pybind11::hasattr(m, "_xenoform_array_copies"))
+    return;
+  m.def("_xenoform_array_copies", []() {
+    pybind11::dict copies;
+    std::lock_guard<std::mutex> lock(detail::copies_mutex());
+    for (const auto& [name, count] : detail::copies_registry())
+      copies[pybind11::str(name)] = count.load(std::memory_order_relaxed);
+    return copies;
+  });
+  m.def("_xenoform_reset_array_copies", []() {
+    std::lock_guard<std::mutex> lock(detail::copies_mutex());
+    for (auto& [_, count] : detail::copies_registry())
+      count = 0;
+  });
+}
+
+} // namespace xenoform
+
+namespace pybind11::detail {
+
+template <typename Base, bool NoCopy, const char* Name> struct array_arg_caster {
+  using arg_type = xenoform::array_arg<Base, NoCopy, Name>;
+  PYBIND11_TYPE_CASTER(arg_type, make_caster<Base>::name);
+
+  bool load(handle src, bool convert) {
+    if (base.load(src, false)) {
+      value = arg_type(cast_op<Base&&>(std::move(base)));
+      return true;
+    }
+    if (!convert)
+      return false;
+    std::string reason = xenoform::detail::copy_reason<Base>(src);
+    if (NoCopy && !reason.empty())
+      throw type_error(std::string(Name) + ": " + reason + " (no_copy is set)");
+    if (!base.load(src, true))
+      return false;
+    if (!reason.empty()) {
+      static std::atomic<uint64_t>& copies = xenoform::detail::copy_counter(Name);
+      copies.fetch_add(1, std::memory_order_relaxed);
+    }
+    value = arg_type(cast_op<Base&&>(std::move(base)));
+    return true;
+  }
+
+private:
+  // holds any converted array for the duration of the call
+  make_caster<Base> base;
+};
+
+// array_t (like all python objects) is converted by pyobject_caster, views by type_caster
+template <typename Base, bool NoCopy, const char* Name>
+struct pyobject_caster<xenoform::array_arg<Base, NoCopy, Name>> : array_arg_caster<Base, NoCopy, Name> {};
+
+template <typename Base, bool NoCopy, const char* Name>
+struct type_caster<xenoform::array_arg<Base, NoCopy, Name>, enable_if_t<!is_pyobject<Base>::value>>
+    : array_arg_caster<Base, NoCopy, Name> {};
+
+} // namespace pybind11::detail
@@ -0,0 +1,68 @@
+// Batched calls of compiled functions, used by compile(batch=True) and xenoform.starmap
+//
+// batch(f, policy) returns a function taking an iterable of argument tuples, which converts each tuple's arguments and
+// calls f, returning a list of the results. Only the arguments and results are converted for each item: the overload
+// resolution and call dispatch that pybind11 performs for every python call happens once, for the whole batch.
+
+#pragma once
+
+#include <pybind11/pybind11.h>
+
+#include <cstddef>
+#include <string>
+#include <tuple>
+#include <type_traits>
+#include <utility>
+
+namespace xenoform {
+
+namespace detail {
+
+namespace py = pybind11;
+
+template <typename F, typename Return, typename... Args, size_t... I>
+auto batch(F&& f, py::return_value_policy policy, Return (*)(Args...), std::index_sequence<I...>) {
+  return [f = std::forward<F>(f), policy](const py::iterable& items) mutable {
+    py::list results;
+    size_t index = 0;
+    for (py::handle item : items) {
+      if (!py::isinstance<py::tuple>(item) || py::len(item) != sizeof...(Args))
+        throw py::type_error("batch item " + std::to_string(index) + ": expected a tuple of " +
+                             std::to_string(sizeof...(Args)) + " argument(s)");
+      auto args = py::reinterpret_borrow<py::tuple>(item);
+      // hold the converted arguments (e.g. arrays converted to the right dtype) for the duration of the call
+      std::tuple<py::detail::make_caster<Args>...> casters;
+      size_t failed = 0;
+      if (!((std::get<I>(casters).load(args[I], true) || (failed = I + 1, false)) && ...))
+        throw py::type_error("batch item " + std::to_string(index) + ": argument " + std::to_string(failed - 1) +
+                             " (" + py::str(py::type::of(args[failed - 1]).attr("__name__")).cast<std::string>() +
+                             ") could not be converted");
+      if constexpr (std::is_void_v<Return>) {
+        f(py::detail::cast_op<Args>(std::move(std::get<I>(casters)))...);
+        results.append(py::none());
+      } else {
+        results.append(py::reinterpret_steal<py::object>(py::detail::make_caster<Return>::cast(
+            f(py::detail::cast_op<Args>(std::move(std::get<I>(casters)))...),
+            py::detail::return_value_policy_override<Return>::policy(policy), py::handle())));
+      }
+      ++index;
+    }
+    return results;
+  };
+}
+
+template <typename F, typename Return, typename... Args>
+auto batch(F&& f, py::return_value_policy policy, Return (*signature)(Args...)) {
+  return batch(std::forward<F>(f), policy, signature, std::index_sequence_for<Args...>());
+}
+
+} // namespace detail
+
+// Returns a function that calls f for each tuple of arguments in an iterable, and returns a list of the results
+template <typename F>
+auto batch(F&& f, pybind11::return_value_policy policy = pybind11::return_value_policy::automatic) {
+  return detail::batch(std::forward<F>(f), policy,
+                       static_cast<pybind11::detail::function_signature_t<std::decay_t<F>>*>(nullptr));
+}
+
+} // namespace xenoform
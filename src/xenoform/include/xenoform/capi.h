@@ -0,0 +1,283 @@
+// Argument parsing and conversion for functions bound directly to the CPython C API, used by compile(binding="capi")
+//
+// Each function is a METH_FASTCALL | METH_KEYWORDS wrapper that parses its arguments with parse_args, converts them
+// with arg<T> (integers, floating point and bool scalars, and 1-D std::span views of C-contiguous buffers, e.g. numpy
+// arrays, which are never copied) and calls the function body via call, which converts the result and translates C++
+// exceptions into python exceptions. Only <Python.h> and the standard library are needed, so modules whose functions
+// all use this binding are built without the pybind11 headers.
+
+#pragma once
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif
+#include <Python.h>
+
+#include <cstdint>
+#include <cstring>
+#include <exception>
+#include <limits>
+#include <new>
+#include <optional>
+#include <span>
+#include <stdexcept>
+#include <string>
+#include <type_traits>
+#include <utility>
+
+namespace xenoform::capi {
+
+// Matches the positional and keyword arguments to the parameters (names, in order), setting values[i] to the argument
+// for the ith parameter, or nullptr if it wasn't passed. The first pos_only parameters can't be passed by keyword and
+// only the first max_positional can be passed by position. Returns false, with a TypeError set, on failure
+inline bool parse_args(const char* function, const char* const* names, Py_ssize_t n, Py_ssize_t pos_only,
+                       Py_ssize_t max_positional, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames,
+                       PyObject** values) {
+  if (nargs > max_positional) {
+    PyErr_Format(PyExc_TypeError, "%s() takes at most %zd positional argument(s) (%zd given)", function,
+                 max_positional, nargs);
+    return false;
+  }
+  for (Py_ssize_t i = 0; i < n; ++i)
+    values[i] = i < nargs ? args[i] : nullptr;
+  Py_ssize_t nkwargs = kwnames ? PyTuple_GET_SIZE(kwnames) : 0;
+  for (Py_ssize_t k = 0; k < nkwargs; ++k) {
+    const char* key = PyUnicode_AsUTF8(PyTuple_GET_ITEM(kwnames, k));
+    if (!key)
+      return false;
+    Py_ssize_t i = pos_only;
+    while (i < n && std::strcmp(key, names[i]) != 0)
+      ++i;
+    if (i == n) {
+      PyErr_Format(PyExc_TypeError, "%s() got an unexpected keyword argument '%s'", function, key);
+      return false;
+    }
+    if (values[i]) {
+      PyErr_Format(PyExc_TypeError, "%s() got multiple values for argument '%s'", function, key);
+      return false;
+    }
+    values[i] = args[nargs + k];
+  }
+  return true;
+}
+
+namespace detail {
+
+template <typename T> struct buffer_format;
+template <> struct buffer_format<double> {
+  static constexpr char codes[] = "d";
+  static constexpr const char* name = "float64";
+};
+template <> struct buffer_format<float> {
+  static constexpr char codes[] = "f";
+  static constexpr const char* name = "float32";
+};
+template <> struct buffer_format<int64_t> {
+  static constexpr char codes[] = {'q', sizeof(long) == 8 ? 'l' : 'q', '\0'};
+  static constexpr const char* name = "int64";
+};
+template <> struct buffer_format<int32_t> {
+  static constexpr char codes[] = {'i', sizeof(long) == 4 ? 'l' : 'i', '\0'};
+  static constexpr const char* name = "int32";
+};
+
+// whether a buffer's format (e.g. "d", "<d") is the native representation of T
+template <typename T> bool format_matches(const char* format) {
+  if (!format)
+    return false;
+  if (*format == '@' || *format == '=' || (*format == (PY_LITTLE_ENDIAN ? '<' : '>')))
+    ++format;
+  return format[0] != '\0' && format[1] == '\0' && std::strchr(buffer_format<T>::codes, format[0]) != nullptr;
+}
+
+inline bool argument_error(const char* function, const char* name, const std::string& message) {
+  PyErr_Format(PyExc_TypeError, "%s(): argument '%s' %s", function, name, message.c_str());
+  return false;
+}
+
+inline std::string type_name(PyObject* obj) { return Py_TYPE(obj)->tp_name; }
+
+} // namespace detail
+
+// A function argument of type T, which may have a default value
+template <typename T> class arg {
+public:
+  arg() = default;
+  explicit arg(T default_value) : value_(default_value) {}
+
+  // Converts the argument (nullptr if it wasn't passed). Returns false, with a TypeError set, on failure
+  bool load(PyObject* obj, const char* function, const char* name) {
+    if (!obj) {
+      if (value_)
+        return true;
+      PyErr_Format(PyExc_TypeError, "%s() missing required argument '%s'", function, name);
+      return false;
+    }
+    if constexpr (std::is_same_v<T, bool>) {
+      if (obj == Py_True || obj == Py_False || detail::type_name(obj) == "numpy.bool") {
+        value_ = obj == Py_True || (obj != Py_False && PyObject_IsTrue(obj) == 1);
+        return true;
+      }
+      return detail::argument_error(function, name, "must be bool, not " + detail::type_name(obj));
+    } else if constexpr (std::is_integral_v<T>) {
+      if (PyFloat_Check(obj) || !(PyLong_Check(obj) || PyIndex_Check(obj)))
+        return detail::argument_error(function, name, "must be int, not " + detail::type_name(obj));
+      long long value = PyLong_Check(obj) ? PyLong_AsLongLong(obj) : -1;
+      if (!PyLong_Check(obj)) {
+        PyObject* index = PyNumber_Index(obj);
+        if (!index)
+          return false;
+        value = PyLong_AsLongLong(index);
+        Py_DECREF(index);
+      }
+      if ((value == -1 && PyErr_Occurred()) || value < std::numeric_limits<T>::min() ||
+          value > std::numeric_limits<T>::max()) {
+        PyErr_Clear();
+        return detail::argument_error(function, name, "is out of range");
+      }
+      value_ = static_cast<T>(value);
+      return true;
+    } else {
+      double value = PyFloat_CheckExact(obj) ? PyFloat_AS_DOUBLE(obj) : PyFloat_AsDouble(obj);
+      if (value == -1.0 && PyErr_Occurred()) {
+        PyErr_Clear();
+        return detail::argument_error(function, name, "must be float, not " + detail::type_name(obj));
+      }
+      value_ = static_cast<T>(value);
+      return true;
+    }
+  }
+
+  T get() const noexcept { return *value_; }
+
+private:
+  std::optional<T> value_;
+};
+
+// A view of a 1-D C-contiguous buffer of T (const T for read-only access), held for the duration of the call
+template <typename T> class arg<std::span<T>> {
+public:
+  using value_type = std::remove_const_t<T>;
+
+  arg() = default;
+  arg(const arg&) = delete;
+  arg& operator=(const arg&) = delete;
+  ~arg() {
+    if (view_.obj)
+      PyBuffer_Release(&view_);
+  }
+
+  bool load(PyObject* obj, const char* function, const char* name) {
+    if (!obj) {
+      PyErr_Format(PyExc_TypeError, "%s() missing required argument '%s'", function, name);
+      return false;
+    }
+    std::string expected = std::string("must be a C-contiguous 1-D ") + (std::is_const_v<T> ? "" : "writeable ") +
+                           "array of " + detail::buffer_format<value_type>::name;
+    int flags = PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | (std::is_const_v<T> ? 0 : PyBUF_WRITABLE);
+    if (!PyObject_CheckBuffer(obj) || PyObject_GetBuffer(obj, &view_, flags) < 0) {
+      PyErr_Clear();
+      return detail::argument_error(function, name, expected + " (not copied)");
+    }
+    if (view_.ndim != 1 || view_.itemsize != sizeof(value_type) || !detail::format_matches<value_type>(view_.format))
+      return detail::argument_error(function, name,
+                                    expected + ", not " + std::to_string(view_.ndim) + "-D with format '" +
+                                        (view_.format ? view_.format : "B") + "' (not copied)");
+    return true;
+  }
+
+  std::span<T> get() const noexcept {
+    return std::span<T>(static_cast<T*>(view_.buf), static_cast<size_t>(view_.shape[0]));
+  }
+
+private:
+  Py_buffer view_{};
+};
+
+namespace detail {
+
+template <typename T> PyObject* to_python(T value) {
+  if constexpr (std::is_same_v<T, bool>)
+    return PyBool_FromLong(value);
+  else if constexpr (std::is_integral_v<T>)
+    return PyLong_FromLongLong(static_cast<long long>(value));
+  else
+    return PyFloat_FromDouble(static_cast<double>(value));
+}
+
+// sets the python exception corresponding to the current C++ exception, as pybind11 does
+inline void translate_exception() {
+  try {
+    throw;
+  } catch (const std::bad_alloc&) {
+    PyErr_NoMemory();
+  } catch (const std::out_of_range& e) {
+    PyErr_SetString(PyExc_IndexError, e.what());
+  } catch (const std::overflow_error& e) {
+    PyErr_SetString(PyExc_OverflowError, e.what());
+  } catch (const std::invalid_argument& e) {
+    PyErr_SetString(PyExc_ValueError, e.what());
+  } catch (const std::length_error& e) {
+    PyErr_SetString(PyExc_ValueError, e.what());
+  } catch (const std::domain_error& e) {
+    PyErr_SetString(PyExc_ValueError, e.what());
+  } catch (const std::range_error& e) {
+    PyErr_SetString(PyExc_ValueError, e.what());
+  } catch (const std::exception& e) {
+    PyErr_SetString(PyExc_RuntimeError, e.what());
+  } catch (...) {
+    PyErr_SetString(PyExc_RuntimeError, "Caught an unknown exception!");
+  }
+}
+
+// releases the GIL for its lifetime, if ReleaseGil
+template <bool ReleaseGil> struct gil_release {
+  PyThreadState* state = ReleaseGil ? PyEval_SaveThread() : nullptr;
+  gil_release() = default;
+  gil_release(const gil_release&) = delete;
+  gil_release& operator=(const gil_release&) = delete;
+  ~gil_release() {
+    if (ReleaseGil)
+      PyEval_RestoreThread(state);
+  }
+};
+
+} // namespace detail
+
+// Calls f with the (converted) arguments, optionally without the GIL, and returns the result as a python object, or
+// nullptr with a python exception set if f throws
+template <bool ReleaseGil = false, typename F, typename... Args> PyObject* call(F&& f, Args&&... args) noexcept {
+  using result_type = std::invoke_result_t<F, Args...>;
+  try {
+    if constexpr (std::is_void_v<result_type>) {
+      {
+        detail::gil_release<ReleaseGil> release;
+        std::forward<F>(f)(std::forward<Args>(args)...);
+      }
+      Py_RETURN_NONE;
+    } else {
+      std::optional<std::decay_t<result_type>> result;
+      {
+        detail::gil_release<ReleaseGil> release;
+        result = std::forward<F>(f)(std::forward<Args>(args)...);
+      }
+      return detail::to_python(*result);
+    }
+  } catch (...) {
+    detail::translate_exception();
+    return nullptr;
+  }
+}
+
+// Adds the functions (a null-terminated array) to the module, either a PyObject* or a pybind11 module
+template <typename M> void add_functions(M& m, PyMethodDef* functions) {
+  PyObject* module = nullptr;
+  if constexpr (std::is_pointer_v<M>)
+    module = m;
+  else
+    module = m.ptr();
+  if (PyModule_AddFunctions(module, functions) < 0)
+    throw std::runtime_error("failed to add functions to module");
+}
+
+} // namespace xenoform::capi
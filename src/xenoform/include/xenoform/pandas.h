@@ -0,0 +1,259 @@
+// pandas Series and DataFrame arguments and return values, used by the pd.Series and pd.DataFrame type mappings
+//
+// Arguments are views of the underlying values, without copying them: xenoform::series<const T> for a Series, and
+// xenoform::frame<const T> for a DataFrame whose columns all have dtype T. Values needn't be contiguous: e.g. the
+// columns of a frame constructed from a (row-major) 2-D array are accessed with a stride. The dtype is checked once,
+// when the argument is converted, and mismatches raise TypeError rather than silently converting (i.e. copying) the
+// values. Return values are new series or frames, allocated in C++ with the index (and name/columns) of an argument,
+// e.g. xenoform::series<double>::like(data), and returned to python as pandas objects without copying the values.
+
+#pragma once
+
+#include <pybind11/gil_safe_call_once.h>
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+
+#include <cstddef>
+#include <iterator>
+#include <string>
+#include <type_traits>
+#include <utility>
+#include <vector>
+
+namespace xenoform {
+
+namespace detail {
+
+namespace py = pybind11;
+
+inline py::object& pandas_type(const char* name) {
+  // one for each of Series and DataFrame. Imported once (with the GIL held), never destroyed
+  PYBIND11_CONSTINIT static py::gil_safe_call_once_and_store<py::object> series, frame;
+  auto& storage = std::string(name) == "Series" ? series : frame;
+  return storage.call_once_and_store_result([name]() { return py::module_::import("pandas").attr(name); }).get_stored();
+}
+
+// any layout, new arrays are C-contiguous
+template <typename T> using values_array = py::array_t<std::remove_cv_t<T>, 0>;
+
+// the values of a Series (or DataFrame column), if they can be viewed as T without copying, and their stride (in
+// elements)
+template <typename T>
+bool view_values(py::handle series, values_array<T>& values, std::ptrdiff_t& stride, bool convert) {
+  py::object array = series.attr("to_numpy")();
+  if (values_array<T>::check_(array)) {
+    values = py::reinterpret_borrow<values_array<T>>(array);
+    // e.g. a field of a structured array
+    if (values.strides(0) % static_cast<py::ssize_t>(sizeof(T)) == 0) {
+      stride = values.strides(0) / static_cast<py::ssize_t>(sizeof(T));
+      return true;
+    }
+  }
+  if (convert) {
+    auto target = py::str(py::dtype::of<std::remove_cv_t<T>>()).cast<std::string>();
+    auto dtype = py::str(array.attr("dtype")).cast<std::string>();
+    throw py::type_error(dtype == target ? "values of dtype " + dtype + " are not aligned, so would be copied"
+                                         : "values of dtype " + dtype + " would be converted to " + target);
+  }
+  return false;
+}
+
+// iterates over values a fixed number of elements apart
+template <typename T> class strided_iterator {
+public:
+  using iterator_category = std::forward_iterator_tag;
+  using value_type = std::remove_cv_t<T>;
+  using difference_type = std::ptrdiff_t;
+  using pointer = T*;
+  using reference = T&;
+
+  strided_iterator() = default;
+  strided_iterator(T* p, std::ptrdiff_t stride) : p_(p), stride_(stride) {}
+
+  T& operator*() const noexcept { return *p_; }
+  T* operator->() const noexcept { return p_; }
+  strided_iterator& operator++() noexcept {
+    p_ += stride_;
+    return *this;
+  }
+  strided_iterator operator++(int) noexcept {
+    auto it = *this;
+    ++*this;
+    return it;
+  }
+  bool operator==(const strided_iterator& other) const noexcept { return p_ == other.p_; }
+
+private:
+  T* p_ = nullptr;
+  std::ptrdiff_t stride_ = 1;
+};
+
+} // namespace detail
+
+// A pandas Series: a 1-D array of values with an index and name
+template <typename T> class series {
+public:
+  using element_type = T;
+  using value_type = std::remove_cv_t<T>;
+
+  series() = default;
+
+  // A new series of n (uninitialised) values
+  series(pybind11::object index, size_t n, pybind11::object name = pybind11::none())
+      : values_(static_cast<pybind11::ssize_t>(n)), data_(values_.mutable_data()), size_(n), index_(std::move(index)),
+        name_(std::move(name)) {}
+
+  // A view of an existing series (or column) and its values, stride elements apart
+  series(pybind11::object obj, detail::values_array<T> values, std::ptrdiff_t stride)
+      : values_(std::move(values)), data_(values_.data()), stride_(stride), size_(static_cast<size_t>(values_.size())),
+        index_(obj.attr("index")), name_(obj.attr("name")), obj_(std::move(obj)) {}
+
+  // A new series with the same size, index and name as another
+  template <typename S> static series like(const S& other) { return series(other.index(), other.size(), other.name()); }
+
+  size_t size() const noexcept { return size_; }
+  bool empty() const noexcept { return size_ == 0; }
+  // the first value, and the distance (in elements) between values, which is 1 for a new series
+  T* data() const noexcept { return data_; }
+  std::ptrdiff_t stride() const noexcept { return stride_; }
+  T& operator[](size_t i) const noexcept { return data_[static_cast<std::ptrdiff_t>(i) * stride_]; }
+  detail::strided_iterator<T> begin() const noexcept { return {data_, stride_}; }
+  detail::strided_iterator<T> end() const noexcept {
+    return {data_ + static_cast<std::ptrdiff_t>(size_) * stride_, stride_};
+  }
+
+  const pybind11::object& index() const noexcept { return index_; }
+  const pybind11::object& name() const noexcept { return name_; }
+  const pybind11::array& values() const noexcept { return values_; }
+  // the original pandas object, if this is a view of one
+  const pybind11::object& obj() const noexcept { return obj_; }
+
+private:
+  detail::values_array<T> values_;
+  T* data_ = nullptr;
+  std::ptrdiff_t stride_ = 1;
+  size_t size_ = 0;
+  pybind11::object index_;
+  pybind11::object name_;
+  pybind11::object obj_;
+};
+
+// A pandas DataFrame with columns of a single dtype, accessed as frame(row, column)
+template <typename T> class frame {
+public:
+  using element_type = T;
+  using value_type = std::remove_cv_t<T>;
+
+  frame() = default;
+
+  // A new frame of (uninitialised) values, with the given index and columns. Each column is contiguous
+  frame(pybind11::object index, pybind11::object columns)
+      : rows_(pybind11::len(index)), index_(std::move(index)), columns_(std::move(columns)) {
+    values_ = detail::values_array<T>({static_cast<pybind11::ssize_t>(pybind11::len(columns_)),
+                                       static_cast<pybind11::ssize_t>(rows_)});
+    for (size_t j = 0; j < pybind11::len(columns_); ++j)
+      data_.push_back(values_.mutable_data() + j * rows_);
+    strides_.assign(data_.size(), 1);
+  }
+
+  // A view of an existing frame's columns, whose values are strides[j] elements apart
+  frame(pybind11::object obj, std::vector<detail::values_array<T>> columns, std::vector<std::ptrdiff_t> strides)
+      : rows_(pybind11::len(obj)), index_(obj.attr("index")), columns_(obj.attr("columns")), obj_(std::move(obj)),
+        column_values_(std::move(columns)), strides_(std::move(strides)) {
+    for (const auto& column : column_values_)
+      data_.push_back(column.data());
+  }
+
+  // A new frame with the same index and columns as another
+  template <typename F> static frame like(const F& other) { return frame(other.index(), other.columns()); }
+
+  size_t rows() const noexcept { return rows_; }
+  size_t cols() const noexcept { return data_.size(); }
+  T& operator()(size_t i, size_t j) const noexcept { return data_[j][static_cast<std::ptrdiff_t>(i) * strides_[j]]; }
+  // the first value of the jth column, and the distance (in elements) between its values, which is 1 for a new frame
+  T* column(size_t j) const noexcept { return data_[j]; }
+  std::ptrdiff_t stride(size_t j) const noexcept { return strides_[j]; }
+
+  const pybind11::object& index() const noexcept { return index_; }
+  const pybind11::object& columns() const noexcept { return columns_; }
+  // the values, as an array of shape (columns, rows), for a new frame
+  const pybind11::array& values() const noexcept { return values_; }
+  // the original pandas object, if this is a view of one
+  const pybind11::object& obj() const noexcept { return obj_; }
+
+private:
+  size_t rows_ = 0;
+  pybind11::object index_;
+  pybind11::object columns_;
+  pybind11::object obj_;
+  detail::values_array<T> values_;
+  std::vector<detail::values_array<T>> column_values_;
+  std::vector<T*> data_;
+  std::vector<std::ptrdiff_t> strides_;
+};
+
+} // namespace xenoform
+
+namespace pybind11::detail {
+
+template <typename T> struct type_caster<xenoform::series<T>> {
+  PYBIND11_TYPE_CASTER(xenoform::series<T>, const_name("pandas.Series"));
+
+  bool load(handle src, bool convert) {
+    if (!isinstance(src, xenoform::detail::pandas_type("Series")))
+      return false;
+    xenoform::detail::values_array<T> values;
+    std::ptrdiff_t stride = 1;
+    try {
+      if (!xenoform::detail::view_values<T>(src, values, stride, convert))
+        return false;
+    } catch (const type_error& e) {
+      throw type_error(std::string("pd.Series: ") + e.what());
+    }
+    value = xenoform::series<T>(reinterpret_borrow<object>(src), std::move(values), stride);
+    return true;
+  }
+
+  static handle cast(const xenoform::series<T>& src, return_value_policy, handle) {
+    if (src.obj())
+      return src.obj().inc_ref();
+    return xenoform::detail::pandas_type("Series")(src.values(), arg("index") = src.index(),
+                                                   arg("name") = src.name(), arg("copy") = false)
+        .release();
+  }
+};
+
+template <typename T> struct type_caster<xenoform::frame<T>> {
+  PYBIND11_TYPE_CASTER(xenoform::frame<T>, const_name("pandas.DataFrame"));
+
+  bool load(handle src, bool convert) {
+    if (!isinstance(src, xenoform::detail::pandas_type("DataFrame")))
+      return false;
+    std::vector<xenoform::detail::values_array<T>> columns;
+    std::vector<std::ptrdiff_t> strides;
+    for (handle item : src.attr("items")()) {
+      auto column = item.cast<tuple>();
+      columns.emplace_back();
+      strides.emplace_back(1);
+      try {
+        if (!xenoform::detail::view_values<T>(column[1], columns.back(), strides.back(), convert))
+          return false;
+      } catch (const type_error& e) {
+        throw type_error("pd.DataFrame column " + str(column[0]).cast<std::string>() + ": " + e.what());
+      }
+    }
+    value = xenoform::frame<T>(reinterpret_borrow<object>(src), std::move(columns), std::move(strides));
+    return true;
+  }
+
+  static handle cast(const xenoform::frame<T>& src, return_value_policy, handle) {
+    if (src.obj())
+      return src.obj().inc_ref();
+    // pandas stores the values of each dtype as a (columns, rows) array, so the transpose is used as-is
+    return xenoform::detail::pandas_type("DataFrame")(src.values().attr("T"), arg("index") = src.index(),
+                                                      arg("columns") = src.columns(), arg("copy") = false)
+        .release();
+  }
+};
+
+} // namespace pybind11::detail
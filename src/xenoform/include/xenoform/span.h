@@ -0,0 +1,146 @@
+// Zero-copy views of C-contiguous numpy arrays, used by the ArrayView annotation
+//
+// 1-D arrays map to std::span<T> (C++20), N-D arrays to xenoform::mdspan<T, N>, a minimal row-major equivalent of
+// C++23's std::mdspan. The dtype, dimensions and contiguity are checked once, when the argument is converted, so the
+// function body works with a plain pointer. Views of const T accept anything numpy can convert (copying only if the
+// array isn't already C-contiguous with the exact dtype); views of mutable T require a writeable C-contiguous array of
+// the exact dtype, so that writes are never lost to a copy.
+
+#pragma once
+
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+
+#include <array>
+#include <cstddef>
+#include <type_traits>
+
+#if __cplusplus >= 202002L
+#include <span>
+#endif
+
+namespace xenoform {
+
+template <typename T, size_t N> class mdspan {
+public:
+  using element_type = T;
+  using value_type = std::remove_cv_t<T>;
+  using index_type = size_t;
+
+  mdspan() = default;
+
+  mdspan(T* data, const std::array<size_t, N>& extents) noexcept : data_(data), extents_(extents) {
+    size_t stride = 1;
+    for (size_t r = N; r-- > 0;) {
+      strides_[r] = stride;
+      stride *= extents_[r];
+    }
+  }
+
+  static constexpr size_t rank() noexcept { return N; }
+  size_t extent(size_t r) const noexcept { return extents_[r]; }
+  // in elements
+  size_t stride(size_t r) const noexcept { return strides_[r]; }
+  size_t size() const noexcept { return N ? strides_[0] * extents_[0] : 0; }
+  bool empty() const noexcept { return size() == 0; }
+  T* data_handle() const noexcept { return data_; }
+
+  template <typename... I> T& operator()(I... indices) const noexcept {
+    static_assert(sizeof...(I) == N, "mdspan: the number of indices must equal the rank");
+    const size_t index[] = {static_cast<size_t>(indices)...};
+    size_t offset = 0;
+    for (size_t r = 0; r < N; ++r)
+      offset += index[r] * strides_[r];
+    return data_[offset];
+  }
+
+private:
+  T* data_ = nullptr;
+  std::array<size_t, N> extents_{};
+  std::array<size_t, N> strides_{};
+};
+
+namespace detail {
+
+namespace py = pybind11;
+
+// Holds the array (which may be a converted copy) for the duration of the call, and checks it matches the view
+template <typename T, size_t N> struct array_view_loader {
+  using value_type = std::remove_cv_t<T>;
+  using array_type = py::array_t<value_type, py::array::c_style | py::array::forcecast>;
+
+  array_type array;
+
+  bool load(py::handle src, bool convert) {
+    if (array_type::check_(src)) {
+      array = py::reinterpret_borrow<array_type>(src);
+    } else if (std::is_const_v<T> && convert) {
+      array = array_type::ensure(src);
+      if (!array) {
+        PyErr_Clear();
+        return false;
+      }
+    } else {
+      return false;
+    }
+    if (static_cast<size_t>(array.ndim()) != N)
+      return false;
+    return std::is_const_v<T> || array.writeable();
+  }
+
+  T* data() {
+    if constexpr (std::is_const_v<T>)
+      return array.data();
+    else
+      return array.mutable_data();
+  }
+
+  std::array<size_t, N> extents() const {
+    std::array<size_t, N> extents{};
+    for (size_t r = 0; r < N; ++r)
+      extents[r] = static_cast<size_t>(array.shape(r));
+    return extents;
+  }
+};
+
+} // namespace detail
+
+} // namespace xenoform
+
+namespace pybind11::detail {
+
+template <typename T, size_t N> struct type_caster<xenoform::mdspan<T, N>> {
+  // the macro can't take a type containing a comma
+  using view_type = xenoform::mdspan<T, N>;
+  PYBIND11_TYPE_CASTER(view_type, const_name("numpy.typing.NDArray[") +
+                                      npy_format_descriptor<std::remove_cv_t<T>>::name + const_name("]"));
+
+  bool load(handle src, bool convert) {
+    if (!loader.load(src, convert))
+      return false;
+    value = view_type(loader.data(), loader.extents());
+    return true;
+  }
+
+private:
+  xenoform::detail::array_view_loader<T, N> loader;
+};
+
+#if __cplusplus >= 202002L
+template <typename T> struct type_caster<std::span<T>> {
+  PYBIND11_TYPE_CASTER(std::span<T>, const_name("numpy.typing.NDArray[") +
+                                         npy_format_descriptor<std::remove_cv_t<T>>::name + const_name("]"));
+
+  bool load(handle src, bool convert) {
+    if (!loader.load(src, convert))
+      return false;
+    value = std::span<T>(loader.data(), loader.extents()[0]);
+    return true;
+  }
+
+private:
+  xenoform::detail::array_view_loader<T, 1> loader;
+};
+#endif
+
+} // namespace pybind11::detail
@@ -0,0 +1,138 @@
+// Call statistics for compiled functions, used by compile(instrument=True)
+//
+// Each instrumented function records its call count, total/min/max wall time and a histogram of call durations
+// (bucket i counts calls taking [2^i, 2^(i+1)) ns) using relaxed atomics, so recording is lock-free and doesn't call
+// the python API. The statistics are read and reset via functions added to the module, which xenoform.stats() and
+// xenoform.reset_stats() call.
+
+#pragma once
+
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+#include <array>
+#include <atomic>
+#include <chrono>
+#include <cstdint>
+#include <limits>
+#include <map>
+#include <string>
+#include <utility>
+#include <vector>
+
+#if __cplusplus >= 202002L
+#include <bit>
+#endif
+
+namespace xenoform {
+
+namespace detail {
+
+namespace py = pybind11;
+using namespace pybind11::literals;
+
+constexpr size_t histogram_buckets = 40;
+
+inline size_t histogram_bucket(uint64_t ns) noexcept {
+#if __cplusplus >= 202002L
+  size_t bucket = ns ? std::bit_width(ns) - 1 : 0;
+#else
+  size_t bucket = 0;
+  while (ns >>= 1)
+    ++bucket;
+#endif
+  return bucket < histogram_buckets ? bucket : histogram_buckets - 1;
+}
+
+struct call_stats {
+  std::atomic<uint64_t> calls{0};
+  std::atomic<uint64_t> total_ns{0};
+  std::atomic<uint64_t> min_ns{std::numeric_limits<uint64_t>::max()};
+  std::atomic<uint64_t> max_ns{0};
+  std::array<std::atomic<uint64_t>, histogram_buckets> histogram{};
+
+  void record(uint64_t ns) noexcept {
+    calls.fetch_add(1, std::memory_order_relaxed);
+    total_ns.fetch_add(ns, std::memory_order_relaxed);
+    uint64_t min = min_ns.load(std::memory_order_relaxed);
+    while (ns < min && !min_ns.compare_exchange_weak(min, ns, std::memory_order_relaxed)) {
+    }
+    uint64_t max = max_ns.load(std::memory_order_relaxed);
+    while (ns > max && !max_ns.compare_exchange_weak(max, ns, std::memory_order_relaxed)) {
+    }
+    histogram[histogram_bucket(ns)].fetch_add(1, std::memory_order_relaxed);
+  }
+
+  void reset() noexcept {
+    calls = 0;
+    total_ns = 0;
+    min_ns = std::numeric_limits<uint64_t>::max();
+    max_ns = 0;
+    for (auto& count : histogram)
+      count = 0;
+  }
+
+  py::dict to_dict() const {
+    std::vector<uint64_t> counts;
+    for (const auto& count : histogram)
+      counts.push_back(count.load(std::memory_order_relaxed));
+    uint64_t n = calls.load(std::memory_order_relaxed);
+    return py::dict("calls"_a = n, "total_ns"_a = total_ns.load(std::memory_order_relaxed),
+                    "min_ns"_a = n ? min_ns.load(std::memory_order_relaxed) : 0,
+                    "max_ns"_a = max_ns.load(std::memory_order_relaxed),
+                    "mean_ns"_a = n ? static_cast<double>(total_ns.load(std::memory_order_relaxed)) / n : 0.0,
+                    "histogram"_a = counts);
+  }
+};
+
+// the statistics for each function in this module (each module has its own, since symbols are hidden)
+inline std::map<std::string, call_stats>& registry() {
+  static std::map<std::string, call_stats> stats;
+  return stats;
+}
+
+// records the time from construction to destruction
+class scoped_timer {
+public:
+  explicit scoped_timer(call_stats& stats) noexcept : stats_(stats), start_(std::chrono::steady_clock::now()) {}
+  ~scoped_timer() {
+    auto elapsed = std::chrono::steady_clock::now() - start_;
+    stats_.record(static_cast<uint64_t>(std::chrono::duration_cast<std::chrono::nanoseconds>(elapsed).count()));
+  }
+  scoped_timer(const scoped_timer&) = delete;
+  scoped_timer& operator=(const scoped_timer&) = delete;
+
+private:
+  call_stats& stats_;
+  std::chrono::steady_clock::time_point start_;
+};
+
+template <typename F, typename Return, typename... Args> auto instrument(call_stats& stats, F&& f, Return (*)(Args...)) {
+  return [f = std::forward<F>(f), &stats](Args... args) mutable -> Return {
+    scoped_timer timer(stats);
+    return f(std::forward<Args>(args)...);
+  };
+}
+
+} // namespace detail
+
+// Returns a function with the same signature as f, that records the statistics for each call under name
+template <typename F> auto instrument(pybind11::module_& m, const char* name, F&& f) {
+  if (!pybind11::hasattr(m, "_xenoform_stats")) {
+    m.def("_xenoform_stats", []() {
+      pybind11::dict stats;
+      for (const auto& [name, function_stats] : detail::registry())
+        stats[pybind11::str(name)] = function_stats.to_dict();
+      return stats;
+    });
+    m.def("_xenoform_reset_stats", []() {
+      for (auto& [_, function_stats] : detail::registry())
+        function_stats.reset();
+    });
+  }
+  auto& stats = detail::registry()[name];
+  return detail::instrument(stats, std::forward<F>(f),
+                            static_cast<pybind11::detail::function_signature_t<std::decay_t<F>>*>(nullptr));
+}
+
+} // namespace xenoform
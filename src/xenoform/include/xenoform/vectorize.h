@@ -0,0 +1,186 @@
+// Parallel auto-vectorisation of scalar functions, used by compile(vectorise="parallel")
+//
+// Like py::vectorize, applies a scalar function elementwise to (broadcast) array arguments, but the loop is split
+// across threads using OpenMP, with the GIL released, for arrays of at least XENOFORM_PARALLEL_THRESHOLD elements.
+// Compiled without OpenMP (i.e. if the compiler doesn't support it), the loop runs serially.
+
+#pragma once
+
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+
+#include <algorithm>
+#include <array>
+#include <atomic>
+#include <cstddef>
+#include <exception>
+#include <optional>
+#include <stdexcept>
+#include <tuple>
+#include <type_traits>
+#include <utility>
+#include <vector>
+
+#ifndef XENOFORM_PARALLEL_THRESHOLD
+#define XENOFORM_PARALLEL_THRESHOLD 100000
+#endif
+
+namespace xenoform {
+
+namespace detail {
+
+namespace py = pybind11;
+
+// return and (decayed) argument types of a lambda
+template <typename F> struct call_signature : call_signature<decltype(&F::operator())> {};
+
+template <typename C, typename R, typename... A> struct call_signature<R (C::*)(A...) const> {
+  using return_type = R;
+  using arg_types = std::tuple<std::decay_t<A>...>;
+};
+
+template <typename C, typename R, typename... A> struct call_signature<R (C::*)(A...)> {
+  using return_type = R;
+  using arg_types = std::tuple<std::decay_t<A>...>;
+};
+
+template <typename T> using input_array = py::array_t<T, py::array::c_style | py::array::forcecast>;
+
+// the shape of the result of broadcasting the arrays together, according to numpy's rules
+inline std::vector<py::ssize_t> broadcast_shape(const std::vector<const py::array*>& arrays) {
+  py::ssize_t ndim = 0;
+  for (const py::array* a : arrays) {
+    ndim = std::max(ndim, a->ndim());
+  }
+  std::vector<py::ssize_t> shape(ndim, 1);
+  for (const py::array* a : arrays) {
+    py::ssize_t offset = ndim - a->ndim();
+    for (py::ssize_t d = 0; d < a->ndim(); ++d) {
+      py::ssize_t& n = shape[offset + d];
+      if (n == 1) {
+        n = a->shape(d);
+      } else if (a->shape(d) != 1 && a->shape(d) != n) {
+        // as py::vectorize
+        throw std::runtime_error("operands could not be broadcast together");
+      }
+    }
+  }
+  return shape;
+}
+
+// for a contiguous array, the offset (in elements) for a unit step in each dimension of the broadcast shape
+inline std::vector<py::ssize_t> element_strides(const py::array& a, const std::vector<py::ssize_t>& shape) {
+  py::ssize_t offset = static_cast<py::ssize_t>(shape.size()) - a.ndim();
+  std::vector<py::ssize_t> strides(shape.size(), 0);
+  py::ssize_t stride = 1;
+  for (py::ssize_t d = a.ndim() - 1; d >= 0; --d) {
+    if (a.shape(d) != 1) {
+      strides[offset + d] = stride;
+    }
+    stride *= a.shape(d);
+  }
+  return strides;
+}
+
+template <typename F, typename R, typename Args> struct parallel_vectorize_helper;
+
+template <typename F, typename R, typename... A> struct parallel_vectorize_helper<F, R, std::tuple<A...>> {
+  static_assert(std::is_arithmetic_v<R>, "parallel vectorisation requires an arithmetic return type");
+  static_assert((std::is_arithmetic_v<A> && ...), "parallel vectorisation requires arithmetic arguments");
+
+  F f;
+
+  py::object operator()(input_array<A>... arrays) const {
+    return apply(std::index_sequence_for<A...>{}, arrays...);
+  }
+
+private:
+  static constexpr std::size_t N = sizeof...(A);
+
+  template <std::size_t... I>
+  py::object apply(std::index_sequence<I...>, const input_array<A>&... arrays) const {
+    std::tuple<const A*...> data{arrays.data()...};
+    std::vector<py::ssize_t> shape = broadcast_shape({&arrays...});
+
+    // all scalars
+    if (shape.empty()) {
+      return py::cast(f(std::get<I>(data)[0]...));
+    }
+
+    py::array_t<R> result(shape);
+    R* out = result.mutable_data();
+    const py::ssize_t size = result.size();
+    const bool parallel = size >= XENOFORM_PARALLEL_THRESHOLD;
+
+    std::atomic<bool> failed{false};
+    std::exception_ptr error;
+    {
+      // nothing in the loop touches python objects
+      std::optional<py::gil_scoped_release> release;
+      if (parallel) {
+        release.emplace();
+      }
+      // exceptions cannot propagate out of a parallel region, so the first is captured and rethrown afterwards
+      auto capture = [&]() {
+#pragma omp critical(xenoform_vectorize)
+        if (!failed.exchange(true)) {
+          error = std::current_exception();
+        }
+      };
+
+      // fast path: each argument is either the full shape, or a single value
+      if (((arrays.size() == size || arrays.size() == 1) && ...)) {
+        const std::array<py::ssize_t, N> step{(arrays.size() == 1 ? py::ssize_t{0} : py::ssize_t{1})...};
+#pragma omp parallel for if (parallel)
+        for (py::ssize_t i = 0; i < size; ++i) {
+          if (failed.load(std::memory_order_relaxed)) {
+            continue;
+          }
+          try {
+            out[i] = f(std::get<I>(data)[i * step[I]]...);
+          } catch (...) {
+            capture();
+          }
+        }
+      } else {
+        const std::array<std::vector<py::ssize_t>, N> strides{element_strides(arrays, shape)...};
+        const py::ssize_t ndim = static_cast<py::ssize_t>(shape.size());
+#pragma omp parallel for if (parallel)
+        for (py::ssize_t i = 0; i < size; ++i) {
+          if (failed.load(std::memory_order_relaxed)) {
+            continue;
+          }
+          std::array<py::ssize_t, N> offsets{};
+          py::ssize_t index = i;
+          for (py::ssize_t d = ndim - 1; d >= 0; --d) {
+            py::ssize_t j = index % shape[d];
+            index /= shape[d];
+            for (std::size_t k = 0; k < N; ++k) {
+              offsets[k] += j * strides[k][d];
+            }
+          }
+          try {
+            out[i] = f(std::get<I>(data)[offsets[I]]...);
+          } catch (...) {
+            capture();
+          }
+        }
+      }
+    }
+    if (error) {
+      std::rethrow_exception(error);
+    }
+    return std::move(result);
+  }
+};
+
+} // namespace detail
+
+// Wraps a scalar lambda, returning a function object that applies it elementwise to its (broadcast) arguments
+template <typename F> auto parallel_vectorize(F f) {
+  using signature = detail::call_signature<F>;
+  return detail::parallel_vectorize_helper<F, typename signature::return_type, typename signature::arg_types>{
+      std::move(f)};
+}
+
+} // namespace xenoform
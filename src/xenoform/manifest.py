@@ -0,0 +1,67 @@
+import os
+import sys
+import sysconfig
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Self
+
+import numpy as np
+import pybind11
+import toml
+
+MANIFEST_FILE = "manifest.toml"
+
+
+def extension_filename(module_name: str) -> str:
+    """The filename of the compiled module, e.g. module.cpython-312-x86_64-linux-gnu.so"""
+    return f"{module_name}{sysconfig.get_config_var('EXT_SUFFIX')}"
+
+
+def toolchain() -> str:
+    """Identifies the interpreter ABI and the library versions a module was built against"""
+    return (
+        f"{sys.implementation.cache_tag} {sysconfig.get_config_var('EXT_SUFFIX')} "
+        f"pybind11-{pybind11.__version__} numpy-{np.__version__}"
+    )
+
+
+@dataclass(frozen=True)
+class Manifest:
+    """
+    Written alongside each compiled module, so that it can be checked to be up-to-date without importing it
+    """
+
+    checksum: str
+    toolchain: str
+    binary: str
+    size: int
+    mtime_ns: int
+
+    @classmethod
+    def create(cls, checksum: str, binary: Path) -> Self:
+        stat = binary.stat()
+        return cls(
+            checksum=checksum, toolchain=toolchain(), binary=binary.name, size=stat.st_size, mtime_ns=stat.st_mtime_ns
+        )
+
+    @classmethod
+    def load(cls, module_dir: Path) -> Self | None:
+        try:
+            return cls(**toml.load(module_dir / MANIFEST_FILE))
+        except (OSError, TypeError, toml.TomlDecodeError):
+            return None
+
+    def save(self, module_dir: Path) -> None:
+        # write then rename so that readers never see a partial manifest
+        tmp_file = module_dir / f"{MANIFEST_FILE}.{os.getpid()}"
+        with tmp_file.open("w") as fd:
+            toml.dump(asdict(self), fd)
+        tmp_file.replace(module_dir / MANIFEST_FILE)
+
+    def is_current(self, module_dir: Path) -> bool:
+        """True if the binary is the one described by the manifest, and was built with the current toolchain"""
+        try:
+            stat = (module_dir / self.binary).stat()
+        except OSError:
+            return False
+        return self.toolchain == toolchain() and (stat.st_size, stat.st_mtime_ns) == (self.size, self.mtime_ns)
@@ -0,0 +1,89 @@
+import os
+import platform
+import shutil
+import threading
+from hashlib import sha256
+from pathlib import Path
+
+from xenoform.build import BuildBackend, compiler, compiler_version
+from xenoform.config import get_setting
+from xenoform.cppmodule import ModuleSpec
+from xenoform.logger import get_logger
+from xenoform.manifest import extension_filename, toolchain
+
+logger = get_logger()
+
+
+def store_dir() -> Path | None:
+    """The location of the shared artefact store, if configured"""
+    path = get_setting("artefact_store", "")
+    return Path(os.path.expandvars(path)).expanduser() if path else None
+
+
+def fingerprint() -> str:
+    """Identifies everything other than the source code that affects the compiled module"""
+    cxx = compiler()
+    return "\n".join(
+        [
+            toolchain(),
+            compiler_version(tuple(cxx)),
+            *cxx,
+            get_setting("build_backend", BuildBackend.Setuptools.value),
+            *(os.environ.get(var, "") for var in ("CFLAGS", "CPPFLAGS", "LDFLAGS")),
+            platform.system(),
+            platform.machine(),
+        ]
+    )
+
+
+def local_dependencies(module_spec: ModuleSpec) -> list[str]:
+    """
+    The module's local headers (or sources), include paths and library paths, and libraries linked by path. The key
+    doesn't cover their contents (nor any files they include), which may differ between projects or checkouts, so
+    modules that have any aren't stored
+    """
+    return [
+        *(header for header in module_spec.headers if header.startswith('"')),
+        *module_spec.include_paths,
+        *(arg for arg in module_spec.extra_compile_args if arg.startswith("-I")),
+        *(arg for arg in module_spec.extra_link_args if arg.startswith("-L") or not arg.startswith("-")),
+    ]
+
+
+def artefact_key(hashval: str) -> str:
+    """The key of a module in the store, from the hash of its source code and the toolchain fingerprint"""
+    return sha256(f"{hashval}\n{fingerprint()}".encode()).hexdigest()
+
+
+def _tmp_name(name: str) -> str:
+    return f".{name}.{os.getpid()}.{threading.get_ident()}"
+
+
+def fetch(store: Path, key: str, module_name: str, module_dir: Path) -> bool:
+    """Copy the module from the store into module_dir, if present. Returns True if found"""
+    artefact = store / key[:2] / key / extension_filename(module_name)
+    if not artefact.exists():
+        return False
+    # copy then rename, since the existing module may be in use
+    tmp_file = module_dir / _tmp_name(artefact.name)
+    shutil.copy2(artefact, tmp_file)
+    tmp_file.replace(module_dir / artefact.name)
+    logger(f"fetched {artefact}")
+    return True
+
+
+def publish(store: Path, key: str, binary: Path) -> None:
+    """Add the module to the store. The artefact directory appears atomically, so is never seen partially written"""
+    artefact_dir = store / key[:2] / key
+    if artefact_dir.exists():
+        return
+    artefact_dir.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = artefact_dir.parent / _tmp_name(key)
+    tmp_dir.mkdir()
+    try:
+        shutil.copy2(binary, tmp_dir / binary.name)
+        tmp_dir.rename(artefact_dir)
+        logger(f"published {artefact_dir / binary.name}")
+    except OSError:
+        # another process published it first
+        shutil.rmtree(tmp_dir, ignore_errors=True)
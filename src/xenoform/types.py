@@ -1,6 +1,8 @@
 # dummy generic types for references and pointers
+import sys
 from collections.abc import Callable
 from copy import copy
+from dataclasses import dataclass
 from enum import StrEnum
 from types import EllipsisType, NoneType, UnionType
 from typing import Annotated, Any, Self, get_args, get_origin
@@ -22,6 +24,40 @@ class CppQualifier(StrEnum):
     # NB pybind11 doesnt seem to support shared/unique ptr as a function arg
 
 
+@dataclass(frozen=True)
+class ArrayView:
+    """
+    Annotation for numpy array arguments, passing a view of the array's data rather than a py::array_t: std::span<T>
+    (1-D, requires C++20) or xenoform::mdspan<T, ndim>. The dimensions and contiguity are checked once, in the binding,
+    and the data is not copied (unless a const view's argument needs converting). Views are const unless mutable is set
+    """
+
+    ndim: int = 1
+    mutable: bool = False
+
+    def __post_init__(self) -> None:
+        if self.ndim < 1:
+            raise CppTypeError(f"ArrayView ndim must be at least 1, not {self.ndim}")
+
+    def format(self, element_type: str) -> str:
+        """The C++ type of the view"""
+        element_type = element_type if self.mutable else f"const {element_type}"
+        if self.ndim == 1:
+            return f"std::span<{element_type}>"
+        return f"xenoform::mdspan<{element_type}, {self.ndim}>"
+
+
+@dataclass(frozen=True)
+class PandasView:
+    """
+    Annotation for pd.Series and pd.DataFrame arguments and return values, setting the dtype of the values (all columns
+    of a DataFrame must have this dtype). Arguments are views of the existing values, which are not copied: values of
+    any other dtype raise TypeError
+    """
+
+    dtype: type[np.generic] = np.float64
+
+
 DEFAULT_TYPE_MAPPING = {
     None: "void",  # py::none?
     int: "int",
@@ -59,9 +95,26 @@ header_requirements = {
     "std::variant": "<pybind11/stl.h>",
     "std::optional": "<pybind11/stl.h>",
     "std::function": "<pybind11/functional.h>",
+    "std::span": "<xenoform/span.h>",
+    "xenoform::mdspan": "<xenoform/span.h>",
+    "xenoform::series": "<xenoform/pandas.h>",
+    "xenoform::frame": "<xenoform/pandas.h>",
 }
 
 
+def array_arg_name(var_name: str) -> str:
+    """The C++ variable holding the qualified name of an array argument, which is declared with the function"""
+    return f"xenoform_{var_name}_name"
+
+
+def _pandas_type(type_: Any) -> str | None:
+    """The C++ type for pandas types. pandas is optional so is only checked if it has already been imported"""
+    pd = sys.modules.get("pandas")
+    if pd is None:
+        return None
+    return {pd.Series: "xenoform::series", pd.DataFrame: "xenoform::frame"}.get(type_)
+
+
 class PyTypeTree:
     """Tree structure for python types"""
 
@@ -90,15 +143,36 @@ class PyTypeTree:
 class CppTypeTree:
     """Mapped tree structure for C++ types"""
 
-    def __init__(self, tree: PyTypeTree, *, override: str | None = None, qualifier: CppQualifier | None = None) -> None:
-        self.type = DEFAULT_TYPE_MAPPING.get(tree.type)  # type: ignore[arg-type]
+    def __init__(
+        self,
+        tree: PyTypeTree,
+        *,
+        override: str | None = None,
+        qualifier: CppQualifier | None = None,
+        view: ArrayView | PandasView | None = None,
+    ) -> None:
+        self.type = DEFAULT_TYPE_MAPPING.get(tree.type) or _pandas_type(tree.type)  # type: ignore[arg-type]
         if not self.type and not override:
             raise CppTypeError(f"Don't know a C++ type for '{tree.type}' and no override provided")
         self.override = override
         self.qualfier = qualifier
+        self.view = view if isinstance(view, ArrayView) else None
+        # for pandas arguments, which are read-only views
+        self.const_values = False
+        # for array arguments: the qualified name of the argument, and whether conversion copies are forbidden
+        self.array_arg: tuple[str, bool] | None = None
+        if isinstance(view, PandasView) and not self.is_pandas():
+            raise CppTypeError(f"PandasView can only annotate pd.Series or pd.DataFrame, not '{tree}'")
+        if self.view:
+            if tree.type != np.ndarray:
+                raise CppTypeError(f"ArrayView can only annotate numpy arrays, not '{tree}'")
+            self.type = "std::span" if self.view.ndim == 1 else "xenoform::mdspan"
         # special treatment for numpy arrays
         if tree.type == np.ndarray:
             self.subtypes: tuple[CppTypeTree, ...] = (CppTypeTree(tree.subtypes[1].subtypes[0]),)
+        elif self.is_pandas():
+            dtype = view.dtype if isinstance(view, PandasView) else np.float64
+            self.subtypes = (CppTypeTree(PyTypeTree(dtype)),)
         else:
             self.subtypes = tuple(CppTypeTree(t) for t in tree.subtypes if t.type is not NoneType)
         # if we have a "T | None" -> std::variant with one fewer type param, make it a std::optional
@@ -114,15 +188,31 @@ class CppTypeTree:
     def __repr__(self) -> str:
         if self.override:
             return self.override
-        t = f"{self.type}"
-        if self.type == "std::function":
-            t = t + f"<{self.subtypes[0]}({', '.join(repr(t) for t in self.subtypes[1:])})>"
-        elif self.subtypes:
-            t = t + f"<{', '.join(repr(t) for t in self.subtypes)}>"
+        if self.view:
+            t = self.view.format(repr(self.subtypes[0]))
+        else:
+            t = f"{self.type}"
+            if self.type == "std::function":
+                t = t + f"<{self.subtypes[0]}({', '.join(repr(t) for t in self.subtypes[1:])})>"
+            elif self.const_values:
+                t = t + f"<const {self.subtypes[0]}>"
+            elif self.subtypes:
+                t = t + f"<{', '.join(repr(t) for t in self.subtypes)}>"
+        if self.array_arg:
+            name, no_copy = self.array_arg
+            t = f"xenoform::array_arg<{t}, {str(no_copy).lower()}, {array_arg_name(name.rpartition('.')[2])}>"
         if self.qualfier:
             t = self.qualfier.format(t)
         return t
 
+    def is_array(self) -> bool:
+        """Whether the type is a numpy array or array view (and not overridden)"""
+        return not self.override and (self.type == "py::array_t" or self.view is not None)
+
+    def is_pandas(self) -> bool:
+        """Whether the type is a pandas Series or DataFrame (and not overridden)"""
+        return not self.override and self.type in ("xenoform::series", "xenoform::frame")
+
     def headers(self, mapping: dict[str, str], _collected: list[str] | None = None) -> list[str]:
         """
         Returns headers needed based on the types in the structure
@@ -134,12 +224,16 @@ class CppTypeTree:
             return _collected
         if h := mapping.get(self.type or ""):
             _collected.append(h)
+        if self.array_arg:
+            _collected.append("<xenoform/arrays.h>")
         for st in self.subtypes:
             _collected = st.headers(mapping, _collected)
         return _collected
 
 
-def parse_annotation(origin: type) -> tuple[type, dict[str, CppQualifier] | dict[str, str]]:
+def parse_annotation(
+    origin: type,
+) -> tuple[type, dict[str, CppQualifier] | dict[str, str] | dict[str, ArrayView | PandasView]]:
     """
     Extract content from Annotation, if present
     """
@@ -154,6 +248,8 @@ def parse_annotation(origin: type) -> tuple[type, dict[str, CppQualifier] | dict
             return base, {"qualifier": extras[0]}
         if isinstance(extras[0], str):
             return base, {"override": extras[0]}
+        if isinstance(extras[0], ArrayView | PandasView):
+            return base, {"view": extras[0]}
         raise TypeError(f"Unexpected extra for {base}: {extras[0]}({type(extras[0])})")
     return origin, {}
 
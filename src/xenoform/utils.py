@@ -4,7 +4,8 @@ import re
 from collections.abc import Callable
 from typing import Any, Literal, cast
 
-from xenoform.types import header_requirements, translate_type
+from xenoform.errors import CppTypeError
+from xenoform.types import CppTypeTree, header_requirements, translate_type
 
 Platform = Literal["Linux", "Darwin", "Windows"]
 Platforms = list[Platform] | None
@@ -22,8 +23,27 @@ def _translate_value(value: Any) -> str:
     return translations.get(str(value), str(value))
 
 
-def translate_function_signature(func: Callable[..., Any]) -> tuple[str, list[str], list[str]]:
-    "map python signature to C++ equivalent"
+def _translate_annotation(
+    func: Callable[..., Any], var_name: str, type_: Any, no_copy: bool, count_copies: bool
+) -> CppTypeTree:
+    cpptype = translate_type(type_)
+    if var_name == "return":
+        if cpptype.view:
+            raise CppTypeError(f"{func.__name__}: array views can't be returned, since they don't own their data")
+    elif cpptype.is_pandas():
+        cpptype.const_values = True
+    elif cpptype.is_array() and (no_copy or count_copies):
+        cpptype.array_arg = (".".join((*get_function_scope(func), func.__name__, var_name)), no_copy)
+    return cpptype
+
+
+def translate_function_signature(
+    func: Callable[..., Any], *, no_copy: bool = False, count_copies: bool = False
+) -> tuple[str, list[str], list[str]]:
+    """
+    map python signature to C++ equivalent. If no_copy is set, array arguments are wrapped so that conversion copies are
+    rejected, or if count_copies is set, counted. pandas arguments are read-only views of their values
+    """
     arg_spec = inspect.getfullargspec(func)
 
     headers = []
@@ -39,7 +59,7 @@ def translate_function_signature(func: Callable[..., Any]) -> tuple[str, list[st
 
     ret: str | None = None
     for var_name, type_ in arg_spec.annotations.items():
-        cpptype = translate_type(type_)
+        cpptype = _translate_annotation(func, var_name, type_, no_copy, count_copies)
         headers.extend(cpptype.headers(header_requirements))
         if var_name == "return":
             ret = str(cpptype)
@@ -65,6 +85,34 @@ def translate_function_signature(func: Callable[..., Any]) -> tuple[str, list[st
     return f"[]({', '.join(arg_defs)})" + (f" -> {ret}" if ret else ""), arg_annotations, headers
 
 
+def gil_unsafe_args(func: Callable[..., Any]) -> list[str]:
+    """
+    Returns the names of the arguments (and "return") whose C++ types are, or contain, python objects held by value.
+    These would be copied and destroyed without holding the GIL if it was released for the duration of the call.
+    """
+    arg_spec = inspect.getfullargspec(func)
+    unsafe = []
+    for var_name, type_ in arg_spec.annotations.items():
+        if var_name == arg_spec.varkw:
+            # const py::kwargs&
+            continue
+        cpptype = "py::args" if var_name == arg_spec.varargs else str(translate_type(type_))
+        holds_objects = "py::" in cpptype or "xenoform::series<" in cpptype or "xenoform::frame<" in cpptype
+        if holds_objects and not cpptype.endswith(("&", "*")):
+            unsafe.append(var_name)
+    return unsafe
+
+
+def array_args(func: Callable[..., Any]) -> list[str]:
+    """Returns the names of the array (and array view) arguments, whose conversion copies can be rejected or counted"""
+    arg_spec = inspect.getfullargspec(func)
+    return [
+        var_name
+        for var_name, type_ in arg_spec.annotations.items()
+        if var_name not in ("return", arg_spec.varargs, arg_spec.varkw) and translate_type(type_).is_array()
+    ]
+
+
 def get_function_scope(func: Callable[..., Any]) -> tuple[str, ...]:
     """
     Returns the name of the class for class and instance methods